@@ -25,6 +25,14 @@ This will only extract all daily feed files:
 
     ```python -m pyedgar -x -s 1994```
 
+This will extract all daily feed files using 8 processes:
+
+    ```python -m pyedgar -x -s 1994 -j 8```
+
+This will download and extract the last 30 days of forms, adding them to the filing catalog:
+
+    ```python -m pyedgar -d -x --catalog```
+
 
 :copyright: © 2025 by Mac Gaulin
 :license: MIT, see LICENSE for more details.
@@ -80,6 +88,14 @@ argp.add_argument(
 
 argp.add_argument("-i", "--indices", action="store_true", dest="get_indices", help="Download and update indices.")
 
+argp.add_argument(
+    "--partitioned",
+    action="store_true",
+    dest="partitioned",
+    help="With -i, also write the index split by year and form family (INDEX_ROOT/partitions), for "
+    "EDGARIndex.query. Defaults to config file setting (INDEX_PARTITIONED).",
+)
+
 argp.add_argument(
     "-d",
     "--download-feeds",
@@ -101,7 +117,33 @@ argp.add_argument(
     "--overwrite",
     action="store_true",
     dest="overwrite",
-    help="Overwrite existing filings when extracting from feeds. Defaults to config file setting.",
+    help="Overwrite existing filings when extracting from feeds, including feed files the extraction manifest "
+    "shows were already extracted. Defaults to config file setting.",
+)
+
+argp.add_argument(
+    "-j",
+    "--jobs",
+    default=1,
+    dest="jobs",
+    type=int,
+    help="Number of processes to extract daily feed files with, one feed file per process. Default: 1.",
+)
+
+argp.add_argument(
+    "--stream",
+    action="store_true",
+    dest="stream_feeds",
+    help="With -d -x, extract filings straight from the feed downloads without saving the daily feed files. "
+    "Defaults to config file setting (STREAM_FEEDS).",
+)
+
+argp.add_argument(
+    "--catalog",
+    action="store_true",
+    dest="use_catalog",
+    help="Add extracted filings to the filing catalog (FILING_CATALOG_PATH in the config file), "
+    "queryable by CIK, form type, filing date and 8-K item.",
 )
 
 argp.add_argument("--config", action="store_true", dest="print_config", help="Print config file settings.")
@@ -141,6 +183,7 @@ if cl_args.get_indices:
     downloader.download_indices(
         start_date=cl_args.start_date,
         end_date=cl_args.end_date,
+        partitioned=True if cl_args.partitioned else None,
     )
 
 if cl_args.get_feeds or cl_args.extract_feeds:
@@ -153,4 +196,7 @@ if cl_args.get_feeds or cl_args.extract_feeds:
         download_feeds=cl_args.get_feeds,
         extract=cl_args.extract_feeds,
         overwrite=overwrite,
+        workers=cl_args.jobs,
+        stream_feeds=True if cl_args.stream_feeds else None,
+        use_catalog=cl_args.use_catalog,
     )
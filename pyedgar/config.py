@@ -23,6 +23,11 @@ CACHE_FEED_OVERWRITE=False
 ; FILING_ROOT is the root of the extracted filings
 FILING_ROOT=/data/bulk/data/edgar/filings/
 
+; FILING_STORE is how extracted filings are stored under FILING_ROOT. Either:
+;    files: one file per filing, at FILING_ROOT/FILING_PATH_FORMAT (default)
+;    pack: appended to one pack file per quarter, FILING_ROOT/YYYYQN.pack, indexed in FILING_ROOT/pack_index.sqlite
+FILING_STORE=files
+
 ; FEED_CACHE_ROOT is the root of the compressed daily feed files from EDGAR
 FEED_CACHE_ROOT=/data/bulk/data/edgar/raw_from_edgar/compressed_daily_feeds/
 
@@ -58,6 +63,10 @@ INDEX_CACHE_ROOT=/data/bulk/data/edgar/raw_from_edgar/indices/
 ;         Would result in --> FILING_ROOT/1234/567/890/12/123/456/1234567890-12-123456.txt
 ;         This is useful for only accession lookups (no CIKs) but also < 1000 entries per directory
 ;
+; Ending the format with .gz (gzip) or .zst (zstandard, requires the zstandard package) stores filings compressed,
+; and they are decompressed transparently when read. E.g.:
+; FILING_PATH_FORMAT={accession[11:13]}/{accession}.nc.gz
+;
 FILING_PATH_FORMAT={accession[11:13]}/{accession}.nc
 
 ; Filename format for caching FEED compressed files from EDGAR
@@ -68,6 +77,20 @@ FEED_CACHE_PATH_FORMAT={date:%Y%m%d}.nc.tar.gz
 ; Available data are: date (datetime object), year, and quarter (both ints)
 INDEX_CACHE_PATH_FORMAT=full_index_{year}_Q{quarter}.gz
 
+; Manifest of extracted feed files, so unchanged feed files are skipped when extracting again.
+; Default (when empty) is FEED_CACHE_ROOT/extraction_manifest.sqlite
+FEED_MANIFEST_PATH=
+
+; Catalog of extracted filings' headers, filled when extracting with the catalog on (e.g. --catalog).
+; Default (when empty) is FILING_ROOT/filing_catalog.sqlite
+FILING_CATALOG_PATH=
+
+; CACHE_WEB indicates whether filings downloaded from the EDGAR website (Filing's web fallback) are cached
+; under WEB_CACHE_ROOT, keeping at most WEB_CACHE_MAX_MB megabytes (least recently used are removed, 0 for no limit)
+CACHE_WEB = False
+WEB_CACHE_ROOT=/data/bulk/data/edgar/raw_from_edgar/web_cache/
+WEB_CACHE_MAX_MB=1024
+
 [Downloader]
 ; Downloader specific settings
 KEEP_ALL=True
@@ -76,12 +99,31 @@ KEEP_REGEX=
 ; User Agent for downloading, to keep the SEC happy
 USER_AGENT=University of Utah, Accounting Department, mac.gaulin@utah.edu
 
+; Root URL of the EDGAR Archives to download from: the SEC, or a mirror over http(s) or on disk (file://)
+EDGAR_ROOT=https://www.sec.gov/Archives
+
+; Gzip decompression of feed files: auto, isal, zlib-ng, pigz or gzip (see pyedgar.utilities.decompress)
+FEED_DECOMPRESSOR=auto
+
+; STREAM_FEEDS: when downloading and extracting feeds together (python -m pyedgar -d -x), extract each daily feed
+; straight from the EDGAR download, without saving the feed file (same as the --stream flag). Default is False.
+STREAM_FEEDS=False
+
+; Requests per second to EDGAR (the SEC allows 10), shared by all pyedgar processes using RATE_LIMIT_PATH.
+; Default RATE_LIMIT_PATH (when empty) is rate_limit.state in the temp directory.
+RATE_LIMIT=10
+RATE_LIMIT_PATH=
+
 [Index]
 ; Index file settings
 INDEX_DELIMITER=\t
 ; Index file extension
 ; If you want to compress the index files, change INDEX_EXTENSION to tab.gz
+; For fast loading with typed columns, use parquet or feather (needs pyarrow: pip install pyarrow)
 INDEX_EXTENSION=tab.gz
+; Also write the index split by year and form family (in INDEX_ROOT/partitions), for EDGARIndex.query
+; Off by default, as the partitions are a second copy of the index
+INDEX_PARTITIONED=False
 ```
 
 :copyright: © 2025 by Mac Gaulin
@@ -197,11 +239,23 @@ _defaults = {
     "FILING_PATH_FORMAT": "{accession[11:13]}/{accession}.nc",
     "FEED_CACHE_PATH_FORMAT": "sec_daily_{date:%Y-%m-%d}.tar.gz",
     "INDEX_CACHE_PATH_FORMAT": "full_index_{year}_Q{quarter}.gz",
+    "FEED_MANIFEST_PATH": "",
+    "FILING_CATALOG_PATH": "",
+    "FILING_STORE": "files",
+    "CACHE_WEB": "False",
+    "WEB_CACHE_ROOT": os.path.join(_tmp_dir, "web_cache"),
+    "WEB_CACHE_MAX_MB": "1024",
     "KEEP_ALL": "True",
     "KEEP_REGEX": "",
     "INDEX_DELIMITER": "\t",
     "INDEX_EXTENSION": "tab",
+    "INDEX_PARTITIONED": "False",
     "USER_AGENT": "University of Utah, Accounting Department, mac.gaulin@utah.edu",
+    "EDGAR_ROOT": "https://www.sec.gov/Archives",
+    "FEED_DECOMPRESSOR": "auto",
+    "STREAM_FEEDS": "False",
+    "RATE_LIMIT": "10",
+    "RATE_LIMIT_PATH": "",
 }
 
 CONFIG_FILE = get_config_file()
@@ -249,21 +303,46 @@ if '~' in INDEX_CACHE_ROOT:
     INDEX_CACHE_ROOT = os.path.expanduser(INDEX_CACHE_ROOT)
 
 # Path format
+FILING_STORE = CONFIG_OBJECT.get("Paths", "FILING_STORE").strip().lower()
 FILING_PATH_FORMAT = CONFIG_OBJECT.get("Paths", "FILING_PATH_FORMAT")
 FEED_CACHE_PATH_FORMAT = CONFIG_OBJECT.get("Paths", "FEED_CACHE_PATH_FORMAT")
 INDEX_CACHE_PATH_FORMAT = CONFIG_OBJECT.get("Paths", "INDEX_CACHE_PATH_FORMAT")
 
+# Manifest of extracted feed files, defaults to living with the feed files
+FEED_MANIFEST_PATH = os.path.expanduser(
+    CONFIG_OBJECT.get("Paths", "FEED_MANIFEST_PATH") or os.path.join(FEED_CACHE_ROOT, "extraction_manifest.sqlite")
+)
+# Catalog of extracted filings, defaults to living with the filings
+FILING_CATALOG_PATH = os.path.expanduser(
+    CONFIG_OBJECT.get("Paths", "FILING_CATALOG_PATH") or os.path.join(FILING_ROOT, "filing_catalog.sqlite")
+)
+
+# Cache of filings downloaded from the web
+CACHE_WEB = CONFIG_OBJECT.getboolean("Paths", "CACHE_WEB")
+WEB_CACHE_ROOT = os.path.expanduser(CONFIG_OBJECT.get("Paths", "WEB_CACHE_ROOT"))
+WEB_CACHE_MAX_MB = CONFIG_OBJECT.getfloat("Paths", "WEB_CACHE_MAX_MB")
+
 # Filings cache settings
 CACHE_FEED = CONFIG_OBJECT.getboolean("Paths", "CACHE_FEED")
 CACHE_FEED_OVERWRITE = CONFIG_OBJECT.getboolean("Paths", "CACHE_FEED_OVERWRITE")
 KEEP_ALL = CONFIG_OBJECT.getboolean("Downloader", "KEEP_ALL")
 KEEP_REGEX = CONFIG_OBJECT.get("Downloader", "KEEP_REGEX")
 USER_AGENT = CONFIG_OBJECT.get("Downloader", "USER_AGENT")
+EDGAR_ROOT = CONFIG_OBJECT.get("Downloader", "EDGAR_ROOT").strip()
+FEED_DECOMPRESSOR = CONFIG_OBJECT.get("Downloader", "FEED_DECOMPRESSOR").strip().lower()
+# Extract feeds straight from the downloads, without saving the feed files
+STREAM_FEEDS = CONFIG_OBJECT.getboolean("Downloader", "STREAM_FEEDS")
+# Requests per second to EDGAR, shared by all processes through the rate limit state file
+RATE_LIMIT = CONFIG_OBJECT.getfloat("Downloader", "RATE_LIMIT")
+RATE_LIMIT_PATH = os.path.expanduser(
+    CONFIG_OBJECT.get("Downloader", "RATE_LIMIT_PATH") or os.path.join(_tmp_dir, "rate_limit.state")
+)
 
 # Index cache settings
 CACHE_INDEX = CONFIG_OBJECT.getboolean("Paths", "CACHE_INDEX")
 INDEX_DELIMITER = CONFIG_OBJECT.get("Index", "INDEX_DELIMITER")
 INDEX_EXTENSION = CONFIG_OBJECT.get("Index", "INDEX_EXTENSION").lstrip('.')
+INDEX_PARTITIONED = CONFIG_OBJECT.getboolean("Index", "INDEX_PARTITIONED")
 
 if INDEX_DELIMITER.lower() in ("\t", "\\t", "tab", "\\\t", "\\\\t"):
     INDEX_DELIMITER = "\t"
@@ -13,6 +13,7 @@ import re
 import os
 import logging
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 3rd party imports
 try:
@@ -29,8 +30,9 @@ from pyedgar import utilities
 from pyedgar.utilities import edgarcache
 from pyedgar.utilities import edgarweb
 from pyedgar.utilities import indices
-
-# from pyedgar.utilities import localstore
+from pyedgar.utilities import filestore
+from pyedgar.utilities import localstore
+from pyedgar.utilities import packstore
 
 # Local logger
 _logger = logging.getLogger(__name__)
@@ -43,7 +45,10 @@ def download_extract_feeds(
     download_feeds=True,
     extract=True,
     overwrite=False,
-    use_curl_to_download=None,
+    use_curl_to_download=False,
+    workers=1,
+    stream_feeds=None,
+    use_catalog=False,
 ):
     """
     Download feeds. Feeds will be downloaded for `start_date` through `end_date` (or yesterday),
@@ -56,16 +61,18 @@ def download_extract_feeds(
         download_feeds (bool): Flag to download daily feed files from `start_date` to `end_date` or for `last_n_days`. Default: True
         extract (bool): Flag to extract filings. Default: True
         overwrite (bool): Flag to overwrite existing files. Default: False
-        use_curl_to_download (bool, None): Flag to use cURL subprocess instead of `requests` library. If None,
-            will check for and use cURL if it exists. Default: None
+        use_curl_to_download (bool): Flag to use a cURL subprocess per file instead of the pooled `requests`
+            session (see `edgarweb.get_session`). Default: False
+        workers (int): Number of processes to extract feed files with. Default: 1
+        stream_feeds (bool, None): Flag to extract filings straight from the downloads, without saving
+            the daily feed files, when both downloading and extracting. If None, uses `config.STREAM_FEEDS`
+            (False unless set). Default: None
+        use_catalog (bool): Flag to add extracted filings to the filing catalog (`config.FILING_CATALOG_PATH`). Default: False
     """
     if not download_feeds and not extract:
         _logger.warning("No action to perform. Set download_feeds or extract to True.")
         return
 
-    if use_curl_to_download is None:
-        use_curl_to_download = edgarweb.has_curl()
-
     if start_date is None:
         start_date = dt.date.fromordinal(dt.date.today().toordinal() - last_n_days)
     else:
@@ -86,11 +93,23 @@ def download_extract_feeds(
         keep_form_type_regex=re.compile(config.KEEP_REGEX, re.I) if not config.KEEP_ALL else None,
         check_cik="cik" in config.FILING_PATH_FORMAT,
         use_requests=not use_curl_to_download,
+        binary=True,
+        use_catalog=use_catalog,
     )
     _logger.info(f"{_doingstr} {start_date:%Y-%m-%d} --  {end_date:%Y-%m-%d}.")
 
+    if stream_feeds is None:
+        stream_feeds = config.STREAM_FEEDS
+
     if extract:
-        cacher.extract_daily_feeds(start_date, to_date=end_date, download_first=download_feeds, overwrite=overwrite)
+        cacher.extract_daily_feeds(
+            start_date,
+            to_date=end_date,
+            download_first=download_feeds,
+            overwrite=overwrite,
+            workers=workers,
+            stream=download_feeds and stream_feeds,
+        )
     else:
         # Then we're just downloading, no extract, so can't use the cacher's method
         for i_date in cacher.iterate_over_days(start_date, end_date, message="Downloading"):
@@ -99,7 +118,7 @@ def download_extract_feeds(
     _logger.info(f"Done {_doingstr.lower()} feeds")
 
 
-def download_indices(start_date=1995, end_date=None, overwrite=False, use_curl_to_download=None):
+def download_indices(start_date=1995, end_date=None, overwrite=False, use_curl_to_download=False, partitioned=None):
     """
     Download feeds and indices. Feeds will be downloaded for `start_date` through yesterday,
     or for the past `last_n_days` days.
@@ -108,12 +127,11 @@ def download_indices(start_date=1995, end_date=None, overwrite=False, use_curl_t
         start_date (date): Date to start extraction of feeds from. Default: 1995
         end_date (date): Date to end extraction of feeds. Default: today() - 1
         overwrite (bool): Flag to overwrite existing files. Default: False
-        use_curl_to_download (bool, None): Flag to use cURL subprocess instead of `requests` library. If None,
-            will check for and use cURL if it exists. Default: None
+        use_curl_to_download (bool): Flag to use a cURL subprocess per file instead of the pooled `requests`
+            session (see `edgarweb.get_session`). Default: False
+        partitioned (bool, None): Flag to also write the index partitions (see `IndexMaker.extract_indexes`).
+            If None, uses `config.INDEX_PARTITIONED` (False unless set). Default: None
     """
-    if use_curl_to_download is None:
-        use_curl_to_download = edgarweb.has_curl()
-
     start_date = utilities.parse_date_input(start_date or 1995)
 
     if end_date is None:
@@ -122,21 +140,115 @@ def download_indices(start_date=1995, end_date=None, overwrite=False, use_curl_t
         end_date = utilities.parse_date_input(end_date)
 
     _logger.info(f"Downloading and extracting indices from {start_date:%Y-%m-%d} -- {end_date:%Y-%m-%d}.")
-    # the last index file we find is probably not 'complete' because it was downloaded during the month maybe.
-    # Let's make sure that isn't the case
-    last_index = None
-    for i_date in utilities.iterate_dates(start_date, end_date, period="quarterly"):
-        _idx = config.get_index_cache_path(i_date)
-        if os.path.exists(_idx):
-            last_index = _idx
-    if last_index is not None:
-        _logger.info("Removing last of the old index caches: %s", last_index)
-        os.remove(last_index)
-
+    # Index files downloaded before their quarter ended may not be complete. Instead of deleting and re-downloading
+    # them, revalidate checks them with conditional GETs, and the indices are only re-extracted if one changed.
     index_maker = indices.IndexMaker(use_tqdm=True, use_requests=not use_curl_to_download)
-    index_maker.extract_indexes(start_date=start_date, end_date=end_date, download_first=True, overwrite=overwrite)
+    index_maker.extract_indexes(
+        start_date=start_date,
+        end_date=end_date,
+        download_first=True,
+        overwrite=overwrite,
+        revalidate=True,
+        partitioned=partitioned,
+    )
     _logger.info("Done downloading and extracting indices")
 
+
+def _get_index_column(index_df, *names):
+    """Return the first of columns `names` in `index_df` (simplified or raw `EDGARIndex` names), or None."""
+    for name in names:
+        if name in index_df:
+            return index_df[name]
+    return None
+
+
+def fill_missing_filings(index_df, workers=None, overwrite=False, use_tqdm=True):
+    """
+    Download the filings in `index_df` that are missing from the local filing store, from the EDGAR website.
+
+    Filings are downloaded concurrently, paced by the shared rate limiter (see `edgarweb.get_from_edgar`),
+    and written to `localstore.get_filing_path` (compressed based on its suffix, see `filestore`),
+    or into the pack files if ``FILING_STORE=pack``. Note these are the website's full submission text files.
+
+    Examples:
+        Fill in the 10-Ks of 2019 missing from the local store::
+
+            from pyedgar.index import EDGARIndex
+            df = EDGARIndex()['10-K']
+            summary = fill_missing_filings(df[df.filedate.dt.year == 2019], workers=8)
+            print(summary['failed'], 'failed:', summary['errors'])
+
+    Args:
+        index_df (DataFrame): Index of filings, e.g. from `EDGARIndex`, with cik and accession columns
+            (either simplified or raw column names), and optionally a filing date column.
+        workers (int, None): Maximum number of concurrent downloads. Default: `edgarweb.DOWNLOAD_WORKERS`
+        overwrite (bool): Flag to download filings even if they are already in the local store. Default: False
+        use_tqdm (bool): Flag for whether to show download progress with tqdm. Default: True
+
+    Returns:
+        dict: Summary with the number of unique filings in the index ('total'), already in the store ('present'),
+            'downloaded' and 'failed', and the 'errors' of failed filings as {accession: error}.
+    """
+    ciks = _get_index_column(index_df, "cik", "CIK")
+    accessions = _get_index_column(index_df, "accession", "Accession")
+    if ciks is None or accessions is None:
+        raise ValueError("Index requires CIK and Accession columns, got: {}".format(list(index_df.columns)))
+
+    filedates = _get_index_column(index_df, "filedate", "Date Filed")
+    if filedates is None:
+        filedates = [None] * len(index_df)
+
+    summary = {"total": len(set(accessions)), "present": 0, "downloaded": 0, "failed": 0, "errors": {}}
+    pack_store = packstore.PackStore() if config.FILING_STORE == "pack" else None
+
+    jobs, seen = [], set()
+    for cik, accession, filedate in zip(ciks, accessions, filedates):
+        if accession in seen:
+            continue
+        seen.add(accession)
+
+        path = localstore.get_filing_path(cik=cik, accession=accession)
+        if not overwrite and filestore.filing_exists(path):
+            summary["present"] += 1
+            continue
+        jobs.append((cik, accession, filedate, path))
+
+    _logger.info("%d of %d filings missing from the local store", len(jobs), summary["total"])
+
+    def _fill(job):
+        cik, accession, filedate, path = job
+        url, _ = edgarweb.get_edgar_urls(cik, accession=accession)
+
+        with edgarweb.get_from_edgar(url) as response:
+            if response.status_code != 200:
+                raise Exception("Error {} downloading {}".format(response.status_code, url))
+            data = response.content
+
+        if pack_store is not None:
+            return pack_store.add(accession, data, filing_date=filedate, overwrite=overwrite)
+        return filestore.write_filing(path, data)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers or edgarweb.DOWNLOAD_WORKERS)) as pool:
+        futures = {pool.submit(_fill, job): job[1] for job in jobs}
+        done = as_completed(futures)
+        if use_tqdm:
+            done = tqdm(done, total=len(futures), desc="Downloading missing filings")
+        for future in done:
+            try:
+                future.result()
+                summary["downloaded"] += 1
+            except Exception as excp:
+                _logger.warning("Error filling %s: %r", futures[future], excp)
+                summary["failed"] += 1
+                summary["errors"][futures[future]] = excp
+
+    _logger.info(
+        "Filled %d of %d missing filings (%d failed, %d already present)",
+        summary["downloaded"], len(jobs), summary["failed"], summary["present"],
+    )
+    return summary
+
+
 def print_cache_status():
     """Prints out the last found cache files for feeds and indices."""
     for i_date in reversed(list(utilities.iterate_dates(1995))):
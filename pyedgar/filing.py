@@ -3,56 +3,15 @@
 Base class for EDGAR filing.
 
 Meant to be easily overridden. For example, to create a filing class that allows for easy extraction of
-BeautifulSoup documents and local caching (e.g. if reading from edgar website):
+BeautifulSoup documents:
 
 ```python
-import os
 from bs4 import BeautifulSoup
 from IPython.display import display_html
 import pyedgar
 from pyedgar.utilities import htmlparse
 
 class Filing(pyedgar.Filing):
-    # caches filings in a directory next to this file called data/cache
-    DATA_ROOT = "data"
-
-    @property
-    def cache_path(self):
-        return os.path.join(self.DATA_ROOT, 'cache', self.accession.split('-')[1], f"{self.accession}.txt")
-
-    def _cache_local(self, doc_to_cache):
-        try:
-            with open(self.cache_path, 'w') as fh:
-                fh.write(doc_to_cache)
-        except FileNotFoundError:
-            # ## directory doesn't exists, make it and recall. If the parent doesn't exist either
-            #  (the cache folder) then it'll error out below, so no infinite recursion.
-            os.mkdir(os.path.dirname(self.cache_path))
-            return self._cache_local(doc_to_cache)
-        except Exception:
-            # I guess caching didn't work...
-            return doc_to_cache
-
-    def _post_init_hook(self, **kwargs):
-        self._local_cache = True
-        if os.path.exists(self.cache_path):
-            self._filing_local_path = self.cache_path
-
-        for k,v in kwargs.items():
-            if k not in self.__dict__:
-                setattr(self, k, v)
-
-    def _set_full_text(self):
-        _txt = super()._set_full_text()
-
-        try:
-            if not os.path.exists(self.cache_path):
-                self._cache_local(_txt)
-        except Exception:
-            pass
-
-        return _txt
-
     def is_html(self, docnum=0, *args, **kwargs):
         return htmlparse.is_html(self.documents[docnum]['full_text'], *args, **kwargs)
 
@@ -67,6 +26,14 @@ class Filing(pyedgar.Filing):
             print(self.documents[docnum]['full_text'])
 ```
 
+Filings downloaded from the EDGAR website (when they aren't in the local cache) can be cached locally
+with ``web_cache=True`` (or ``CACHE_WEB=True`` in the config file), which writes them to `WEB_CACHE_ROOT`
+and reads them from there next time (see `pyedgar.utilities.webcache`):
+
+```python
+f = Filing(1750, '0001104659-06-026838', web_cache=True)
+```
+
 :copyright: © 2025 by Mac Gaulin
 :license: MIT, see LICENSE for more details.
 """
@@ -81,7 +48,7 @@ except ImportError:
     pass
 
 from pyedgar import config
-from pyedgar.utilities import get_cik_acc, edgarweb, forms, localstore, htmlparse
+from pyedgar.utilities import get_cik_acc, edgarweb, filestore, forms, localstore, htmlparse, webcache
 from pyedgar.utilities.forms import FORMS
 
 
@@ -99,6 +66,10 @@ class Filing(object):
     _local_cache = False
     #: If filing is not found, fallback to downloading from the web.
     _web_fallback = True
+    #: Write-through cache of filings downloaded from the web, or None to not cache them.
+    _web_cache = None
+    #: Whether headers of filings not found locally are read from just the header on the web, not the full text.
+    _header_only = False
     #: The 'loose' form type, with some family hierarchy: 10s, Def 14s, etc.
     _type = None
     #: The exact form type, extracted from the main <TYPE> tag.
@@ -126,6 +97,8 @@ class Filing(object):
         accession=None,
         use_cache=None,
         web_fallback=True,
+        web_cache=None,
+        header_only=False,
         flat_headers=True,
         omit_duplicate_headers=False,
         duplicate_headers_as_list=True,
@@ -144,6 +117,13 @@ class Filing(object):
                 default to `config.CACHE_FEED`.
             web_fallback (bool): When FileNotFoundError is raised, try
                 `edgarweb.download_form_from_web` instead.
+            web_cache (bool, WebCache, None): Cache filings downloaded from the web on disk, and read them
+                from there next time (see `webcache`). Pass a `WebCache` to use it instead of the
+                one at `config.WEB_CACHE_ROOT`. Default: `config.CACHE_WEB`.
+            header_only (bool): If the filing isn't found locally (and the full text isn't loaded), load
+                `headers` (and `type`) by downloading only the header from the web, with Range requests
+                (see `edgarweb.download_header_from_web`). Accessing the full text still downloads it all.
+                Default: False.
             flat_headers (bool): Set the style of loading headers. If True,
                 all headers will be loaded in one dictionary. If False, headers
                 will be loaded as a hierarchical set of dictionaries, matching
@@ -178,6 +158,13 @@ class Filing(object):
         self._local_cache = use_cache if use_cache is not None else config.CACHE_FEED
         self._web_fallback = web_fallback
 
+        if web_cache is None:
+            web_cache = config.CACHE_WEB
+        if web_cache is True:
+            web_cache = webcache.get_web_cache()
+        self._web_cache = web_cache or None
+        self._header_only = header_only
+
         self.read_args = read_kwargs or {}
         self.header_args = {
             "flat": flat_headers,
@@ -271,7 +258,7 @@ class Filing(object):
         Full text of the filing at cik/accession.
         Lazily load the full text of the filing into memory.
         Use cache if `self._local_cache`, and fall back to EDGAR website
-        if `self._web_fallback`.
+        if `self._web_fallback` (through the web cache if `self._web_cache`).
 
         Returns:
             String representing the full text of the EDGAR filing.
@@ -295,13 +282,38 @@ class Filing(object):
 
             if self._web_fallback:
                 self.__log.debug("Downloading from EDGAR web: %d/%s", self.cik, self.accession)
-                self._full_text = edgarweb.download_form_from_web(self.cik, self.accession)
+                self._full_text = edgarweb.download_form_from_web(self.cik, self.accession, cache=self._web_cache)
 
         return self._full_text
 
+    def _get_header_text(self):
+        """
+        Text of the filing to read the headers from. This is the full text, unless `self._header_only`
+        and the filing isn't loaded or found locally, in which case only the header is read from the web cache
+        (if on and the filing is there) or downloaded from the web.
+
+        Returns:
+            str: Text starting with the filing's header.
+
+        Raises:
+            FileNotFoundError: The file wasn't found in the local cache and `self._web_fallback` is False.
+        """
+        if not self._header_only or self._full_text:
+            return self.full_text
+
+        if self._local_cache and filestore.filing_exists(self.path):
+            return self.full_text
+
+        if not self._web_fallback:
+            raise FileNotFoundError(f"Filing not found for CIK:{self.cik} / Accession:{self.accession}")
+
+        self.__log.debug("Downloading header from EDGAR web: %d/%s", self.cik, self.accession)
+        return edgarweb.download_header_from_web(self.cik, self.accession, cache=self._web_cache)
+
     def _set_headers(self, **load_kwargs):
         """
         Load the full set of headers of the filing at cik/accession into memory.
+        With `self._header_only`, filings not found locally only have their header downloaded.
 
         Args:
             Optional load arguments passed to `forms.get_all_headers()`
@@ -310,11 +322,12 @@ class Filing(object):
             dict: Dictionary of headers, with either flat, hierarchical, both,
                 or neither, depending on `self._flat_headers`.
         """
-        if not self.full_text:
+        header_text = self._get_header_text()
+        if not header_text:
             self.__log.debug("Full filing text missing or not found!")
             return None
 
-        self._headers = forms.get_all_headers(self.full_text, **{**self.header_args, **load_kwargs})
+        self._headers = forms.get_all_headers(header_text, **{**self.header_args, **load_kwargs})
 
         return self._headers
 
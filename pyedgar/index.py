@@ -11,6 +11,8 @@ Use indices from EDGAR index files.
 import os
 import re
 import logging
+import threading
+from collections import OrderedDict
 # import datetime as dt
 
 # 3rd party imports
@@ -19,42 +21,106 @@ import pandas as pd
 
 # Module Imports
 from pyedgar import config
+from pyedgar import utilities
+from pyedgar.utilities import indices as _indices
 from pyedgar.utilities.indices import IndexMaker as _IndexMaker
 
 
+#: Default memory bound of the loaded indices kept by each `EDGARIndex`, in megabytes
+CACHE_MAX_MB = 1024
+
+
+def _copy_on_write():
+    """Check whether pandas copy-on-write is on: always from pandas 3, with ``mode.copy_on_write`` in pandas 2."""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
 class EDGARIndex():
     """
     Class that opens EDGAR indices.
     Indices are always a pandas dataframe.
+
+    Loaded indices are kept in memory (least recently used first out, up to `cache_max_mb`),
+    so repeat lookups like ``idx['10-K']`` only read the file again when it changed on disk.
+    Each lookup returns a copy, so changing it (even in place) doesn't change the cached index. With pandas
+    copy-on-write (the default from pandas 3, or ``pd.options.mode.copy_on_write = True`` in pandas 2)
+    that copy is shallow and nearly free, otherwise the whole index is copied.
     """
 
     # Class variables
     simplify_col_names = None
+    cache_max_mb = None
 
     # Private class variables
     _logger = logging.getLogger(__name__)
     _simple_col_names = ('cik', 'name', 'form', 'filedate', 'accession')
     _raw_col_names = ('CIK', 'Company Name', 'Form Type', 'Date Filed', 'Accession')
 
-    def __init__(self, simplify_col_names=True, force_download=False, use_tqdm=True):
+    def __init__(self, simplify_col_names=True, force_download=False, use_tqdm=True, cache_max_mb=CACHE_MAX_MB):
         """
         Initialize the index making object.
 
         use_tqdm: flag for whether or not to wrap downloads in tqdm for progress monitoring
+        cache_max_mb: memory (in MB) of loaded indices to keep for later lookups, 0 to not keep any
         """
         self.simplify_col_names = simplify_col_names
+        self.cache_max_mb = cache_max_mb
         self.IndexMaker = _IndexMaker(use_tqdm=use_tqdm)
 
+        # Listing of INDEX_ROOT, as (root, extension, directory mtime, {filename: fullpath})
+        self._listing = None
+        # Loaded indices, least recently used first, as {(path, columns, sep): (file version, df, bytes)}
+        self._frames = OrderedDict()
+        self._frames_bytes = 0
+        self._lock = threading.RLock()
+
         if force_download:
             self.IndexMaker.extract_indexes()
+            self.invalidate()
+
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
 
     @property
     def indices(self):
         """
         Search for all indices, return dict of all found.
+
+        The listing is kept until `INDEX_ROOT` changes (files are added, removed or replaced).
         """
-        return self.search_for_indices()
+        idx_root = config.INDEX_ROOT
+        mtime = os.stat(idx_root).st_mtime_ns
+
+        with self._lock:
+            if self._listing is None or self._listing[:3] != (idx_root, config.INDEX_EXTENSION, mtime):
+                self._listing = (idx_root, config.INDEX_EXTENSION, mtime, self.search_for_indices())
+            return dict(self._listing[3])
+
+    def invalidate(self, index_path=None):
+        """
+        Forget the listing of index files and the loaded indices, so they are read from disk again.
+
+        Args:
+            index_path (str, None): Only forget the loaded index at this path. Default: forget everything.
+        """
+        with self._lock:
+            if index_path is None:
+                self._listing = None
+                self._frames.clear()
+                self._frames_bytes = 0
+                return
+
+            for key in [k for k in self._frames if k[0] == index_path]:
+                self._frames_bytes -= self._frames.pop(key)[2]
 
     def search_for_indices(self, fname_regex=None):
         """
@@ -72,7 +138,7 @@ class EDGARIndex():
         indices = dict()
 
         if fname_regex is None:
-            fname_regex = re.compile(r'\.{}$'.format(config.INDEX_EXTENSION), re.I)
+            fname_regex = re.compile(r'\.{}$'.format(re.escape(config.INDEX_EXTENSION)), re.I)
 
         for _file in os.listdir(idx_root):
             matches = fname_regex.search(_file)
@@ -83,50 +149,210 @@ class EDGARIndex():
 
         return indices
 
-    def get_index(self, index_name_or_path):
-        # Assume they passed in the filing name, which is a key in self.indices
-        try:
-            return self.load_index(self.indices[index_name_or_path])
-        except KeyError:
-            pass
-
-        # Next try to see if they omitted the extension
-        try:
-            try_lookup = '{}.{}'.format(index_name_or_path, config.INDEX_EXTENSION)
-            return self.load_index(self.indices[try_lookup])
-        except KeyError:
-            pass
+    def get_index(self, index_name_or_path, columns=None):
+        """
+        Load an index by file name (e.g. 'form_10-K.tab'), form name ('10-K') or path.
+        `columns` selects the columns to load (see `load_index`).
+        """
+        indices = self.indices
 
-        # Last try to see if they omitted 'form' and the extension
-        try:
-            try_lookup = 'form_{}.{}'.format(index_name_or_path, config.INDEX_EXTENSION)
-            return self.load_index(self.indices[try_lookup])
-        except KeyError:
-            pass
+        # Assume they passed in the filing name, which is a key in self.indices,
+        # next try to see if they omitted the extension, last if they omitted 'form' and the extension
+        for try_lookup in (index_name_or_path,
+                           '{}.{}'.format(index_name_or_path, config.INDEX_EXTENSION),
+                           'form_{}.{}'.format(index_name_or_path, config.INDEX_EXTENSION)):
+            if try_lookup in indices:
+                return self.load_index(indices[try_lookup], columns=columns)
 
         # Then maybe they asked for a path
-        return self.load_index(index_name_or_path)
+        return self.load_index(index_name_or_path, columns=columns)
+
+    def load_index(self, index_path, override_sep=None, columns=None):
+        """
+        Load the index file at `index_path`. Parquet and Feather index files (see `INDEX_EXTENSION`)
+        are read natively, otherwise as delimited text.
+
+        Args:
+            index_path (str): Path to the index file.
+            override_sep (str, None): Delimiter of delimited text index files. Default: `config.INDEX_DELIMITER`.
+            columns (list, None): Columns to load, by simple or raw name (e.g. ['cik', 'accession']).
+                Only those are read from columnar index files. Default: all columns.
+
+        Returns:
+            DataFrame: The index, with compact column types (see `pyedgar.utilities.indices.INDEX_DTYPES`).
+                It is a copy of the cached index, so it can be changed in place: a shallow one with
+                pandas copy-on-write, else a deep one.
+        """
+        if columns is not None:
+            to_raw = dict(zip(self._simple_col_names, self._raw_col_names))
+            columns = tuple(to_raw.get(c, c) for c in columns)
+
+        # Raises FileNotFoundError (for __getitem__) if there is no index at index_path
+        stat = os.stat(index_path)
+        version = (stat.st_size, stat.st_mtime_ns)
+        key = (index_path, columns, override_sep)
+
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached is not None and cached[0] == version:
+                self._frames.move_to_end(key)
+                return self._rename(cached[1].copy(deep=not _copy_on_write()))
+
+        df = _indices.read_index(index_path, columns=columns, sep=override_sep)
+        self._remember(key, version, df)
+
+        return self._rename(df.copy(deep=not _copy_on_write()))
+
+    def _partition_paths(self, forms=None, start=None, end=None):
+        """
+        Paths of the index partitions that can hold filings of `forms` filed from `start` to `end`,
+        or None if there are no current index partitions (see `pyedgar.utilities.indices.partitions_current`)
+        or none of them match.
+        """
+        if not _indices.partitions_current():
+            return None
+        root = _indices.get_partition_root()
+
+        families = (_indices.FORM_FAMILIES if forms is None
+                    else sorted({_indices.form_family(f) for f in forms}))
+        paths = []
+        for year in sorted(int(y) for y in os.listdir(root) if y.isdigit()):
+            if (start is not None and year < start.year) or (end is not None and year > end.year):
+                continue
+            for family in families:
+                path = _indices.get_partition_path(year, family)
+                if os.path.exists(path):
+                    paths.append(path)
+
+        return paths or None
+
+    def query(self, cik=None, form=None, start=None, end=None, columns=None):
+        """
+        Query the index for filings matching all the given criteria, reading only the index partitions
+        (years and form families, written with ``INDEX_PARTITIONED=True``, see `IndexMaker.extract_indexes`)
+        that can match, and in Parquet partitions only the row groups that can match.
+        Without current partitions (written from the same quarters as `form_all`), `form_all` is read and
+        filtered instead::
+
+            idx = EDGARIndex()
+            df = idx.query(cik=[1750, 320193], form=['8-K', '8-K/A'], start='2015-01-01', end='2018-12-31')
+
+        Args:
+            cik (int, list, None): CIK(s) of the filer.
+            form (str, list, None): Form type(s), matched exactly (e.g. '8-K' or ['10-K', '10-K405']).
+            start (str, date, None): First filing date to include (inclusive).
+            end (str, date, None): Last filing date to include (inclusive).
+            columns (list, None): Columns to return, by simple or raw name. Default: all columns.
+
+        Returns:
+            DataFrame: Matching filings, sorted by CIK and filing date.
+        """
+        ciks = None if cik is None else ([int(cik)] if isinstance(cik, (int, str)) else [int(c) for c in cik])
+        forms = None if form is None else ([form] if isinstance(form, str) else list(form))
+        start = None if start is None else pd.Timestamp(utilities.parse_date_input(start))
+        end = None if end is None else pd.Timestamp(utilities.parse_date_input(end))
+
+        to_raw = dict(zip(self._simple_col_names, self._raw_col_names))
+        out_columns = list(self._raw_col_names) if columns is None else [to_raw.get(c, c) for c in columns]
+
+        filters = []
+        if ciks is not None:
+            filters.append(('CIK', 'in', ciks))
+        if forms is not None:
+            filters.append(('Form Type', 'in', forms))
+        if start is not None:
+            filters.append(('Date Filed', '>=', start))
+        if end is not None:
+            filters.append(('Date Filed', '<=', end))
+        read_columns = out_columns + [f[0] for f in filters if f[0] not in out_columns]
+
+        paths = self._partition_paths(forms, start, end)
+        if paths is None:
+            self._logger.info("No current index partitions in %r, querying the full index.", config.INDEX_ROOT)
+            try:
+                paths = [self.indices['form_all.{}'.format(config.INDEX_EXTENSION)]]
+            except KeyError:
+                raise FileNotFoundError("No index partitions or form_all index in {}".format(config.INDEX_ROOT))
+
+        frames = []
+        for path in paths:
+            df = _indices.read_index(path, columns=read_columns, filters=filters)
+
+            keep = pd.Series(True, index=df.index)
+            if ciks is not None:
+                keep &= df['CIK'].isin(ciks)
+            if forms is not None:
+                keep &= df['Form Type'].isin(forms)
+            if start is not None:
+                keep &= df['Date Filed'] >= start
+            if end is not None:
+                keep &= df['Date Filed'] <= end
 
-    def load_index(self, index_path, override_sep=None):
-        sep = config.INDEX_DELIMITER if override_sep is None else override_sep
+            frames.append(df.loc[keep, out_columns])
 
-        df = pd.read_csv(index_path, sep=sep)
+        if frames:
+            df = pd.concat(frames, ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=out_columns)
+        df = _indices.set_index_dtypes(df)
 
+        sort_by = [c for c in ('CIK', 'Date Filed') if c in df.columns]
+        if sort_by:
+            df = df.sort_values(sort_by, ignore_index=True)
+
+        return self._rename(df)
+
+    def _rename(self, df):
         if self.simplify_col_names:
             df.rename(columns={k: v for k, v in
                                zip(self._raw_col_names, self._simple_col_names)},
-                      index=str, inplace=True)
-        if 'filedate' in df:
-            df['filedate'] = pd.to_datetime(df['filedate'])
-
+                      inplace=True)
         return df
 
+    def _remember(self, key, version, df):
+        """Keep a loaded index, evicting the least recently used ones to stay under `cache_max_mb`."""
+        max_bytes = (self.cache_max_mb or 0) * 1024 ** 2
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+
+        with self._lock:
+            old = self._frames.pop(key, None)
+            if old is not None:
+                self._frames_bytes -= old[2]
+            if nbytes > max_bytes:
+                return
+
+            self._frames[key] = (version, df, nbytes)
+            self._frames_bytes += nbytes
+
+            while self._frames_bytes > max_bytes:
+                _, (_, _, evicted) = self._frames.popitem(last=False)
+                self._frames_bytes -= evicted
+
+    def memory_report(self, index):
+        """
+        Report the memory used by each column of an index::
+
+            idx = EDGARIndex()
+            idx.memory_report('all')
+
+        Args:
+            index (str, DataFrame): Index name or path (as for `get_index`), or a loaded index.
+
+        Returns:
+            DataFrame: Type, MB and bytes per row of each column, and their total.
+        """
+        if not isinstance(index, pd.DataFrame):
+            index = self.get_index(index)
+        return _indices.memory_report(index)
+
     def __getitem__(self, key):
         """
         Allow for dict-type lookup of indexes::
 
             idx = EDGARIndex()
             idx['10-K']
+
+        The index returned is a copy of the cached one, so it can be changed in place (see `load_index`).
         """
         try:
             return self.get_index(key)
@@ -13,6 +13,13 @@ These utilities represent lower level functionality, used by the main modules.
 import re as __re
 import datetime as __dt
 import logging as __logging
+from contextlib import contextmanager as __contextmanager
+
+try:
+    import fcntl as __fcntl
+except ImportError:
+    # No fcntl on Windows, where locking is skipped.
+    __fcntl = None
 
 __logger = __logging.getLogger(__name__)
 
@@ -209,11 +216,89 @@ def get_quarter(datetime_in):
         return int((datetime_in - 1) / 3) + 1
 
 
-def iterate_dates(from_date, to_date=None, period="daily", skip_weekends=True, inclusive=True):
+#: Days EDGAR was closed outside the regular federal holidays (national days of mourning, storms).
+#: Feeds missing on other days are caught by the missing feeds cache (see `manifest.MissingFeeds`).
+EDGAR_CLOSURES = frozenset(
+    [
+        __dt.date(2004, 6, 11),  # President Reagan's funeral
+        __dt.date(2007, 1, 2),  # President Ford's funeral
+        __dt.date(2012, 10, 29),  # Hurricane Sandy
+        __dt.date(2012, 10, 30),  # Hurricane Sandy
+        __dt.date(2018, 12, 5),  # President George H. W. Bush's funeral
+        __dt.date(2025, 1, 9),  # President Carter's funeral
+    ]
+)
+
+
+def __nth_weekday(year, month, weekday, n):
+    """Date of the `n`th `weekday` (0 is Monday) of `month`, or the last one if `n` is -1."""
+    if n < 0:
+        _last = __dt.date(year + month // 12, month % 12 + 1, 1) - __dt.timedelta(days=1)
+        return _last - __dt.timedelta(days=(_last.weekday() - weekday) % 7)
+    _first = __dt.date(year, month, 1)
+    return _first + __dt.timedelta(days=(weekday - _first.weekday()) % 7 + 7 * (n - 1))
+
+
+def __observed(date):
+    """Federal holidays on a Saturday are observed the Friday before, those on a Sunday the Monday after."""
+    if date.weekday() == 5:
+        return date - __dt.timedelta(days=1)
+    if date.weekday() == 6:
+        return date + __dt.timedelta(days=1)
+    return date
+
+
+def federal_holidays(year):
+    """
+    Return the (observed) federal holidays in `year`, on which the SEC and EDGAR are closed.
+    Computed from the holiday rules, so it works for any year.
+
+    Arguments:
+        year (int): Year of the holidays.
+
+    Returns:
+        set: Dates of the holidays falling in `year` (New Year's Day of the next year can be observed on December 31).
+    """
+    _holidays = {
+        __observed(__dt.date(year, 1, 1)),
+        __observed(__dt.date(year + 1, 1, 1)),  # observed Dec 31 when Jan 1 is a Saturday
+        __nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        __nth_weekday(year, 5, 0, -1),  # Memorial Day
+        __observed(__dt.date(year, 7, 4)),
+        __nth_weekday(year, 9, 0, 1),  # Labor Day
+        __nth_weekday(year, 10, 0, 2),  # Columbus Day
+        __observed(__dt.date(year, 11, 11)),  # Veterans Day
+        __nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        __observed(__dt.date(year, 12, 25)),
+    }
+    if year >= 1986:
+        _holidays.add(__nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    if year >= 2021:
+        _holidays.add(__observed(__dt.date(year, 6, 19)))  # Juneteenth
+
+    return {_d for _d in _holidays if _d.year == year}
+
+
+def is_business_day(date):
+    """
+    Check whether EDGAR is open on `date`, i.e. it isn't a weekend, federal holiday, or other EDGAR closure.
+    Only business days have daily feed files.
+
+    Arguments:
+        date (str, date, int): Date, or input `parse_date_input` understands.
+
+    Returns:
+        bool: True if `date` is a business day.
+    """
+    date = parse_date_input(date)
+    return date.weekday() < 5 and date not in EDGAR_CLOSURES and date not in federal_holidays(date.year)
+
+
+def iterate_dates(from_date, to_date=None, period="daily", skip_weekends=True, inclusive=True, skip_holidays=False):
     """
     Iterates over a date range at a given 'periodicity', where the period is represented by the first occuring date.
     So Q1, 2000 would be `dt.date(2000, 1, 1)`.
-    Can skip weekends, but does not know about holidays.
+    Can skip weekends, and holidays (see `is_business_day`).
 
     Arguments:
         from_date (str, datetime, int): Can be datetime, year (int or string), string of format YYYYMMDD
@@ -223,6 +308,8 @@ def iterate_dates(from_date, to_date=None, period="daily", skip_weekends=True, i
         period (str): Periodicity of dates yielded, either `yearly`, `quarterly`, or `daily`. Default to daily.
         skip_weekends (bool): Flag for whether to skip returning weekends (sat/sun). Default: True.
         inclusive (bool): Flag for whether to include the to_date (or the quarter/year of to_date). Default: True.
+        skip_holidays (bool): Flag for whether to skip returning federal holidays and other days EDGAR was closed,
+            when iterating daily. Default: False.
 
     Returns:
         (datetime): Yields datetime objects
@@ -250,4 +337,32 @@ def iterate_dates(from_date, to_date=None, period="daily", skip_weekends=True, i
             i_date = __dt.date.fromordinal(i_date)
             if skip_weekends and i_date.weekday() >= 5:
                 continue
+            if skip_holidays and not is_business_day(i_date):
+                continue
             yield i_date
+
+
+@__contextmanager
+def lock_file(file_handle):
+    """
+    Context manager holding an exclusive lock on the open file `file_handle`, which blocks other processes
+    taking the same lock until released. Locks are advisory, and do nothing where `fcntl` isn't available (Windows).
+
+    Examples:
+        Lock a file while appending to it::
+
+            with open(path, 'ab') as fh, lock_file(fh):
+                fh.write(data)
+
+    Arguments:
+        file_handle (file): Open file object to lock.
+    """
+    if __fcntl is None:
+        yield file_handle
+        return
+
+    __fcntl.flock(file_handle.fileno(), __fcntl.LOCK_EX)
+    try:
+        yield file_handle
+    finally:
+        __fcntl.flock(file_handle.fileno(), __fcntl.LOCK_UN)
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+Catalog of extracted filings, built during extraction from the filings' SGML headers.
+
+Each extracted filing gets one row with its accession, CIK, form type, filing date, company name,
+period, SIC code, 8-K items, stored size and path. Every CIK in the header (filer, subject company,
+reporting owner, ...) is also indexed, so header-level questions can be answered without opening
+a single filing::
+
+    from pyedgar.utilities.catalog import FilingCatalog
+    # All 8-Ks with item 5.02 filed in 2019
+    df = FilingCatalog().query(form_type='8-K', item='5.02', start_date='2019-01-01', end_date='2019-12-31')
+
+Build it by extracting with ``EDGARCacher(use_catalog=True)``. The catalog is a SQLite database,
+by default at `FILING_ROOT/filing_catalog.sqlite` (see `FILING_CATALOG_PATH` in the config file).
+
+:copyright: © 2025 by Mac Gaulin
+:license: MIT, see LICENSE for more details.
+"""
+
+# Stdlib imports
+import os
+import logging
+import sqlite3
+from contextlib import contextmanager
+
+# 3rd party imports
+import pandas as pd
+
+# Module Imports
+from pyedgar import config
+from pyedgar import utilities
+from pyedgar.utilities import forms
+
+# Local logger
+_logger = logging.getLogger(__name__)
+
+#: Columns of the catalog's filings table, in order
+COLUMNS = (
+    "accession",
+    "cik",
+    "form_type",
+    "filing_date",
+    "company_name",
+    "period",
+    "sic",
+    "items",
+    "size",
+    "path",
+)
+
+
+def _first(value):
+    """First of a header value that may be a list (repeated tags), or '' if missing."""
+    if isinstance(value, list):
+        return value[0]
+    return value or ""
+
+
+def _all(value):
+    """All of a header value that may be a single value or a list (repeated tags)."""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _iso_date(yyyymmdd):
+    """Convert a header date (YYYYMMDD) to YYYY-MM-DD, or None if it isn't one."""
+    if len(yyyymmdd) != 8 or not yyyymmdd.isdigit():
+        return None
+    return "{}-{}-{}".format(yyyymmdd[:4], yyyymmdd[4:6], yyyymmdd[6:])
+
+
+def header_to_row(header_text, path=None, size=None):
+    """
+    Build a catalog row from the SGML header of a daily feed filing.
+
+    Args:
+        header_text (str): Text of the filing, of which only the header (before the first <DOCUMENT>) is read.
+        path (str, None): Path of the filing in the local filing store.
+        size (int, None): Size of the stored filing in bytes.
+
+    Returns:
+        dict: Catalog row with `COLUMNS` as keys, plus 'ciks', the list of all CIKs in the header.
+    """
+    headers = forms.get_all_headers_flat(header_text)
+
+    ciks = []
+    for cik in _all(headers.get("cik")):
+        try:
+            cik = int(cik)
+        except ValueError:
+            continue
+        if cik not in ciks:
+            ciks.append(cik)
+
+    return {
+        "accession": _first(headers.get("accession-number")),
+        "cik": ciks[0] if ciks else None,
+        "form_type": _first(headers.get("type") or headers.get("form-type")),
+        "filing_date": _iso_date(_first(headers.get("filing-date"))),
+        "company_name": _first(headers.get("conformed-name")),
+        "period": _iso_date(_first(headers.get("period"))),
+        "sic": _first(headers.get("assigned-sic")),
+        "items": ",".join(_all(headers.get("items"))),
+        "size": size,
+        "path": path,
+        "ciks": ciks,
+    }
+
+
+class FilingCatalog(object):
+    """
+    SQLite backed catalog of extracted filings, keyed by accession.
+
+    Only the path is stored on the object, and a connection is opened per call,
+    so the catalog can be pickled along with an `EDGARCacher` into worker processes.
+    """
+
+    #: Path to the SQLite catalog file
+    path = None
+
+    _schema = (
+        """
+        CREATE TABLE IF NOT EXISTS filings (
+            accession TEXT PRIMARY KEY,
+            cik INTEGER,
+            form_type TEXT,
+            filing_date TEXT,
+            company_name TEXT,
+            period TEXT,
+            sic TEXT,
+            items TEXT,
+            size INTEGER,
+            path TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS filing_ciks (
+            accession TEXT,
+            cik INTEGER,
+            PRIMARY KEY (accession, cik)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS filings_form_date ON filings (form_type, filing_date)",
+        "CREATE INDEX IF NOT EXISTS filings_date ON filings (filing_date)",
+        "CREATE INDEX IF NOT EXISTS filing_ciks_cik ON filing_ciks (cik)",
+    )
+
+    def __init__(self, path=None):
+        """
+        Initialize the catalog, creating the database if needed.
+
+        Args:
+            path (str, None): Path of the SQLite catalog file. Default: `config.FILING_CATALOG_PATH`.
+        """
+        self.path = path or config.FILING_CATALOG_PATH
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        with self._connect() as conn:
+            for statement in self._schema:
+                conn.execute(statement)
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection to the catalog, committing and closing it on exit. Waits on other writers."""
+        conn = sqlite3.connect(self.path, timeout=60)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add(self, rows):
+        """
+        Add (or replace) filings in the catalog, in one transaction.
+
+        Args:
+            rows (iterable): Catalog rows, as returned by `header_to_row`.
+
+        Returns:
+            int: Number of rows added.
+        """
+        rows = [row for row in rows if row.get("accession")]
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO filings VALUES ({})".format(", ".join("?" * len(COLUMNS))),
+                [tuple(row[c] for c in COLUMNS) for row in rows],
+            )
+            conn.executemany(
+                "DELETE FROM filing_ciks WHERE accession = ?", [(row["accession"],) for row in rows]
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO filing_ciks VALUES (?, ?)",
+                [(row["accession"], cik) for row in rows for cik in row.get("ciks", [])],
+            )
+
+        return len(rows)
+
+    def get(self, accession):
+        """
+        Return the catalog row of `accession` as a dictionary, or None if it isn't cataloged.
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM filings WHERE accession = ?", (accession,)).fetchone()
+
+        return dict(row) if row is not None else None
+
+    def query(self, cik=None, form_type=None, start_date=None, end_date=None, item=None, columns=None):
+        """
+        Query the catalog for filings matching all the given criteria.
+
+        Args:
+            cik (int, list, None): CIK(s) of any filer in the filing (filer, subject company, ...).
+            form_type (str, list, None): Form type(s), matched exactly (e.g. '8-K' or ['10-K', '10-K405']).
+            start_date (str, date, None): First filing date to include (inclusive).
+            end_date (str, date, None): Last filing date to include (inclusive).
+            item (str, None): 8-K item the filing must report, e.g. '5.02'.
+            columns (list, None): Columns to return. Default: all of `COLUMNS`.
+
+        Returns:
+            DataFrame: Matching filings, with `filing_date` and `period` as datetimes.
+
+        Raises:
+            ValueError: Raised if `columns` has names that aren't in `COLUMNS`.
+        """
+        columns = list(columns or COLUMNS)
+        unknown = [c for c in columns if c not in COLUMNS]
+        if unknown:
+            raise ValueError("Unknown catalog columns {!r}, choose from {!r}".format(unknown, COLUMNS))
+
+        where, params = [], []
+
+        if cik is not None:
+            ciks = [int(cik)] if isinstance(cik, (int, str)) else [int(c) for c in cik]
+            where.append(
+                "accession IN (SELECT accession FROM filing_ciks WHERE cik IN ({}))".format(", ".join("?" * len(ciks)))
+            )
+            params.extend(ciks)
+
+        if form_type is not None:
+            form_types = [form_type] if isinstance(form_type, str) else list(form_type)
+            where.append("form_type IN ({})".format(", ".join("?" * len(form_types))))
+            params.extend(form_types)
+
+        if start_date is not None:
+            where.append("filing_date >= ?")
+            params.append("{:%Y-%m-%d}".format(utilities.parse_date_input(start_date)))
+
+        if end_date is not None:
+            where.append("filing_date <= ?")
+            params.append("{:%Y-%m-%d}".format(utilities.parse_date_input(end_date)))
+
+        if item is not None:
+            where.append("(',' || items || ',') LIKE ?")
+            params.append("%,{},%".format(item))
+
+        sql = "SELECT {} FROM filings".format(", ".join(columns))
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+
+        with self._connect() as conn:
+            df = pd.read_sql_query(sql, conn, params=params)
+
+        for col in ("filing_date", "period"):
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors="coerce")
+
+        return df
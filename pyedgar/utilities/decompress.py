@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Pluggable gzip decompression for daily feed files.
+
+Inflating the feed tarballs is the main CPU cost of extraction, and the standard library's gzip runs
+it in the same thread that parses the filings. Available backends, fastest first:
+
+* `isal`: Intel ISA-L inflate, from the `isal` package (`pip install isal`), in a background thread
+  (see `ISAL_THREADS`).
+* `zlib-ng`: zlib-ng inflate, from the `zlib-ng` package (`pip install zlib-ng`).
+* `pigz`: an external `pigz -dc` process, which decompresses alongside the python process.
+* `gzip`: the standard library, always available.
+
+`auto` (the default, see `FEED_DECOMPRESSOR` in the config file) picks the first available backend.
+
+To see how the backends compare on your machine, benchmark them on a feed file::
+
+    python -m pyedgar.utilities.decompress /path/to/20190102.nc.tar.gz
+
+:copyright: © 2025 by Mac Gaulin
+:license: MIT, see LICENSE for more details.
+"""
+
+# Stdlib imports
+import io
+import os
+import gzip
+import zlib
+import shutil
+import logging
+import threading
+import subprocess
+from time import perf_counter
+
+# 3rd party imports
+try:
+    from isal import igzip, isal_zlib
+except ImportError:
+    igzip = isal_zlib = None
+
+try:
+    from isal import igzip_threaded
+except ImportError:
+    igzip_threaded = None
+
+try:
+    from zlib_ng import gzip_ng, zlib_ng
+except ImportError:
+    gzip_ng = zlib_ng = None
+
+# Local logger
+_logger = logging.getLogger(__name__)
+
+#: Backends in order of preference for `auto`
+BACKENDS = ("isal", "zlib-ng", "pigz", "gzip")
+
+#: Background threads the `isal` backend inflates in (gzip streams can only be inflated by one),
+#: so decompression runs alongside, and outside the GIL of, the thread parsing the filings. 0 inflates in
+#: the reading thread, which is faster with a single CPU, where the threads would only take turns.
+ISAL_THREADS = 1 if (os.cpu_count() or 1) > 1 else 0
+
+#: Errors raised by the backends on corrupt or truncated gzip data
+DECOMPRESSION_ERRORS = tuple(
+    e for e in (EOFError, zlib.error, gzip.BadGzipFile, getattr(isal_zlib, "error", None), getattr(zlib_ng, "error", None))
+    if e is not None
+)
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def available_backends():
+    """
+    Return the names of the decompression backends available here, in order of preference.
+    """
+    available = {
+        "isal": igzip is not None,
+        "zlib-ng": gzip_ng is not None,
+        "pigz": shutil.which("pigz") is not None,
+        "gzip": True,
+    }
+    return [b for b in BACKENDS if available[b]]
+
+
+def get_backend(backend="auto"):
+    """
+    Resolve `backend` to an available backend name. `auto` (or None) is the first available backend,
+    and unavailable backends fall back to `auto` with a warning.
+    """
+    available = available_backends()
+    backend = (backend or "auto").lower()
+
+    if backend == "auto":
+        return available[0]
+    if backend not in available:
+        _logger.warning("Decompression backend %r not available (have %r), using %r.", backend, available, available[0])
+        return available[0]
+    return backend
+
+
+class _PipeReader(io.RawIOBase):
+    """
+    Raw file object reading the stdout of a decompression process.
+    If the source is a file object, a thread feeds it to the process' stdin.
+    Raises `gzip.BadGzipFile` at the end of the stream if the process failed.
+    """
+
+    def __init__(self, args, source_fh=None):
+        super().__init__()
+        self._proc = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE if source_fh is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self._feeder = None
+        if source_fh is not None:
+            self._feeder = threading.Thread(target=self._feed, args=(source_fh,), daemon=True)
+            self._feeder.start()
+
+    def _feed(self, source_fh, chunk_size=1024 ** 2):
+        try:
+            while True:
+                chunk = source_fh.read(chunk_size)
+                if not chunk:
+                    break
+                self._proc.stdin.write(chunk)
+        except (BrokenPipeError, ValueError):
+            # The process exited (or was closed) early. Reading stdout reports the error.
+            pass
+        finally:
+            try:
+                self._proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n_read = self._proc.stdout.readinto(buffer)
+        if n_read == 0 and self._proc.wait() != 0:
+            raise gzip.BadGzipFile(
+                "{} exited with {}: {!r}".format(self._proc.args[0], self._proc.returncode, self._proc.stderr.read())
+            )
+        return n_read
+
+    def close(self):
+        if not self.closed:
+            if self._proc.poll() is None:
+                self._proc.kill()
+            self._proc.wait()
+            self._proc.stdout.close()
+            self._proc.stderr.close()
+            if self._feeder is not None:
+                self._feeder.join()
+        super().close()
+
+
+def _is_gzip(path):
+    """Check the first bytes of the file at `path` for the gzip magic number."""
+    with open(path, "rb") as fh:
+        return fh.read(2) == GZIP_MAGIC
+
+
+def open_gzip(source, backend="auto"):
+    """
+    Open gzip compressed `source` for reading the decompressed bytes as a stream.
+    Files at a path that aren't gzip compressed are opened as is, so e.g. `tarfile` can report what they are.
+
+    Args:
+        source (str, Path, file): Path to the gzip file, or a binary file object of gzip data (read front to back).
+        backend (str): One of `BACKENDS`, or `auto` for the first available. Default: auto
+
+    Returns:
+        file object: Binary file object of the decompressed data. Close it when done.
+    """
+    backend = get_backend(backend)
+    is_path = not hasattr(source, "read")
+
+    if is_path and not _is_gzip(source):
+        return open(source, "rb")
+
+    _logger.debug("Decompressing %r with %s", source, backend)
+
+    if backend == "pigz":
+        if is_path:
+            return io.BufferedReader(_PipeReader(["pigz", "-dc", os.fspath(source)]))
+        return io.BufferedReader(_PipeReader(["pigz", "-dc"], source_fh=source))
+
+    if backend == "isal" and igzip_threaded is not None and ISAL_THREADS:
+        # Reads paths and file objects alike
+        return igzip_threaded.open(source, "rb", threads=ISAL_THREADS)
+
+    module = {"isal": igzip, "zlib-ng": gzip_ng}.get(backend, gzip)
+    if is_path:
+        return module.open(source, "rb")
+    return module.GzipFile(fileobj=source, mode="rb")
+
+
+def benchmark(path, backends=None, chunk_size=1024 ** 2):
+    """
+    Time decompressing the gzip file at `path` (e.g. a daily feed file) with each backend.
+
+    Args:
+        path (str, Path): Path to a gzip file.
+        backends (list, None): Backends to time. Default: all available backends.
+        chunk_size (int): Size of reads from the decompressed stream. Default: 1MB
+
+    Returns:
+        dict: `{backend: {'seconds', 'mb_in_per_s', 'mb_out_per_s'}}`, where in is compressed and out
+            decompressed MB (1024**2 bytes) per second.
+    """
+    mb_in = os.path.getsize(path) / 1024 ** 2
+    results = {}
+
+    for backend in backends or available_backends():
+        n_out = 0
+        start = perf_counter()
+        with open_gzip(path, backend=backend) as fh:
+            while True:
+                chunk = fh.read(chunk_size)
+                if not chunk:
+                    break
+                n_out += len(chunk)
+        seconds = perf_counter() - start
+
+        results[backend] = {
+            "seconds": seconds,
+            "mb_in_per_s": mb_in / seconds,
+            "mb_out_per_s": n_out / 1024 ** 2 / seconds,
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m pyedgar.utilities.decompress FEED_FILE [BACKEND ...]")
+        sys.exit(1)
+
+    _path = sys.argv[1]
+    print("{}: {:,.1f} MB compressed. Available backends: {}".format(
+        _path, os.path.getsize(_path) / 1024 ** 2, ", ".join(available_backends())
+    ))
+    print("{:>10s} {:>10s} {:>14s} {:>14s}".format("backend", "seconds", "MB/s in", "MB/s out"))
+    for _backend, _res in benchmark(_path, backends=sys.argv[2:] or None).items():
+        print("{:>10s} {:>10.2f} {:>14.1f} {:>14.1f}".format(
+            _backend, _res["seconds"], _res["mb_in_per_s"], _res["mb_out_per_s"]
+        ))
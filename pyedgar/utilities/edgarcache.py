@@ -18,8 +18,11 @@ URL Change in 2016:
 # Stdlib imports
 import os
 import re
+import queue
 import tarfile
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 def no_tqdm(iterable, *args, **kwargs):
     return iterable
@@ -37,6 +40,11 @@ from pyedgar import utilities
 from pyedgar.utilities import localstore
 from pyedgar.utilities import forms
 from pyedgar.utilities import edgarweb
+from pyedgar.utilities import filestore
+from pyedgar.utilities import decompress
+from pyedgar.utilities import manifest
+from pyedgar.utilities import packstore
+from pyedgar.utilities import catalog
 
 
 class EDGARCacher(object):
@@ -56,7 +64,19 @@ class EDGARCacher(object):
 
     # Class local vars
     _path_formatter = None
-    _use_requests = False
+    _use_requests = True
+    _use_manifest = True
+    _binary = False
+    _pack_store = None
+    _decompressor = "auto"
+    _catalog = None
+    #: Number of catalog rows added to the filing catalog at a time
+    _catalog_batch_size = 1000
+    #: Size of chunks copied from feed files to the filing store in binary mode
+    _chunk_size = 1024 ** 2
+
+    #: Errors raised by feed files in the last `extract_daily_feeds` call, as {date: error}
+    feed_errors = None
 
     # Local versions of file path lookups, for overriding if you like
     _get_filing_path = None
@@ -66,16 +86,40 @@ class EDGARCacher(object):
     # May as well share this across instances (instead of setting in __init__)
     _logger = logging.getLogger(__name__)
 
-    def __init__(self, keep_form_type_regex=None, check_cik=False, use_tqdm=True, use_requests=False):
+    def __init__(
+        self,
+        keep_form_type_regex=None,
+        check_cik=False,
+        use_tqdm=True,
+        use_requests=True,
+        use_manifest=True,
+        binary=False,
+        decompressor=None,
+        use_catalog=False,
+    ):
         """
         Initialize the downloader object.
 
         keep_form_type_regex: regular expression object which will match to form-types you wish to keep, default to config file if None. Pass '.' for all filings.
         check_cik: flag for whether to extract the CIK from the nc file for passing into the path formatter.
         use_tqdm: flag for whether or not to wrap downloads in tqdm for progress monitoring
+        use_manifest: flag for whether to record extracted feed files in `config.FEED_MANIFEST_PATH`, and skip
+            unchanged feed files that were already extracted (unless overwriting).
+        binary: flag for whether to copy filing bytes straight to the filing store in chunks, only decoding
+            the header. Otherwise the whole filing is decoded and re-encoded. With the default latin-1
+            `EDGAR_ENCODING` both write the same bytes.
+        decompressor: gzip backend for feed files (see `decompress.BACKENDS`), default to config file if None.
+        use_catalog: flag for whether to add a row per extracted filing (from its header) to the filing catalog
+            at `config.FILING_CATALOG_PATH` (see `catalog`). Filings that already exist are cataloged too,
+            but feed files skipped by the manifest are not, so catalog those with `overwrite` or `use_manifest=False`.
         """
         self.check_cik = check_cik
         self._use_requests = use_requests
+        self._use_manifest = use_manifest
+        self._binary = binary
+        self._decompressor = decompress.get_backend(decompressor or config.FEED_DECOMPRESSOR)
+        if use_catalog:
+            self._catalog = catalog.FilingCatalog()
 
         self.keep_regex = keep_form_type_regex
         if keep_form_type_regex is None and config.KEEP_REGEX:
@@ -93,32 +137,55 @@ class EDGARCacher(object):
         self._logger.debug("Index root: %r | form_*.%s", config.INDEX_ROOT, config.INDEX_EXTENSION)
         self._logger.debug("Extract regex: %r", self.keep_regex.pattern if self.keep_regex else "ALL")
 
-    def _handle_nc(self, file_or_str):
+    def _read_nc_header(self, nc_file, doc_tag=b"<DOCUMENT>", chunk_size=16 * 1024):
         """
-        Reads file or string, returns dictionary based on flags or None on failure.
-        At a minimum, it returns: {'doc'}
+        Read from binary file object `nc_file` until the first `doc_tag` (the end of the SGML header) is read.
+        The file is left positioned after the returned bytes, so the rest of the filing can still be read.
 
-        If keep_regex is set (not None), it adds 'form_type'.
-            (Raises WrongFormType if FORM-TYPE SGML tag doesn't match `keep_regex`.)
-
-        If check_cik is True, it extracts and adds 'cik'.
+        Returns:
+            bytes: The header bytes, which may include some of the first document as well.
         """
-        try:
-            txt = file_or_str.read().replace(b"\r", b"\n")
-        except AttributeError:
-            txt = file_or_str.replace("\r", "\n")
+        buf = bytearray()
+        while True:
+            chunk = nc_file.read(chunk_size)
+            if not chunk:
+                break
+            # Start searching a tag's length back from the new chunk, in case the tag straddles chunks.
+            search_from = max(0, len(buf) - len(doc_tag))
+            buf += chunk
+            if buf.find(doc_tag, search_from) >= 0:
+                break
 
-        if not txt:
-            raise InputTypeError("No text of file object found")
+        return bytes(buf)
 
+    def _decode_nc(self, nc_bytes):
+        """
+        Decode `nc_bytes`, trying `EDGAR_ENCODING`, then utf-8, then latin-1 ignoring errors.
+
+        Returns:
+            tuple: (decoded text, encoding used, errors setting used)
+        """
         for _decode_type, _errors in zip((self.EDGAR_ENCODING, "utf-8", "latin-1"), ("strict", "strict", "ignore")):
             try:
-                txt = txt.decode(_decode_type, errors=_errors)
-                break
+                return nc_bytes.decode(_decode_type, errors=_errors), _decode_type, _errors
             except (UnicodeDecodeError, ValueError):
                 pass
 
-        ret_val = {"doc": txt, "encoding": _decode_type, "decode_errors": _errors}
+        return nc_bytes, _decode_type, _errors
+
+    def _check_nc_header(self, txt):
+        """
+        Check the header of nc file text `txt` against `keep_regex` and `check_cik`.
+        Only the header (before the first <DOCUMENT> tag) is searched, so `txt` need only contain the header.
+
+        Returns:
+            dict: With 'filing_date', 'form_type' if keep_regex is set, 'cik' and 'accession' if check_cik is set.
+
+        Raises:
+            NoFormTypeFound, WrongFormType: If keep_regex is set and the FORM-TYPE is missing or doesn't match.
+            NoCIKFound: If check_cik is set and no CIK is found.
+        """
+        ret_val = {"filing_date": forms.get_header(txt, "FILING-DATE")}
 
         if self.keep_regex is not None:
             ret_val["form_type"] = forms.get_header(txt, "FORM-TYPE")
@@ -138,131 +205,301 @@ class EDGARCacher(object):
 
         return ret_val
 
+    def _iter_nc_chunks(self, head, nc_file):
+        """
+        Generator of the bytes of a filing, `head` followed by the rest of `nc_file` in `_chunk_size` chunks,
+        with carriage returns replaced by newlines. Memory use is bounded by the chunk size, not the filing size.
+        """
+        yield head.replace(b"\r", b"\n")
+        while True:
+            chunk = nc_file.read(self._chunk_size)
+            if not chunk:
+                break
+            yield chunk.replace(b"\r", b"\n")
+
+    def _handle_nc(self, file_or_str):
+        """
+        Reads file or string, returns dictionary based on flags or None on failure.
+        At a minimum, it returns: {'doc'}
+
+        If keep_regex is set (not None), it adds 'form_type'.
+            (Raises WrongFormType if FORM-TYPE SGML tag doesn't match `keep_regex`.)
+
+        If check_cik is True, it extracts and adds 'cik'.
+
+        If the filing catalog is used, it adds 'header', the text of (at least) the SGML header.
+
+        For file objects, only the SGML header (up to the first <DOCUMENT> tag) is read before checking
+        form type and CIK, and the rest of the file is only read if the filing is kept.
+
+        In binary mode (`binary=True` at init), 'doc' is instead a generator of the filing's bytes in chunks
+        (with line endings normalized), read from `file_or_str` as it is consumed. It must be consumed before
+        the file object is closed or moved past.
+        """
+        try:
+            head = self._read_nc_header(file_or_str)
+        except AttributeError:
+            txt = file_or_str.replace("\r", "\n")
+            if not txt:
+                raise InputTypeError("No text of file object found")
+
+            ret_val = self._check_nc_header(txt)
+            ret_val.update({"doc": txt, "encoding": None, "decode_errors": None})
+            if self._catalog is not None:
+                ret_val["header"] = txt
+            return ret_val
+
+        if not head:
+            raise InputTypeError("No text of file object found")
+
+        # Raises before the body is read if the filing isn't one we keep.
+        head_txt = self._decode_nc(head.replace(b"\r", b"\n"))[0]
+        ret_val = self._check_nc_header(head_txt)
+        if self._catalog is not None:
+            ret_val["header"] = head_txt
+
+        if self._binary:
+            ret_val.update({"doc": self._iter_nc_chunks(head, file_or_str), "encoding": None, "decode_errors": None})
+            return ret_val
+
+        txt, _decode_type, _errors = self._decode_nc((head + file_or_str.read()).replace(b"\r", b"\n"))
+        ret_val.update({"doc": txt, "encoding": _decode_type, "decode_errors": _errors})
+
+        return ret_val
+
     def extract_from_feed_cache(self, cache_path, overwrite=False):
         """
         Extract all filings from a daily feed compressed cache file.
+        `cache_path` can also be a binary file object of the compressed feed (e.g. an HTTP response),
+        which is read once, front to back, extracting filings as they arrive.
         Uses `self._get_filing_path` to determine location for extracted filings.
+        Filings are saved with `self._save_filing`, so compressed or into pack files depending on the config.
 
         Extracts filings based on regular expression match of form type if `self.keep_regex` is not None.
+        The feed is decompressed with `self._decompressor` (see `decompress`), and read as a stream either way.
+        """
+        # Members are handled in order as they are decompressed, no seeking.
+        feed = decompress.open_gzip(cache_path, backend=self._decompressor)
+        try:
+            with feed, tarfile.open(fileobj=feed, mode="r|") as tar:
+                return self._extract_members(tar, overwrite=overwrite)
+        except decompress.DECOMPRESSION_ERRORS as excp:
+            raise tarfile.ReadError("Error decompressing feed {!r}: {}".format(cache_path, excp)) from excp
+
+    def _extract_members(self, tar, overwrite=False):
+        """
+        Extract filings from the members of open feed tarfile `tar`, returning (# extracted, # total).
         """
         i_done, i_tot = 0, 0
+        catalog_rows = []
 
-        with tarfile.open(cache_path, "r") as tar:
-            for tarinfo in tar:
-                if len(tarinfo.name) < 3 or ".corr" in tarinfo.name:
-                    continue
-                i_tot += 1
+        for tarinfo in tar:
+            if len(tarinfo.name) < 3 or ".corr" in tarinfo.name:
+                continue
+            i_tot += 1
 
-                # tarinfo.name of form ./ACCESSION.nc
-                nc_acc = tarinfo.name.split("/")[-1][:-3]
-                if len(nc_acc) != 20:
-                    self._logger.warning("\tAccession in filename seems suspect. %r", nc_acc)
+            # tarinfo.name of form ./ACCESSION.nc
+            nc_acc = tarinfo.name.split("/")[-1][:-3]
+            if len(nc_acc) != 20:
+                self._logger.warning("\tAccession in filename seems suspect. %r", nc_acc)
 
-                try:
-                    nc_file = tar.extractfile(tarinfo)
-                except IOError:
-                    continue
+            try:
+                nc_file = tar.extractfile(tarinfo)
+            except IOError:
+                continue
 
-                # At this point, we have a file, and we have an accession.
-                # This should be all we need to save it off.
-                try:
-                    nc_dict = self._handle_nc(nc_file)
-                except InputTypeError:
-                    self._logger.warning("\tNot a file or string at %r (%r/%r extracted)", tarinfo.name, i_done, i_tot)
-                    continue
-                except NoCIKFound:
-                    # This only triggers if self.check_cik is set.
-                    self._logger.warning("\tNo CIK found at %r (%r/%r extracted)", tarinfo.name, i_done, i_tot)
-                    continue
-                except NoFormTypeFound:
-                    # This only triggers if self.keep_regex is set.
-                    self._logger.warning("\tNo FormType found at %r (%r/%r extracted)", tarinfo.name, i_done, i_tot)
-                    continue
-                except WrongFormType:
-                    # This only triggers if self.keep_regex is set.
-                    continue
+            # At this point, we have a file, and we have an accession.
+            # This should be all we need to save it off.
+            try:
+                nc_dict = self._handle_nc(nc_file)
+            except InputTypeError:
+                self._logger.warning("\tNot a file or string at %r (%r/%r extracted)", tarinfo.name, i_done, i_tot)
+                continue
+            except NoCIKFound:
+                # This only triggers if self.check_cik is set.
+                self._logger.warning("\tNo CIK found at %r (%r/%r extracted)", tarinfo.name, i_done, i_tot)
+                continue
+            except NoFormTypeFound:
+                # This only triggers if self.keep_regex is set.
+                self._logger.warning("\tNo FormType found at %r (%r/%r extracted)", tarinfo.name, i_done, i_tot)
+                continue
+            except WrongFormType:
+                # This only triggers if self.keep_regex is set.
+                continue
 
-                try:
-                    nc_text = nc_dict.pop("doc")
-                    if "accession" not in nc_dict:
-                        nc_dict["accession"] = nc_acc
-                except AttributeError:
-                    # None type has no pop
-                    self._logger.warning(
-                        "\tHandling nc file %r passed exceptions (%r/%r extracted)", tarinfo.name, i_done, i_tot
-                    )
-                    continue
-                except KeyError:
-                    # This triggers upon nc_dict.pop not having 'doc' in it. Shouldn't happen.
-                    self._logger.warning(
-                        "\tNo document item extracted from %r (%r/%r extracted)", tarinfo.name, i_done, i_tot
-                    )
-                    continue
+            try:
+                nc_text = nc_dict.pop("doc")
+                nc_header = nc_dict.pop("header", None)
+                if "accession" not in nc_dict:
+                    nc_dict["accession"] = nc_acc
+            except AttributeError:
+                # None type has no pop
+                self._logger.warning(
+                    "\tHandling nc file %r passed exceptions (%r/%r extracted)", tarinfo.name, i_done, i_tot
+                )
+                continue
+            except KeyError:
+                # This triggers upon nc_dict.pop not having 'doc' in it. Shouldn't happen.
+                self._logger.warning(
+                    "\tNo document item extracted from %r (%r/%r extracted)", tarinfo.name, i_done, i_tot
+                )
+                continue
 
-                # Get local nc file path. Accession is nc file filename.
-                nc_out_path = self._get_filing_path(**nc_dict)
-                i_done += 1
-                if not overwrite and os.path.exists(nc_out_path):
-                    continue
+            i_done += 1
+            nc_out_path = self._save_filing(nc_text, nc_dict, overwrite=overwrite)
 
-                # Sometimes the containing dir (cik or year) doesn't exist. Make it so.
-                if not os.path.exists(os.path.dirname(nc_out_path)):
-                    os.makedirs(os.path.dirname(nc_out_path))
+            if self._catalog is not None:
+                # Filings that already existed are cataloged where they are.
+                nc_out_path = nc_out_path or self._get_filing_path(**nc_dict)
+                row = catalog.header_to_row(nc_header, path=nc_out_path, size=filestore.filing_size(nc_out_path))
+                row["accession"] = row["accession"] or nc_dict["accession"]
+                catalog_rows.append(row)
+                if len(catalog_rows) >= self._catalog_batch_size:
+                    self._catalog.add(catalog_rows)
+                    catalog_rows = []
 
-                with open(nc_out_path, "w", encoding=nc_dict["encoding"], errors=nc_dict["decode_errors"]) as fh:
-                    fh.write(nc_text)
+        if catalog_rows:
+            self._catalog.add(catalog_rows)
 
         return i_done, i_tot
 
+    def _save_filing(self, nc_text, nc_dict, overwrite=False):
+        """
+        Save extracted filing `nc_text` to the local filing store. `nc_text` is either the decoded text,
+        or (in binary mode) an iterable of bytes chunks.
+        If `config.FILING_STORE` is pack, the filing is appended to its quarter's pack file (see `packstore`).
+        Otherwise it is written to `self._get_filing_path(**nc_dict)`, compressed if that path ends
+        in a compression suffix (see `filestore`).
+
+        Returns:
+            str, None: Path of the saved filing, or None if it already existed and not `overwrite`.
+        """
+        if config.FILING_STORE == "pack":
+            if self._pack_store is None:
+                self._pack_store = packstore.PackStore()
+
+            if isinstance(nc_text, str):
+                nc_text = nc_text.encode(nc_dict["encoding"] or "utf-8", nc_dict["decode_errors"] or "strict")
+
+            return self._pack_store.add(
+                nc_dict["accession"],
+                nc_text,
+                filing_date=nc_dict.get("filing_date"),
+                overwrite=overwrite,
+            )
+
+        # Get local nc file path. Accession is nc file filename.
+        nc_out_path = self._get_filing_path(**nc_dict)
+        if not overwrite and os.path.exists(nc_out_path):
+            return None
+
+        # Sometimes the containing dir (cik or year) doesn't exist. Make it so.
+        # exist_ok, because other extraction processes may be making it at the same time.
+        os.makedirs(os.path.dirname(nc_out_path), exist_ok=True)
+
+        if not isinstance(nc_text, str):
+            with filestore.open_filing(nc_out_path, "wb") as fh:
+                for chunk in nc_text:
+                    fh.write(chunk)
+            return nc_out_path
+
+        with filestore.open_filing(
+            nc_out_path, "w", encoding=nc_dict["encoding"], errors=nc_dict["decode_errors"]
+        ) as fh:
+            fh.write(nc_text)
+
+        return nc_out_path
+
+    def iterate_feed_dates(self, from_date, to_date=None, skip_missing=True):
+        """
+        List the days from `from_date` to `to_date` (inclusive) that can have a feed file: business days
+        (see `utilities.is_business_day`), not recorded as having no feed file if `skip_missing`
+        (see `edgarweb.get_missing_feeds`), which is only looked up with the manifest (`use_manifest`).
+        """
+        missing_feeds = edgarweb.get_missing_feeds().dates() if skip_missing and self._use_manifest else set()
+
+        return [
+            i_date
+            for i_date in utilities.iterate_dates(from_date, to_date=to_date, period="daily", skip_holidays=True)
+            if i_date not in missing_feeds
+        ]
+
     def iterate_over_days(self, from_date, to_date=None, message="Downloading Feeds"):
         """
-        Iterate over days from `from_date` to `to_date` (inclusive).
+        Iterate over days with feed files from `from_date` to `to_date` (inclusive), see `iterate_feed_dates`.
         """
-        num_dates = len([1 for _ in utilities.iterate_dates(from_date, to_date=to_date, period="daily")])
-        for i_date in self._tqdm(
-            utilities.iterate_dates(from_date, to_date=to_date, period="daily"), total=num_dates, desc=message
-        ):
+        dates = self.iterate_feed_dates(from_date, to_date=to_date)
+        for i_date in self._tqdm(dates, total=len(dates), desc=message):
             yield i_date
 
-    def extract_daily_feeds(self, from_date, to_date=None, download_first=False, overwrite=False, message="Extracting Feeds"):
+    def extract_daily_feeds(
+        self,
+        from_date,
+        to_date=None,
+        download_first=False,
+        overwrite=False,
+        message="Extracting Feeds",
+        workers=1,
+        prefetch=2,
+        stream=False,
+    ):
         """
         Loop through daily feed compressed files and extract them to local cache.
         Uses the object's path formatter to determine file paths.
 
+        When `download_first` is set, feed files are downloaded in a background thread while earlier
+        feed files are extracted, so the download and extraction stages overlap.
+
+        Unless `overwrite` is set, feed files recorded in the extraction manifest as already extracted
+        (unchanged, with the same form type regex and filing path format) are skipped without being opened.
+
+        With `stream` set, feed files are never saved to disk: each day's feed is read from EDGAR as it
+        downloads and its filings are extracted as they arrive (see `edgarweb.open_feed_stream`).
+        `download_first`, `prefetch` and the extraction manifest don't apply to streamed feeds.
+
         Args:
             from_date (datetime): Day to start extracting on.
             to_date (datetime): Optional day to finish extracting on. Default: datetime.date.today()
             download_first (bool): Flag for whether to try and download daily feed cache files from
                 EDGAR if they don't exist, or just use the already downloaded files. Default: False.
             overwrite (bool): Flag for whether to overwrite filings if they have already been extracted. Default: False.
+            workers (int): Number of processes to extract feeds with, one feed file per task. Values
+                of 1 or less extract serially in this process. Default: 1.
+            prefetch (int): Maximum number of downloaded feed files waiting to be extracted, when `download_first`
+                is set. Set to 0 to download and extract each day in turn. Default: 2.
+            stream (bool): Flag for whether to extract feeds straight from the EDGAR download, without
+                saving the feed files. Default: False.
+
+        Returns:
+            tuple: (number of filings extracted, number of filings searched, number of feed files parsed).
+                Feeds that raised errors are not counted, and are stored in `self.feed_errors` as `{date: error}`.
         """
-        num_extracted, num_total, num_parsed, i_extracted, i_searched = 0, 0, 0, 0, 0
+        num_extracted, num_total, num_parsed = 0, 0, 0
+        self.feed_errors = {}
 
-        if download_first:
+        if download_first or stream:
             message = f"Downloading and {message}"
 
-        for i_date in self.iterate_over_days(from_date, to_date, message=message):
-            if download_first:
-                feed_path = edgarweb.download_feed(i_date, overwrite=overwrite, use_requests=self._use_requests)
-            else:
-                feed_path = self._get_feed_cache_path(i_date)
+        dates = self.iterate_feed_dates(from_date, to_date=to_date, skip_missing=not overwrite)
+        num_dates = len(dates)
+        feed_manifest = manifest.ExtractionManifest() if self._use_manifest and not stream else None
+        keep_pattern = self.keep_regex.pattern if self.keep_regex is not None else ""
 
-            if feed_path is None or not os.path.exists(feed_path):
-                self._logger.info("Cache file does not exist for %s at %s.", i_date, feed_path)
-                continue
+        if stream:
+            # Feed "paths" are the URLs, opened by each extraction task.
+            feeds = ((i_date, edgarweb.get_feed_url(i_date)) for i_date in dates)
+        else:
+            feeds = self._iterate_feed_paths(dates, download_first=download_first, overwrite=overwrite, prefetch=prefetch)
 
-            self._logger.info(
-                "%s feed file %s: %4.2f MB",
-                "Downloaded" if download_first else "Parsing",
-                i_date,
-                os.path.getsize(feed_path) / 1024 ** 2,
-            )
+        if feed_manifest is not None and not overwrite:
+            feeds = self._skip_extracted_feeds(feeds, feed_manifest, keep_pattern)
 
-            try:
-                i_extracted, i_searched = self.extract_from_feed_cache(feed_path, overwrite=overwrite)
-            except tarfile.ReadError:
-                self._logger.error("Handling nc file on %s at %s raised Read Error", i_date, feed_path)
+        if workers is not None and workers > 1:
+            results = self._extract_feeds_parallel(feeds, overwrite, message, workers, num_dates, stream=stream)
+        else:
+            results = self._extract_feeds_serial(feeds, overwrite, message, num_dates, stream=stream)
 
+        for i_date, feed_path, i_extracted, i_searched in results:
             # Log progress after each tar file is done
             self._logger.info("Extracted %d out of %d filings from %s", i_extracted, i_searched, feed_path)
 
@@ -270,4 +507,181 @@ class EDGARCacher(object):
             num_total += i_searched
             num_parsed += 1
 
+            if feed_manifest is not None:
+                feed_manifest.record(
+                    i_date, feed_path, keep_regex=keep_pattern, num_extracted=i_extracted, num_total=i_searched
+                )
+
+        if self.feed_errors:
+            self._logger.error("Errors extracting %d feed files: %r", len(self.feed_errors), self.feed_errors)
+
         return num_extracted, num_total, num_parsed
+
+    def _get_feed_path(self, i_date, download_first=False, overwrite=False):
+        """
+        Return the local path of the feed file on `i_date`, downloading it first if `download_first`.
+        Returns None if the feed file doesn't exist.
+        """
+        if download_first:
+            feed_path = edgarweb.download_feed(i_date, overwrite=overwrite, use_requests=self._use_requests)
+        else:
+            feed_path = self._get_feed_cache_path(i_date)
+
+        if feed_path is None or not os.path.exists(feed_path):
+            self._logger.info("Cache file does not exist for %s at %s.", i_date, feed_path)
+            return None
+
+        self._logger.info(
+            "%s feed file %s: %4.2f MB",
+            "Downloaded" if download_first else "Parsing",
+            i_date,
+            os.path.getsize(feed_path) / 1024 ** 2,
+        )
+
+        return feed_path
+
+    def _iterate_feed_paths(self, dates, download_first=False, overwrite=False, prefetch=2):
+        """
+        Generator of `(date, feed_path)` for feed files that exist locally on `dates`.
+
+        If `download_first` and `prefetch` are set, feed files are downloaded by a producer thread into a
+        queue holding at most `prefetch` feed files, which this generator consumes. That way the next
+        feed files are downloading while the caller extracts the current one.
+        Download errors are logged and stored in `self.feed_errors`.
+        """
+        if not download_first or not prefetch or prefetch < 1:
+            for i_date in dates:
+                feed_path = self._get_feed_path(i_date, download_first=download_first, overwrite=overwrite)
+                if feed_path is not None:
+                    yield i_date, feed_path
+            return
+
+        feed_queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        done = object()
+
+        def _put(item):
+            # Blocks while the queue is full (that's the point), but gives up if the consumer has stopped.
+            while not stop.is_set():
+                try:
+                    feed_queue.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def _download_feeds():
+            try:
+                for i_date in dates:
+                    if stop.is_set():
+                        break
+                    try:
+                        feed_path = self._get_feed_path(i_date, download_first=True, overwrite=overwrite)
+                    except Exception as excp:
+                        self._logger.error("Downloading feed file on %s raised %r", i_date, excp)
+                        self.feed_errors[i_date] = excp
+                        continue
+                    if feed_path is not None:
+                        _put((i_date, feed_path))
+            finally:
+                _put(done)
+
+        downloader = threading.Thread(target=_download_feeds, name="pyedgar-feed-download", daemon=True)
+        downloader.start()
+        try:
+            while True:
+                item = feed_queue.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            stop.set()
+            downloader.join()
+
+    def _skip_extracted_feeds(self, feeds, feed_manifest, keep_pattern=""):
+        """
+        Filter the `(date, feed_path)` feed files, dropping those `feed_manifest` says are already extracted.
+        """
+        for i_date, feed_path in feeds:
+            if feed_manifest.is_current(i_date, feed_path, keep_regex=keep_pattern):
+                self._logger.info("Skipping feed file %s, already extracted: %s", i_date, feed_path)
+                continue
+            yield i_date, feed_path
+
+    def _extract_feed(self, i_date, feed_path, overwrite=False, stream=False):
+        """
+        Extract one day's feed file. This is the unit of work for both serial and parallel extraction,
+        so it must stay picklable (i.e. a method on a module-level class).
+        If `stream`, the feed is read from EDGAR as it downloads instead of from `feed_path`.
+
+        Returns:
+            tuple, None: (i_date, feed_path, number of filings extracted, number of filings searched),
+                or None if streaming and EDGAR has no feed file on `i_date`.
+        """
+        if not stream:
+            i_extracted, i_searched = self.extract_from_feed_cache(feed_path, overwrite=overwrite)
+            return i_date, feed_path, i_extracted, i_searched
+
+        feed_stream = edgarweb.open_feed_stream(i_date)
+        if feed_stream is None:
+            return None
+
+        with feed_stream:
+            i_extracted, i_searched = self.extract_from_feed_cache(feed_stream, overwrite=overwrite)
+        return i_date, feed_path, i_extracted, i_searched
+
+    def _record_feed_error(self, i_date, feed_path, excp):
+        """Log and keep the error extracting a feed file, so one bad feed file doesn't stop the rest."""
+        self._logger.error("Extracting feed file on %s at %s raised %r", i_date, feed_path, excp)
+        self.feed_errors[i_date] = excp
+
+    def _extract_feeds_serial(self, feeds, overwrite, message, num_dates=None, stream=False):
+        """
+        Generator extracting the `(date, feed_path)` feed files one at a time, yielding `_extract_feed` results.
+        """
+        for i_date, feed_path in self._tqdm(feeds, total=num_dates, desc=message):
+            try:
+                result = self._extract_feed(i_date, feed_path, overwrite=overwrite, stream=stream)
+            except Exception as excp:
+                self._record_feed_error(i_date, feed_path, excp)
+                continue
+
+            if result is not None:
+                yield result
+
+    def _extract_feeds_parallel(self, feeds, overwrite, message, workers, num_dates=None, stream=False):
+        """
+        Generator extracting the `(date, feed_path)` feed files in a process pool of `workers` processes,
+        one feed file per task. Feed files are submitted as they become available (e.g. downloaded),
+        with at most `2 * workers` in flight, so results are yielded (and recorded) as the run goes.
+        """
+        return self._tqdm(
+            self._iterate_parallel_results(feeds, overwrite, workers, stream=stream), total=num_dates, desc=message
+        )
+
+    def _iterate_parallel_results(self, feeds, overwrite, workers, stream=False):
+        """Submit the feed files to a process pool, yielding `_extract_feed` results as they complete."""
+        max_in_flight = 2 * workers
+        futures = {}
+
+        def _finished():
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                i_date, feed_path = futures.pop(future)
+                try:
+                    result = future.result()
+                except Exception as excp:
+                    self._record_feed_error(i_date, feed_path, excp)
+                    continue
+                if result is not None:
+                    yield result
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for i_date, feed_path in feeds:
+                future = pool.submit(self._extract_feed, i_date, feed_path, overwrite=overwrite, stream=stream)
+                futures[future] = (i_date, feed_path)
+
+                if len(futures) >= max_in_flight:
+                    yield from _finished()
+
+            while futures:
+                yield from _finished()
@@ -6,6 +6,9 @@ index URL: http://www.sec.gov/Archives/edgar/data/2098/0001026608-05-000015-inde
 complete submission URL: http://www.sec.gov/Archives/edgar/data/2098/000102660805000015/0001026608-05-000015.txt
 Exhibit/form URL: http://www.sec.gov/Archives/edgar/data/2098/000102660815000007/acu_10k123114.htm
 
+Single documents (e.g. just the 10-K, without its exhibits, graphics and XBRL) can be downloaded with
+`download_document_from_web`, which finds them in the filing's index page (see `get_filing_documents`).
+
 EDGAR FTP change in 2016:
 <2016 ftp URL: ftp://ftp.sec.gov/edgar/data/2098/0000002098-96-000003.txt
 >2016 http URL: https://www.sec.gov/Archives/edgar/data/2098/0000002098-96-000003.txt
@@ -19,29 +22,136 @@ EDGAR HTML specification: https://www.sec.gov/info/edgar/ednews/edhtml.htm
 # Stdlib imports
 import os
 import re
+import json
 import logging
+import threading
 import subprocess
 import datetime as dt
+import html
+import email.utils
 from time import sleep
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 3rd party imports
 import requests
+from requests.adapters import HTTPAdapter
 
 # Module Imports
 from pyedgar import config
 from pyedgar import utilities
+from pyedgar.utilities import manifest
+from pyedgar.utilities import ratelimit
+from pyedgar.utilities import transport
 
 # Local logger
 _logger = logging.getLogger(__name__)
 
 # Constants
 # Used to be (before FTP changed to AWS S3): ftp://ftp.sec.gov
-EDGAR_ROOT = "https://www.sec.gov/Archives"
+# Set EDGAR_ROOT in the config file to download from a mirror instead (see `transport`).
+EDGAR_ROOT = config.EDGAR_ROOT.rstrip("/")
 REQUEST_HEADERS = {
     "User-Agent": getattr(
         config, "USER_AGENT", "pyedgar downloader (fallback UA, shame) from gaulinmp+badpyedgarUA@gmail.com"
     )
 }
+#: Number of connections kept alive in the shared session's pool, per host
+POOL_SIZE = 16
+#: Number of concurrent downloads in `download_concurrently`, all paced by the shared rate limiter
+DOWNLOAD_WORKERS = 4
+#: Status codes EDGAR answers with when the rate limit is exceeded
+RATE_LIMITED_STATUS = (429, 403)
+#: Times a rate limited request is retried, and the first backoff in seconds (doubling each retry)
+MAX_RETRIES = 3
+BACKOFF_SECONDS = 5
+#: Times an interrupted download is resumed (with HTTP Range requests) before giving up
+RESUME_ATTEMPTS = 5
+#: Size of the first Range request for a filing's header in `download_header_from_web`, doubled until it is read
+HEADER_CHUNK_SIZE = 16 * 1024
+#: Feeds missing for dates more recent than this many days may not be published yet, so aren't recorded as missing
+NO_FEED_GRACE_DAYS = 7
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the shared `requests.Session` used for all downloads from EDGAR.
+
+    The session keeps up to `POOL_SIZE` connections alive per host, so consecutive downloads skip the
+    TCP and TLS handshakes, and asks for gzip transfer encoding. It can be shared across threads.
+    It also reads ``file://`` URLs, for mirrors of EDGAR on disk (see `transport`).
+    Each process gets its own session, because pooled connections can't be shared across a fork.
+
+    Returns:
+        requests.Session: Session with `REQUEST_HEADERS` set.
+    """
+    global _session, _session_pid
+
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            transport.mount_transports(session)
+            session.headers.update(REQUEST_HEADERS)
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+            _session, _session_pid = session, os.getpid()
+
+        return _session
+
+
+def _retry_after(response):
+    """Seconds to wait from the Retry-After header of `response` (seconds or HTTP date), or None."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - dt.datetime.now().timestamp())
+    except (TypeError, ValueError):
+        return None
+
+
+def get_from_edgar(url, headers=None, stream=False, max_retries=MAX_RETRIES):
+    """
+    GET `url` with the shared session (see `get_session`), once the shared rate limiter allows it
+    (see `ratelimit`). Rate limited responses (429 or 403) pause all requests, in every process,
+    for the Retry-After time (or `BACKOFF_SECONDS`, doubling each retry), and are retried.
+    Only requests to the SEC are rate limited, not those to mirrors (see `transport.is_rate_limited`).
+
+    Arguments:
+        url (str): URL to get.
+        headers (dict, None): Headers to add to the session's headers.
+        stream (bool): Flag for whether to stream the response body, passed to `requests`.
+        max_retries (int): Times to retry rate limited requests.
+
+    Returns:
+        requests.Response: The response, which is still rate limited if retries ran out.
+    """
+    if not transport.is_rate_limited(url):
+        return get_session().get(url, headers=headers, stream=stream)
+
+    limiter = ratelimit.get_rate_limiter()
+
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        response = get_session().get(url, headers=headers, stream=stream)
+
+        if response.status_code not in RATE_LIMITED_STATUS or attempt == max_retries:
+            return response
+
+        response.close()
+        wait = _retry_after(response)
+        limiter.backoff(BACKOFF_SECONDS * 2 ** attempt if wait is None else wait)
+
+    return response
 
 
 def parse_url(url, url_re=re.compile(r"/(?P<cik>\d{1,10})/" r"(?P<accession>\d{10}-?\d\d-?\d{6})", re.I)):
@@ -146,7 +256,7 @@ def get_index_url(date_or_year, quarter=None, compressed=True):
     return "{0}/edgar/full-index/{1}/QTR{2}/master.{3}".format(EDGAR_ROOT, year, quarter, ext)
 
 
-def download_form_from_web(cik, accession=None):
+def download_form_from_web(cik, accession=None, cache=None):
     """
     Sometimes the cache file is not there, or you do not have local cache.
     In those cases, you can download the EDGAR forms from S3 directly.
@@ -154,16 +264,93 @@ def download_form_from_web(cik, accession=None):
     Arguments:
         cik (str,dict,object): String CIK, or object with cik and accession attributes or keys.
         accession (str): String ACCESSION number, or None if accession in CIK object.
+        cache (WebCache, None): Write-through cache (see `webcache`) to read the filing from if it is there,
+            and to write it to once downloaded. Default: None (no caching).
 
     Returns:
-        tuple: Tuple of strings in the form (bulk DL url, user website url)
+        str: Full text of the filing.
     """
     _raw, _ = get_edgar_urls(cik, accession=accession)
+    accession = utilities.get_cik_acc(cik, accession=accession).get("accession", None)
+
+    data = cache.read(accession) if cache is not None else None
+
+    if data is None:
+        # The shared session asks for gzip, which cuts the transfer of text filings several fold.
+        r = get_from_edgar(_raw)
+        data = r.content
 
-    r = requests.get(_raw, headers=REQUEST_HEADERS)
+        if cache is not None and r.status_code == 200:
+            cache.write(accession, data)
 
-    data = r.content
+    return _decode(data)
 
+
+def download_header_from_web(cik, accession=None, chunk_size=HEADER_CHUNK_SIZE, max_size=4 * 1024 ** 2, cache=None):
+    """
+    Download only the header of a filing (CIK, form type, period, SIC, items...), not the whole submission.
+
+    The start of the submission text file is requested with HTTP Range requests, each twice the size of the last,
+    until the first <DOCUMENT> tag (the end of the header) is read. Parse the result with `forms.get_all_headers`.
+    If the filing is in the web cache `cache`, the header is read from there instead, without any request.
+
+    Arguments:
+        cik (str,dict,object): String CIK, or object with cik and accession attributes or keys.
+        accession (str): String ACCESSION number, or None if accession in CIK object.
+        chunk_size (int): Size in bytes of the first Range request. Default: `HEADER_CHUNK_SIZE` (16kB)
+        max_size (int): Size in bytes after which to stop looking for the end of the header. Default: 4MB
+        cache (WebCache, None): Web cache (see `webcache`) to read the header from if the filing is there.
+            Headers alone are never written to it. Default: None (always download).
+
+    Returns:
+        str: Text of the filing up to the first <DOCUMENT> tag (or all that was read, if it wasn't found).
+
+    Raises:
+        FileNotFoundError: If the filing couldn't be downloaded.
+    """
+    _raw, _ = get_edgar_urls(cik, accession=accession)
+    doc_tag = b"<DOCUMENT>"
+
+    if cache is not None:
+        data = cache.read_header(
+            utilities.get_cik_acc(cik, accession=accession).get("accession", None), doc_tag=doc_tag, max_size=max_size
+        )
+        if data is not None:
+            return _decode(data)
+
+    data, size = b"", chunk_size
+    while True:
+        start = len(data)
+        # Byte ranges are of the identity encoding, so ask for no transfer encoding.
+        range_headers = {"Range": "bytes={:d}-{:d}".format(start, start + size - 1), "Accept-Encoding": "identity"}
+        r = get_from_edgar(_raw, headers=range_headers)
+
+        if r.status_code == 416:
+            # Started past the end: the whole filing has been read.
+            break
+        if r.status_code == 200:
+            # Range not supported, so this is the whole filing.
+            data = r.content
+            break
+        if r.status_code != 206:
+            raise FileNotFoundError("Error {} downloading header from {}".format(r.status_code, _raw))
+
+        data += r.content
+        # The tag may straddle the previous chunk and this one.
+        if doc_tag in data[max(0, start - len(doc_tag)):]:
+            break
+        if len(r.content) < size or len(data) >= max_size:
+            break
+        size *= 2
+
+    _logger.debug("Read %d bytes of %s for its header", len(data), _raw)
+
+    end = data.find(doc_tag)
+    return _decode(data[:end] if end >= 0 else data)
+
+
+def _decode(data):
+    """Decode downloaded bytes to text, trying latin-1, then utf-8, then latin-1 ignoring errors."""
     for _decode_type, _errors in zip(("latin-1", "utf-8", "latin-1"), ("strict", "strict", "ignore")):
         try:
             return data.decode(_decode_type, errors=_errors)
@@ -171,6 +358,165 @@ def download_form_from_web(cik, accession=None):
             continue
 
 
+def get_filing_documents(
+    cik,
+    accession=None,
+    row_re=re.compile(r"<tr[^>]*>(.*?)</tr>", re.I | re.S),
+    cell_re=re.compile(r"<td[^>]*>(.*?)</td>", re.I | re.S),
+    href_re=re.compile(r"""<a\s[^>]*href=["']([^"']+)["'][^>]*>""", re.I),
+    tag_re=re.compile(r"<[^>]+>"),
+):
+    """
+    List the documents of a filing, from its index page on EDGAR (see `get_edgar_urls`).
+
+    Each document of the filing (the main form, exhibits, graphics, XBRL files...) is a row of the
+    index page's document tables, with its sequence number, description, file name, type and size.
+    The complete submission text file row is left out.
+
+    Examples:
+        Find the 10-K's exhibits::
+
+            docs = get_filing_documents(320193, '0000320193-19-000119')
+            exhibits = [d for d in docs if d['type'].startswith('EX-')]
+
+    Arguments:
+        cik (str,dict,object): String CIK, or object with cik and accession attributes or keys.
+        accession (str): String ACCESSION number, or None if accession in CIK object.
+
+    Returns:
+        list: Dictionaries of {'sequence', 'description', 'filename', 'type', 'size', 'url'}, in the index page's
+            order. 'sequence' and 'size' are ints (or None if blank), and 'url' is under `EDGAR_ROOT`.
+
+    Raises:
+        FileNotFoundError: If EDGAR has no index page for the filing.
+    """
+    _obj = utilities.get_cik_acc(cik, accession=accession)
+    cik, accession = _obj.get("cik", None), _obj.get("accession", None)
+    _, index_url = get_edgar_urls(cik, accession=accession)
+
+    r = get_from_edgar(index_url)
+    if r.status_code != 200:
+        raise FileNotFoundError("Error {} getting filing index {}".format(r.status_code, index_url))
+
+    def _int(text):
+        return int(text) if text.isdigit() else None
+
+    documents = []
+    for row in row_re.findall(r.text):
+        cells = cell_re.findall(row)
+        if len(cells) < 5:
+            continue
+
+        href = href_re.search(cells[2])
+        if href is None:
+            continue
+        # Inline XBRL documents link to the viewer: /ix?doc=/Archives/edgar/data/...
+        filename = html.unescape(href.group(1)).rsplit("/", 1)[-1]
+        if filename == "{}.txt".format(accession):
+            # The complete submission text file
+            continue
+
+        text = [html.unescape(tag_re.sub(" ", cell)).split() for cell in cells[:5]]
+        documents.append(
+            {
+                "sequence": _int("".join(text[0])),
+                "description": " ".join(text[1]),
+                "filename": filename,
+                "type": " ".join(text[3]),
+                "size": _int("".join(text[4])),
+                "url": "{}/edgar/data/{}/{}/{}".format(EDGAR_ROOT, cik, accession.replace("-", ""), filename),
+            }
+        )
+
+    return documents
+
+
+def download_document_from_web(cik, accession=None, sequence=None, doc_type=None, filename=None, decode=True):
+    """
+    Download a single document of a filing (e.g. just the main 10-K, or one exhibit), instead of the complete
+    submission text file with every exhibit, graphic and XBRL file (see `download_form_from_web`).
+
+    The document is the first in the filing's index (see `get_filing_documents`) matching all of `sequence`,
+    `doc_type` and `filename` that are given. With none given, it is the first document, i.e. the main form.
+
+    Examples:
+        Download the text of a 10-K, and its subsidiaries exhibit::
+
+            text = download_document_from_web(320193, '0000320193-19-000119')
+            ex21 = download_document_from_web(320193, '0000320193-19-000119', doc_type='EX-21.1')
+
+    Arguments:
+        cik (str,dict,object): String CIK, or object with cik and accession attributes or keys.
+        accession (str): String ACCESSION number, or None if accession in CIK object.
+        sequence (int, None): Sequence number of the document in the filing (1 is the main form).
+        doc_type (str, None): Type of the document, e.g. '10-K' or 'EX-21.1' (case insensitive).
+        filename (str, None): File name of the document, e.g. 'a10-k20199282019.htm'.
+        decode (bool): Flag for whether to decode the document to text, or return bytes (e.g. for graphics).
+            Default: True
+
+    Returns:
+        str, bytes: The document's text (or bytes if not `decode`).
+
+    Raises:
+        FileNotFoundError: If the filing has no such document, or it couldn't be downloaded.
+    """
+    documents = get_filing_documents(cik, accession=accession)
+
+    for doc in documents:
+        if sequence is not None and doc["sequence"] != int(sequence):
+            continue
+        if doc_type is not None and doc["type"].upper() != doc_type.upper():
+            continue
+        if filename is not None and doc["filename"] != filename:
+            continue
+        break
+    else:
+        available = [(d["sequence"], d["type"], d["filename"]) for d in documents]
+        raise FileNotFoundError(
+            "No document (sequence={}, type={}, filename={}) in {}/{}, which has: {}".format(
+                sequence, doc_type, filename, cik, accession, available
+            )
+        )
+
+    r = get_from_edgar(doc["url"])
+    if r.status_code != 200:
+        raise FileNotFoundError("Error {} downloading {}".format(r.status_code, doc["url"]))
+
+    return _decode(r.content) if decode else r.content
+
+
+def open_feed_stream(date):
+    """
+    Open the daily feed compressed file on `date` from EDGAR as a stream, without saving it to disk.
+    Read it front to back (e.g. `tarfile.open(fileobj=stream, mode='r|gz')`), and close it when done.
+
+    Arguments:
+        date (datetime, str): Date of feed file to open. Can be datetime
+            or string (YYYYMMDD format with optional spacing).
+
+    Returns:
+        file object, None: Binary file object of the response body, or None if there is no feed on `date`.
+    """
+    date = utilities.parse_date_input(date)
+
+    if not utilities.is_business_day(date) or date in get_missing_feeds():
+        return None
+
+    url = get_feed_url(date)
+    _logger.debug("session.get(%r, stream=True)", url)
+
+    # Ask for identity encoding, so the body is the .tar.gz bytes and not re-encoded in transit.
+    response = get_from_edgar(url, headers={"Accept-Encoding": "identity"}, stream=True)
+    if response.status_code != 200:
+        _logger.info("No feed streamed for %s, status %d from %s", date, response.status_code, url)
+        response.close()
+        if response.status_code == 404:
+            _record_missing_feed(date, url)
+        return None
+
+    return response.raw
+
+
 def use_subprocess(process_list):
     """Call subprocess.run, but allow for backwards compatability with python <3.7 that doesn't have `capture_output`.
 
@@ -203,106 +549,312 @@ def download_from_edgar(
     edgar_url,
     local_path,
     overwrite=False,
-    use_requests=False,
-    chunk_size=10 * 1024 ** 2,
+    use_requests=True,
+    chunk_size=1024 ** 2,
     overwrite_size_threshold=-1,
     sleep_after=0,
     force_make_index_cache_directory=True,
+    revalidate=False,
+    report_changed=False,
 ):
     """
-    Generic downloader, uses curl by default unless use_requests=True is passed in.
+    Generic downloader, uses the shared `requests` session (see `get_from_edgar`) unless use_requests=False is passed in,
+    in which case a curl subprocess is run per file. Either way, downloads wait on the shared rate limiter.
+
+    Files are downloaded to `local_path` + '.part', and renamed to `local_path` once complete. Interrupted downloads
+    are resumed with HTTP Range requests (`curl -C -` with curl), including .part files left by earlier runs.
+
+    With requests, the ETag and Last-Modified of each download are kept in a sidecar file (`local_path` + '.http.json').
+    With `revalidate`, an existing file is checked with a conditional GET using them, and only downloaded again
+    if EDGAR's copy changed (or there are no stored validators).
 
     Arguments:
         edgar_url (str): URL of EDGAR resource.
         local_path (Path, str): Local path to write to
         overwrite (bool): Flag for whether to overwrite any existing file (default False).
-        use_requests (bool): Flag for whether to use requests or curl (default False == curl).
-        chunk_size (int): Size of chunks to write to disk while streaming from requests
+        use_requests (bool): Flag for whether to use requests or curl (default True == requests).
+        chunk_size (int): Size of chunks to write to disk while streaming from requests. A dropped connection
+            loses the chunk being read, which is then downloaded again on resuming. Default: 1MB
         overwrite_size_threshold (int): Existing files smaller than this will be re-downloaded.
         sleep_after (int): Number of seconds to sleep after downloading file (default 0)
+        revalidate (bool): Flag for whether to check an existing file is still current with a conditional GET,
+            instead of skipping it. With curl the file is downloaded again (default False).
+        report_changed (bool): Flag for whether to also return if the file was (re)written, i.e. downloaded
+            (200) rather than skipped or unchanged on EDGAR (304) (default False).
 
     Returns:
-        (str, None): Returns path of downloaded file (or None if download failed).
+        (str, None): Returns path of downloaded file (or None if download failed, or with requests,
+            if EDGAR answered 404 Not Found). With `report_changed`, a tuple of (that path, whether it changed).
     """
+    def _result(path, changed):
+        return (path, changed) if report_changed else path
+
     if not os.path.exists(os.path.dirname(local_path)):
         if force_make_index_cache_directory:
-            os.makedirs(os.path.dirname(local_path))
+            # exist_ok, because concurrent downloads may be making it at the same time.
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
         else:
             raise FileNotFoundError("Trying to write to non-existant directory: {}".format(os.path.dirname(local_path)))
 
+    conditional_headers = None
     if os.path.exists(local_path):
         loc_size = os.path.getsize(local_path)
         if not overwrite and loc_size > overwrite_size_threshold:
-            _logger.info("Skipping cache file (%s bytes) at %r", "{:,d}".format(loc_size), local_path)
-            return local_path
+            if not revalidate:
+                _logger.info("Skipping cache file (%s bytes) at %r", "{:,d}".format(loc_size), local_path)
+                return _result(local_path, False)
+            # Without stored validators (or with curl) this is an unconditional GET, i.e. the file is downloaded again.
+            conditional_headers = _get_conditional_headers(edgar_url, local_path) if use_requests else {}
+            _logger.info("Revalidating cache file (%s bytes) at %r: %r", "{:,d}".format(loc_size), local_path,
+                         conditional_headers)
+        else:
+            # The existing file is replaced once the download completes.
+            _logger.warning("Replacing existing file (%s bytes) at %r", "{:,d}".format(loc_size), local_path)
 
-        _logger.warning("Removing existing file (%s bytes) at %r", "{:,d}".format(loc_size), local_path)
-        os.remove(local_path)
+    # Download to a .part file, renamed into place once complete, so partial downloads are never cache files.
+    # A .part file left by an interrupted download is resumed, unless overwriting.
+    part_path = "{}.part".format(local_path)
+    if overwrite and os.path.exists(part_path):
+        os.remove(part_path)
 
     _useragent = REQUEST_HEADERS["User-Agent"]
 
     if not use_requests:
-        _logger.debug('curl -A "%s" %s -o %s', _useragent, edgar_url, local_path)
-        subp = use_subprocess(["curl", '-A "{}"'.format(_useragent), edgar_url, "-o", local_path])
+        _logger.debug('curl -A "%s" -C - %s -o %s', _useragent, edgar_url, part_path)
+        if transport.is_rate_limited(edgar_url):
+            ratelimit.get_rate_limiter().acquire()
+        subp = use_subprocess(["curl", '-A "{}"'.format(_useragent), "-C", "-", edgar_url, "-o", part_path])
         _logger.debug(subp.stdout)
         sleep(sleep_after)
         if subp.returncode != 0:
             raise Exception("Error {} downloading with curl: {}".format(subp.returncode, subp.stderr))
+        validators = {}
     else:
-        _logger.debug("requests.get(%r, headers=%r) >> %r", edgar_url, REQUEST_HEADERS, local_path)
+        _logger.debug("session.get(%r) >> %r", edgar_url, part_path)
         try:
-            with requests.get(edgar_url, headers=REQUEST_HEADERS, stream=True) as response:
-                expected_len = int(response.headers["content-length"])
-                with open(local_path, "wb") as fh:
+            validators = _download_resumable(edgar_url, part_path, chunk_size=chunk_size, headers=conditional_headers)
+        except FileNotFoundError:
+            # Don't save EDGAR's error page as the file.
+            _logger.info("Not found on EDGAR: %r", edgar_url)
+            return _result(None, False)
+        finally:
+            sleep(sleep_after)
+
+        if validators is None:
+            _logger.info("Cache file unchanged on EDGAR: %r", local_path)
+            # Mark when the file was last confirmed current (see `last_checked`).
+            os.utime(_validators_path(local_path))
+            return _result(local_path, False)
+
+    if os.path.exists(part_path):
+        os.replace(part_path, local_path)
+        _write_validators(edgar_url, local_path, validators)
+        _logger.info("Done downloading %.3f MB to %s", os.path.getsize(local_path) / 1024 ** 2, local_path)
+        return _result(local_path, True)
+    return _result(None, False)
+
+
+def _content_range_total(response):
+    """Total size from the Content-Range header (bytes START-END/TOTAL or bytes */TOTAL), or None."""
+    match = re.search(r"/(\d+)\s*$", response.headers.get("content-range", ""))
+    return int(match.group(1)) if match else None
+
+
+def _validators_path(local_path):
+    """Path of the sidecar file holding the HTTP validators (ETag, Last-Modified) of the download at `local_path`."""
+    return "{}.http.json".format(local_path)
+
+
+def last_checked(local_path):
+    """
+    Return when the file at `local_path` was last downloaded or confirmed current by `download_from_edgar`
+    with `revalidate`, as a timestamp, or None if it doesn't exist.
+    """
+    if not os.path.exists(local_path):
+        return None
+    return max(os.path.getmtime(p) for p in (local_path, _validators_path(local_path)) if os.path.exists(p))
+
+
+def _get_conditional_headers(edgar_url, local_path):
+    """
+    Conditional GET headers (If-None-Match, If-Modified-Since) from the stored validators of `local_path`,
+    or {} if there are none, or they are for another URL or another version of the file.
+    """
+    try:
+        with open(_validators_path(local_path)) as fh:
+            validators = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+    if validators.get("url") != edgar_url or validators.get("size") != os.path.getsize(local_path):
+        return {}
+
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _write_validators(edgar_url, local_path, validators):
+    """Store `validators` of the download at `local_path` in its sidecar file, or remove it if there are none."""
+    sidecar = _validators_path(local_path)
+
+    if not validators:
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
+        return
+
+    with open(sidecar, "w") as fh:
+        json.dump(dict(validators, url=edgar_url, size=os.path.getsize(local_path)), fh)
+
+
+def _download_resumable(edgar_url, part_path, chunk_size=1024 ** 2, max_attempts=RESUME_ATTEMPTS, headers=None):
+    """
+    Download `edgar_url` to `part_path` with requests. Dropped connections are resumed where they left off
+    with HTTP Range requests, up to `max_attempts` times, as is an existing `part_path` from an earlier run.
+    The downloaded size is verified against the expected size (from content-length or Content-Range).
+
+    `headers` (e.g. conditional GET headers) are sent with requests for the whole file, not when resuming.
+
+    Returns:
+        dict, None: The response's validators ('etag', 'last_modified', if sent), or None if `headers`
+            made it a conditional GET and EDGAR answered 304 Not Modified.
+
+    Raises:
+        FileNotFoundError: If EDGAR answered 404 Not Found. Nothing is written.
+        Exception: If EDGAR answered anything but 200 (or 206 to a resume), in which case nothing is written,
+            or if the download is still incomplete after `max_attempts`. `part_path` is left for resuming.
+    """
+    validators = {}
+
+    for attempt in range(1, max_attempts + 1):
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        # Byte ranges are of the identity encoding, so resume without transfer encoding.
+        range_headers = {"Range": "bytes={:d}-".format(offset), "Accept-Encoding": "identity"}
+
+        expected_len = None
+        try:
+            with get_from_edgar(edgar_url, headers=range_headers if offset else headers, stream=True) as response:
+                if not offset and response.status_code == 304:
+                    return None
+
+                if response.status_code == 404:
+                    raise FileNotFoundError("Not found on EDGAR: {}".format(edgar_url))
+
+                if response.status_code in (200, 206):
+                    validators = {
+                        k: response.headers[h]
+                        for k, h in (("etag", "etag"), ("last_modified", "last-modified"))
+                        if h in response.headers
+                    }
+
+                if offset and response.status_code == 416:
+                    # Range starts at (or past) the end: either already complete, or the remote file changed.
+                    if _content_range_total(response) == offset:
+                        return validators
+                    _logger.warning("Can't resume %r from %s bytes, restarting", part_path, "{:,d}".format(offset))
+                    os.remove(part_path)
+                    continue
+
+                if response.status_code != 200 and not (offset and response.status_code == 206):
+                    # E.g. 403 after the rate limit retries, 500, or 206 to a request without a Range.
+                    # Never write it, or the error page would become a valid looking cache file.
+                    raise requests.exceptions.HTTPError(
+                        "EDGAR answered {} for {}".format(response.status_code, edgar_url), response=response
+                    )
+
+                if offset and response.status_code == 206:
+                    _logger.info("Resuming %r from %s bytes", part_path, "{:,d}".format(offset))
+                    mode = "ab"
+                    expected_len = _content_range_total(response)
+                else:
+                    # Full response (no range asked for, or the server ignored it)
+                    mode = "wb"
+                    # content-length is the encoded size, so only comparable to the written size without transfer encoding.
+                    if not response.headers.get("content-encoding") and "content-length" in response.headers:
+                        expected_len = int(response.headers["content-length"])
+
+                with open(part_path, mode) as fh:
                     for chunk in response.iter_content(chunk_size=chunk_size):
                         if chunk:  # filter out keep-alive new chunks
                             fh.write(chunk)
-            sleep(sleep_after)
+        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as excp:
+            _logger.warning("Download of %r interrupted (attempt %d/%d): %r", edgar_url, attempt, max_attempts, excp)
+            continue
+        except FileNotFoundError:
+            raise
         except Exception as excp:
             raise Exception("Error downloading with requests: {}".format(excp)) from excp
 
         # Now check what we downloaded was what we expected
-        try:
-            loc_size = os.path.getsize(local_path)
-        except FileNotFoundError:
-            raise Exception("Error downloading with requests to: {}".format(local_path))
-        if expected_len != loc_size:
-            _logger.exception("requests downloaded {:,d} bytes but expected {:,d}".format(loc_size, expected_len))
+        loc_size = os.path.getsize(part_path)
+        if expected_len is None or loc_size == expected_len:
+            return validators
+        _logger.warning(
+            "Downloaded %s of %s bytes of %r (attempt %d/%d)",
+            "{:,d}".format(loc_size), "{:,d}".format(expected_len), edgar_url, attempt, max_attempts,
+        )
 
-    if os.path.exists(local_path):
-        _logger.info("Done downloading %.3f MB to %s", os.path.getsize(local_path) / 1024 ** 2, local_path)
-        return local_path
-    return None
+    raise Exception("Error downloading with requests, incomplete after {} attempts: {}".format(max_attempts, part_path))
+
+
+def get_missing_feeds():
+    """Record of dates without a feed file at the current `EDGAR_ROOT` (see `manifest.MissingFeeds`)."""
+    return manifest.MissingFeeds(root=EDGAR_ROOT)
+
+
+def _record_missing_feed(date, url=None):
+    """
+    Record that `EDGAR_ROOT` has no feed file on `date`, unless it is recent enough that the feed may not
+    be published yet.
+    """
+    if (dt.date.today() - date).days <= NO_FEED_GRACE_DAYS:
+        return False
+    _logger.info("Recording no feed file on %s at %s", date, EDGAR_ROOT)
+    get_missing_feeds().record(date, feed_url=url)
+    return True
 
 
-def download_feed(date, overwrite=None, use_requests=False, overwrite_size_threshold=8 * 1024, sleep_after=0):
+def download_feed(date, overwrite=None, use_requests=True, overwrite_size_threshold=8 * 1024, sleep_after=0):
     """Download an edgar daily feed compressed file.
 
+    Days that aren't business days (weekends, federal holidays, see `utilities.is_business_day`) are skipped,
+    as are dates recorded as having no feed file at `EDGAR_ROOT` (see `get_missing_feeds`) unless `overwrite`.
+    When EDGAR has no feed file on a date, the date is recorded for `EDGAR_ROOT` so it isn't asked for again;
+    ``get_missing_feeds().forget(date)`` removes it.
+
     Args:
         date (datetime, str): Date of feed file to download. Can be datetime
             or string (YYYYMMDD format with optional spacing).
         overwrite (bool, None): Flag for whether to overwrite any existing file. 
             If None (default), uses config.CACHE_FEED_OVERWRITE setting.
-        use_requests (bool): Flag for whether to use requests or curl (default False == curl).
+        use_requests (bool): Flag for whether to use requests or curl (default True == requests).
         overwrite_size_threshold (int): Existing files smaller than this will be re-downloaded.
         sleep_after (int): Number of seconds to sleep after downloading file (default 0)
 
     Returns:
-        str: output file path
+        str, None: output file path, or None if there is no feed file on `date`.
     """
     date = utilities.parse_date_input(date)
 
-    if date.weekday() >= 5:  # skip sat/sun, because computers don't work weekends. Union rules, I think?
+    # Skip sat/sun and holidays, because computers don't work weekends. Union rules, I think?
+    if not utilities.is_business_day(date):
         return None
 
     # Use config value if overwrite is None
     if overwrite is None:
         overwrite = config.CACHE_FEED_OVERWRITE
 
+    if not overwrite and date in get_missing_feeds():
+        _logger.debug("Skipping %s, known to have no feed file", date)
+        return None
+
     feed_path = config.get_feed_cache_path(date)
     url = get_feed_url(date)
 
-    return download_from_edgar(
+    downloaded = download_from_edgar(
         url,
         feed_path,
         overwrite=overwrite,
@@ -311,9 +863,58 @@ def download_feed(date, overwrite=None, use_requests=False, overwrite_size_thres
         sleep_after=sleep_after,
     )
 
+    if downloaded is None and use_requests and _record_missing_feed(date, url):
+        # An error page saved by an earlier download isn't a feed file.
+        if os.path.exists(feed_path) and os.path.getsize(feed_path) <= overwrite_size_threshold:
+            os.remove(feed_path)
+
+    return downloaded
+
+
+def download_concurrently(jobs, workers=DOWNLOAD_WORKERS, download=None, progress=None, **kwargs):
+    """
+    Download many EDGAR resources with up to `workers` downloads at a time, all paced by the shared rate
+    limiter, so bulk downloads run as fast as EDGAR permits. Failed downloads are logged and left out.
+
+    Args:
+        jobs (iterable): Pairs of (EDGAR url, local path) to download, or tuples of arguments to `download`.
+        workers (int): Maximum number of concurrent downloads. Default: `DOWNLOAD_WORKERS`
+        download (callable, None): Function called as `download(*job, **kwargs)`, returning the downloaded path
+            or None. Default: `download_from_edgar`.
+        progress (callable, None): Wrapper of the iterator of finished downloads for progress monitoring,
+            called as `progress(iterator, total=len(jobs))`, e.g. `tqdm`. Default: None
+        kwargs: Passed to `download` (e.g. overwrite, use_requests, overwrite_size_threshold).
+
+    Returns:
+        list: Paths of the downloaded files, in the order of `jobs`.
+    """
+    jobs = list(jobs)
+    download = download or download_from_edgar
+
+    def _download(job):
+        try:
+            return download(*job, **kwargs)
+        except Exception as e:
+            _logger.exception("Error downloading %r: %r", job[0], e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs) or 1))) as pool:
+        futures = [pool.submit(_download, job) for job in jobs]
+        if progress is not None:
+            for _ in progress(as_completed(futures), total=len(futures)):
+                pass
+
+        return [_dl for _dl in (f.result() for f in futures) if _dl is not None]
+
 
 def download_feeds_recursively(
-    start_date, end_date=None, overwrite=False, use_requests=False, overwrite_size_threshold=8 * 1024, loop_sleep=1
+    start_date,
+    end_date=None,
+    overwrite=False,
+    use_requests=True,
+    overwrite_size_threshold=8 * 1024,
+    loop_sleep=0,
+    workers=DOWNLOAD_WORKERS,
 ):
     """Download edgar daily feed compressed files recursively from start to end.
     If `end_date` is `None`, default to today.
@@ -321,48 +922,50 @@ def download_feeds_recursively(
     thus set the overwrite_size_threshold to larger than that
     to automatically re-download those error files.
 
+    Downloads run concurrently (see `download_concurrently`), paced by the shared rate limiter.
+    Weekends, holidays and dates known to have no feed file are skipped without asking EDGAR (see `download_feed`).
+
     Args:
         start_date (datetime, str): Starting date of feeds to download. Can be datetime
             or string (YYYYMMDD format with optional spacing).
         end_date (None,datetime, str): Ending date of feeds to download (default today).
             Can be datetime or string (YYYYMMDD format with optional spacing).
         overwrite (bool): Flag for whether to overwrite any existing file (default False).
-        use_requests (bool): Flag for whether to use requests or curl (default False == curl).
+        use_requests (bool): Flag for whether to use requests or curl (default True == requests).
         overwrite_size_threshold (int): Existing files smaller than this will be re-downloaded.
-        loop_sleep (int): Number of seconds to wait each loop after downloading file (default 1).
+        loop_sleep (int): Number of seconds each download waits after downloading its file. The rate limiter
+            already paces requests (default 0).
+        workers (int): Maximum number of concurrent downloads (default `DOWNLOAD_WORKERS`).
 
     Returns:
-        tuple: output file path, return code
+        list: output file paths
     """
     start_date = utilities.parse_date_input(start_date)
     end_date = utilities.parse_date_input(end_date or dt.datetime.today())
-    loop_sleep = max(0.1, loop_sleep)
 
-    _dls = []
-    for i_date in utilities.iterate_dates(start_date, end_date, period="daily"):
-        try:
-            _dl = download_feed(
-                i_date,
-                overwrite=overwrite,
-                use_requests=use_requests,
-                overwrite_size_threshold=overwrite_size_threshold,
-                sleep_after=loop_sleep,
-            )
-            _dls.append(_dl)
-        except Exception as e:
-            _logger.exception("Error downloading %d-%d-%d: %r", i_date.year, i_date.month, i_date.day, e)
+    jobs = [(i_date,) for i_date in utilities.iterate_dates(start_date, end_date, period="daily", skip_holidays=True)]
 
-    return _dls
+    return download_concurrently(
+        jobs,
+        workers=workers,
+        download=download_feed,
+        overwrite=overwrite,
+        use_requests=use_requests,
+        overwrite_size_threshold=overwrite_size_threshold,
+        sleep_after=loop_sleep,
+    )
 
 
 def download_indexes_recursively(
     start_date,
     end_date=None,
     overwrite=False,
-    use_requests=False,
+    use_requests=True,
     overwrite_size_threshold=8 * 1024,
     compressed=True,
-    loop_sleep=1,
+    loop_sleep=0,
+    workers=DOWNLOAD_WORKERS,
+    revalidate=False,
 ):
     """Download edgar quarterly compressed filing index files recursively from start to end.
     If `end_date` is `None`, default to today.
@@ -370,40 +973,39 @@ def download_indexes_recursively(
     thus set the overwrite_size_threshold to larger than that
     to automatically re-download those error files.
 
+    Downloads run concurrently (see `download_concurrently`), paced by the shared rate limiter.
+
     Args:
         start_date (datetime, str): Starting date of feeds to download. Can be datetime
             or string (YYYYMMDD format with optional spacing).
         end_date (None,datetime, str): Ending date of feeds to download. Default to today.
             Can be datetime or string (YYYYMMDD format with optional spacing).
         overwrite (bool): Flag for whether to overwrite any existing file. Default False).
-        use_requests (bool): Flag for whether to use requests or curl. Default False == curl).
+        use_requests (bool): Flag for whether to use requests or curl. Default True == requests).
         overwrite_size_threshold (int): Existing files smaller than this will be re-downloaded. Default 8k.
         compressed (bool): Flag for whether compressed or uncompressed index files should be downloaded. Default True.
-        loop_sleep (int): Number of seconds to wait each loop after downloading file (default 1).
+        loop_sleep (int): Number of seconds each download waits after downloading its file. The rate limiter
+            already paces requests (default 0).
+        workers (int): Maximum number of concurrent downloads (default `DOWNLOAD_WORKERS`).
+        revalidate (bool): Flag for whether to check existing files are current with conditional GETs (default False).
 
     Returns:
-        tuple: output file path, return code
+        list: output file paths
     """
     start_date = utilities.parse_date_input(start_date)
     end_date = utilities.parse_date_input(end_date or dt.datetime.today())
-    loop_sleep = max(0.1, loop_sleep)
-
-    _dls = []
-    for i_date in utilities.iterate_dates(start_date, end_date, period="quarterly"):
-        edgar_url = get_index_url(i_date, compressed=compressed)
-        index_cache = config.get_index_cache_path(i_date)
 
-        try:
-            _dl = download_from_edgar(
-                edgar_url,
-                index_cache,
-                overwrite=overwrite,
-                use_requests=use_requests,
-                overwrite_size_threshold=overwrite_size_threshold,
-                sleep_after=loop_sleep,
-            )
-            _dls.append(_dl)
-        except Exception as e:
-            _logger.exception("Error downloading %r: %r", i_date, e)
+    jobs = [
+        (get_index_url(i_date, compressed=compressed), config.get_index_cache_path(i_date))
+        for i_date in utilities.iterate_dates(start_date, end_date, period="quarterly")
+    ]
 
-    return _dls
+    return download_concurrently(
+        jobs,
+        workers=workers,
+        overwrite=overwrite,
+        use_requests=use_requests,
+        overwrite_size_threshold=overwrite_size_threshold,
+        sleep_after=loop_sleep,
+        revalidate=revalidate,
+    )
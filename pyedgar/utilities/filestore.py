@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Reading and writing filings in the local filing store (under `config.FILING_ROOT`).
+
+Filings can be stored compressed by ending `FILING_PATH_FORMAT` with a compression suffix:
+
+* `.gz`: gzip, using the standard library.
+* `.zst`: zstandard, which requires the `zstandard` package.
+
+For example, ``FILING_PATH_FORMAT={accession[11:13]}/{accession}.nc.gz``.
+Compressed filings are (de)compressed as a stream, so reading the start of a filing
+only inflates the start of the file.
+
+Filings in pack files (``FILING_STORE=pack``, see `packstore`) have paths of the form
+``/FILING_ROOT/2019Q1.pack#OFFSET+LENGTH``, which are read with one seek and read.
+
+:copyright: © 2025 by Mac Gaulin
+:license: MIT, see LICENSE for more details.
+"""
+
+# Stdlib imports
+import io
+import os
+import gzip
+import logging
+import threading
+
+# 3rd party imports
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Module Imports
+from pyedgar.utilities import packstore
+
+# Local logger
+_logger = logging.getLogger(__name__)
+
+#: Filing path suffixes which mean the filing is stored compressed, and their compression.
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".zst": "zstd",
+}
+
+#: Compression level used when writing gzip compressed filings. 6 is the usual speed/size trade-off.
+GZIP_LEVEL = 6
+#: Compression level used when writing zstandard compressed filings.
+ZSTD_LEVEL = 10
+
+
+def get_compression(path):
+    """
+    Return the compression of the filing at `path` based on its suffix, or None if uncompressed.
+
+    Args:
+        path (str or Path): Path to the filing.
+
+    Returns:
+        str, None: 'gzip', 'zstd', or None.
+    """
+    path = str(path).lower()
+    for suffix, compression in COMPRESSION_SUFFIXES.items():
+        if path.endswith(suffix):
+            return compression
+    return None
+
+
+def filing_exists(path):
+    """
+    Check whether the filing at `path` exists, like `os.path.exists`, but understanding pack paths.
+    """
+    packed = packstore.split_pack_path(path)
+    if packed is not None:
+        return os.path.exists(packed[0])
+    return os.path.exists(path)
+
+
+def filing_size(path):
+    """
+    Return the size in bytes of the filing at `path` as stored (i.e. compressed size for compressed filings).
+    """
+    packed = packstore.split_pack_path(path)
+    if packed is not None:
+        return packed[2]
+    return os.stat(path).st_size
+
+
+def _open_zstd(path, mode):
+    """Open zstandard compressed file at `path` as a buffered binary stream for reading ('r') or writing ('w')."""
+    if zstandard is None:
+        raise ImportError("The zstandard package is required for .zst filings: pip install zstandard")
+
+    if mode == "r":
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True))
+
+    return io.BufferedWriter(
+        zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, "wb"), closefd=True)
+    )
+
+
+def open_filing(path, mode="r", encoding=None, errors=None, buffering=-1):
+    """
+    Open the filing at `path`, like `open`, transparently (de)compressing based on the path's suffix.
+    Pack paths (see `packstore`) can only be opened for reading.
+
+    Args:
+        path (str or Path): Path to the filing.
+        mode (str): 'r', 'w', 'rb' or 'wb'. Default: 'r'
+        encoding (str): Encoding for text modes, passed to `open` or `io.TextIOWrapper`.
+        errors (str): How to handle encoding errors for text modes.
+        buffering (int): Buffer size, only used for uncompressed filings. Default: -1 (system default)
+
+    Returns:
+        file object: Text or binary file object.
+    """
+    compression = get_compression(path)
+    binary = "b" in mode
+    rw = "w" if "w" in mode else "r"
+
+    packed = packstore.split_pack_path(path)
+    if packed is not None:
+        if rw == "w":
+            raise ValueError("Filings in pack files are written with packstore.PackStore.add, not opened: {}".format(path))
+        fh = io.BufferedReader(packstore.PackSlice(*packed))
+        if binary:
+            return fh
+        return io.TextIOWrapper(fh, encoding=encoding, errors=errors)
+
+    if compression is None:
+        if binary:
+            return open(path, rw + "b", buffering=buffering)
+        return open(path, rw, encoding=encoding, errors=errors, buffering=buffering)
+
+    if compression == "gzip":
+        fh = gzip.open(path, rw + "b", compresslevel=GZIP_LEVEL)
+    else:
+        fh = _open_zstd(path, rw)
+
+    if binary:
+        return fh
+    return io.TextIOWrapper(fh, encoding=encoding, errors=errors)
+
+
+def write_filing(path, data):
+    """
+    Write the filing bytes `data` to `path`, compressed based on the path's suffix, atomically: the filing is
+    written to a temporary file in the same directory and renamed into place, so `path` never holds part of a filing.
+
+    Args:
+        path (str or Path): Path to write the filing to. Not a pack path (see `packstore.PackStore.add`).
+        data (bytes): Filing bytes.
+
+    Returns:
+        str: `path`
+    """
+    directory, name = os.path.split(str(path))
+    # exist_ok, because other processes may be making it at the same time.
+    os.makedirs(directory, exist_ok=True)
+
+    # Ends in the filing's name, so it has the same compression suffix.
+    tmp_path = os.path.join(directory, ".tmp-{}-{}-{}".format(os.getpid(), threading.get_ident(), name))
+    try:
+        with open_filing(tmp_path, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return path
@@ -7,10 +7,10 @@ Utilities for interacting with edgar forms.
 """
 
 import re
-import os
 import logging
 
 # from . import plaintext
+from .filestore import open_filing, filing_exists, filing_size, get_compression
 from .htmlparse import convert_html_to_text
 from ..exceptions import WrongFormType, EDGARFilingFormatError
 
@@ -38,7 +38,8 @@ RE_HEADER_TAG_PLAINTEXT = re.compile(r"^(?P<indent>[ \t]*)(?P<key>[^\n\r:]+):[ \
 def get_full_filing(file_path, encoding=None, errors="ignore"):
     """
     Returns full text of filing.
-    Calls: `open(file_path, encoding=encoding or ENCODING_INPUT, errors=errors)`
+    Calls: `open_filing(file_path, encoding=encoding or ENCODING_INPUT, errors=errors)`,
+    which decompresses filings stored with a compression suffix (e.g. `.nc.gz`).
 
     Args:
         file_path (str or Path): path to the filing to be loaded.
@@ -51,10 +52,10 @@ def get_full_filing(file_path, encoding=None, errors="ignore"):
     Raises:
         FileNotFoundError: Raised if file doesn't exist.
     """
-    if not os.path.exists(file_path):
+    if not filing_exists(file_path):
         raise FileNotFoundError(f"File {file_path} does not exist.")
 
-    with open(file_path, encoding=encoding or ENCODING_INPUT, errors=errors or "ignore") as fh:
+    with open_filing(file_path, encoding=encoding or ENCODING_INPUT, errors=errors or "ignore") as fh:
         return fh.read()
 
 
@@ -78,10 +79,12 @@ def get_form_with_header(file_path, form_type=None, buff_size=(2 << 16) + 8, enc
         WrongFormType: Raised if form TYPE header doesn't match `form_type`
         EDGARFilingFormatError: Raised if filing is misformatted (no starting `<DOCUMENT>` tag)
     """
-    if not os.path.exists(file_path):
+    if not filing_exists(file_path):
         raise FileNotFoundError("File {} does not exist.".format(file_path))
 
-    with open(file_path, encoding=encoding or ENCODING_INPUT, errors=errors or "ignore", buffering=buff_size) as fh:
+    with open_filing(
+        file_path, encoding=encoding or ENCODING_INPUT, errors=errors or "ignore", buffering=buff_size
+    ) as fh:
         text = fh.read(buff_size)
 
         found_form = get_header(text, "TYPE")
@@ -136,6 +139,8 @@ def get_form(file_path, encoding=None, errors="ignore", chunk_size=1024 ** 2):
     Reads file at file_path and returns form between <TEXT> and </TEXT> tags.
     Default is to chunk the file being read, because sometimes 225MB files have
     only 1MB of text in the first document. So speed that up.
+    Compressed filings are decompressed as they are read, so chunking only inflates what it needs,
+    and they are always chunked (their stored size says little about how large they inflate to).
     Set chunk_size=None to disable chunking.
 
     Args:
@@ -152,13 +157,14 @@ def get_form(file_path, encoding=None, errors="ignore", chunk_size=1024 ** 2):
         FileNotFoundError: Raised if file doesn't exist.
         EDGARFilingFormatError: Raised if filing is misformatted (no starting `<DOCUMENT>` tag)
     """
-    if not os.path.exists(file_path):
+    if not filing_exists(file_path):
         raise FileNotFoundError("File {} does not exist.".format(file_path))
 
-    if chunk_size is not None and os.stat(file_path).st_size < 2 * chunk_size:
+    # Small uncompressed filings are read in one go
+    if chunk_size is not None and get_compression(file_path) is None and filing_size(file_path) < 2 * chunk_size:
         chunk_size = None
 
-    with open(file_path, encoding=encoding or ENCODING_INPUT, errors=errors, buffering=chunk_size or -1) as fh:
+    with open_filing(file_path, encoding=encoding or ENCODING_INPUT, errors=errors, buffering=chunk_size or -1) as fh:
         if chunk_size is None:
             text = fh.read()
         else:
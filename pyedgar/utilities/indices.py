@@ -9,11 +9,20 @@ Download and extract indices from EDGAR index files.
 
 # Stdlib imports
 import os
+import json
 import logging
+import datetime as dt
 
 # 3rd party imports
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401 (only needed by pandas, for Arrow strings and Parquet/Feather)
+
+    _STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    _STRING_DTYPE = "string"
+
 # Module Imports
 from pyedgar import config
 from pyedgar import utilities
@@ -29,6 +38,214 @@ except ImportError:
     tqdm = no_tqdm
 
 
+#: Name of the manifest (in `INDEX_ROOT`) of the quarter index files that went into each form index file
+INDEX_MANIFEST_NAME = "index_manifest.json"
+
+#: Index file extensions (`INDEX_EXTENSION`) written in a columnar format with typed columns, which needs pyarrow
+COLUMNAR_EXTENSIONS = ("parquet", "feather")
+
+#: Columns of the form index files, in order
+INDEX_COLUMNS = ("CIK", "Company Name", "Form Type", "Date Filed", "Accession")
+
+#: Column of the form index files holding the quarter index file each row came from (its manifest key),
+#: so incremental extraction replaces exactly the rows of the quarters that changed
+INDEX_QUARTER_COLUMN = "Index Quarter"
+
+#: Directory (in `INDEX_ROOT`) of the index partitions, at `partitions/{year}/{family}.{INDEX_EXTENSION}`
+PARTITIONS_DIR = "partitions"
+
+#: Form families the index partitions are split into (see `form_family`), the last one for all other forms
+FORM_FAMILIES = ("10-K", "10-Q", "8-K", "DEF14A", "345", "other")
+
+#: Manifest entry of the index partitions (not a valid form index name, so it can't clash with one)
+_PARTITIONS_ENTRY = PARTITIONS_DIR + "/"
+
+#: Rows per Parquet row group, small enough that row group statistics (CIK, date) can skip most of a partition
+PARQUET_ROW_GROUP_SIZE = 50000
+
+
+def form_family(form_type):
+    """
+    Form family (one of `FORM_FAMILIES`) of the form type `form_type`, which picks its index partition:
+    10-K, 10-Q, 8-K, DEF14A (proxy statements), 345 (insider forms 3, 4 and 5) or other.
+    Amendments are in the family of the form they amend.
+    """
+    form_type = str(form_type)
+    if form_type[:4] in ("10-K", "10KS"):
+        return "10-K"
+    if form_type[:4] in ("10-Q", "10QS"):
+        return "10-Q"
+    if form_type[:3] == "8-K":
+        return "8-K"
+    if form_type.endswith("14A"):
+        return "DEF14A"
+    if form_type.split("/")[0] in ("3", "4", "5"):
+        return "345"
+    return "other"
+
+
+def get_partition_root():
+    """Root directory of the index partitions."""
+    return os.path.join(config.INDEX_ROOT, PARTITIONS_DIR)
+
+
+def get_partition_path(year, family):
+    """Path of the index partition of form family `family` (see `FORM_FAMILIES`) in `year`."""
+    return os.path.join(get_partition_root(), str(year), "{}.{}".format(family, config.INDEX_EXTENSION))
+
+
+def load_index_manifest():
+    """
+    Load the manifest (in `INDEX_ROOT`) of which quarter index files, and which versions of them, are in each
+    form index file, as `{form: {'path': output path, 'forms': form types signature, 'quarters': {quarter: [size, mtime]}}}`.
+    The index partitions are under the `partitions/` entry. Missing or unreadable manifests are empty.
+    """
+    try:
+        with open(os.path.join(config.INDEX_ROOT, INDEX_MANIFEST_NAME), "r") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def partitions_current(index_manifest=None):
+    """
+    Check whether the index partitions are current: the manifest records them in the `INDEX_EXTENSION` format,
+    and from the same quarter index files as ``form_all`` (when there is one).
+
+    Args:
+        index_manifest (dict, None): Index manifest (see `load_index_manifest`). Default: load it from `INDEX_ROOT`.
+
+    Returns:
+        bool: Whether `EDGARIndex.query` can read the index partitions instead of ``form_all``.
+    """
+    if index_manifest is None:
+        index_manifest = load_index_manifest()
+
+    entry = index_manifest.get(_PARTITIONS_ENTRY)
+    if (
+        entry is None
+        or entry.get("path") != get_partition_root()
+        or entry.get("extension") != config.INDEX_EXTENSION
+        or not os.path.isdir(get_partition_root())
+    ):
+        return False
+
+    form_all = index_manifest.get("all")
+    return form_all is None or form_all.get("quarters") == entry.get("quarters")
+
+
+def is_columnar(index_path):
+    """Check whether the index file at `index_path` is in a columnar format (Parquet or Feather), by its extension."""
+    return index_path.lower().rsplit(".", 1)[-1] in COLUMNAR_EXTENSIONS
+
+
+#: Compact types of the form index columns (see `set_index_dtypes`)
+INDEX_DTYPES = {
+    "CIK": "int32",
+    "Company Name": "category",
+    "Form Type": "category",
+    "Date Filed": "datetime64[s]",
+    "Accession": _STRING_DTYPE,
+    INDEX_QUARTER_COLUMN: "category",
+}
+
+
+def set_index_dtypes(df):
+    """
+    Convert the columns of a form index DataFrame to their compact types (`INDEX_DTYPES`): int32 CIK,
+    categorical company name and form type, filing date to the second (which needs pandas 2.0), and accession
+    as a pandas string (always 20 characters), backed by Arrow when pyarrow is installed.
+    """
+    dtypes = {k: v for k, v in INDEX_DTYPES.items() if k in df.columns}
+    if "Date Filed" in dtypes:
+        df = df.assign(**{"Date Filed": pd.to_datetime(df["Date Filed"])})
+    return df.astype(dtypes)
+
+
+def memory_report(df):
+    """
+    Report the memory used by each column of the DataFrame `df` (counting the strings in object columns).
+
+    Returns:
+        DataFrame: Type, MB and bytes per row of each column, and their total.
+    """
+    nbytes = df.memory_usage(index=True, deep=True)
+    report = pd.DataFrame(
+        {
+            "dtype": [str(df[c].dtype) if c in df.columns else "index" for c in nbytes.index],
+            "MB": nbytes.values / 1024 ** 2,
+            "bytes_per_row": nbytes.values / max(len(df), 1),
+        },
+        index=nbytes.index,
+    )
+    report.loc["total"] = ["", report["MB"].sum(), report["bytes_per_row"].sum()]
+    return report
+
+
+def write_index(df, index_path):
+    """
+    Write the form index DataFrame `df` to `index_path`, in the format of its extension: Parquet or Feather
+    (see `COLUMNAR_EXTENSIONS`) with typed columns, or else delimited text (`INDEX_DELIMITER`, compressed if
+    the extension says so). Written atomically, so readers never see a partial file.
+    """
+    tmp_path = os.path.join(os.path.dirname(index_path), ".tmp-{}-{}".format(os.getpid(), os.path.basename(index_path)))
+    compression = "infer"
+    try:
+        if index_path.lower().endswith(".parquet"):
+            set_index_dtypes(df).to_parquet(tmp_path, index=False, row_group_size=PARQUET_ROW_GROUP_SIZE)
+        elif index_path.lower().endswith(".feather"):
+            set_index_dtypes(df).reset_index(drop=True).to_feather(tmp_path)
+        else:
+            # The temporary name hides the extension, so infer the compression from the real one.
+            compression = {"gz": "gzip", "bz2": "bz2", "xz": "xz", "zip": "zip", "zst": "zstd"}.get(
+                index_path.lower().rsplit(".", 1)[-1]
+            )
+            df.to_csv(tmp_path, sep=config.INDEX_DELIMITER, index=False, compression=compression)
+        os.replace(tmp_path, index_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def read_index(index_path, columns=None, sep=None, filters=None, keep_quarter=False):
+    """
+    Read a form index file, in the format of its extension (see `write_index`).
+
+    Args:
+        index_path (str): Path of the form index file.
+        columns (list, None): Columns to read (e.g. ['CIK', 'Accession']). Columnar files only read those
+            columns from disk. Default: all columns.
+        sep (str, None): Delimiter of delimited text files. Default: `config.INDEX_DELIMITER`.
+        filters (list, None): Parquet filters, e.g. ``[('CIK', 'in', [1750])]``, to skip the row groups
+            that can't match. Other formats read every row, so rows must still be filtered after reading.
+        keep_quarter (bool): Flag for whether to keep the `INDEX_QUARTER_COLUMN` bookkeeping column when reading
+            all columns (default False).
+
+    Returns:
+        DataFrame: Form index, with typed columns (see `set_index_dtypes`).
+    """
+    columns = list(columns) if columns is not None else None
+
+    if index_path.lower().endswith(".parquet"):
+        df = pd.read_parquet(index_path, columns=columns, filters=filters or None)
+    elif index_path.lower().endswith(".feather"):
+        df = pd.read_feather(index_path, columns=columns)
+    else:
+        sep = config.INDEX_DELIMITER if sep is None else sep
+        df = pd.read_csv(
+            index_path,
+            sep=sep,
+            usecols=columns,
+            dtype={"CIK": "int32", "Company Name": "category", "Form Type": "category", "Accession": str},
+            keep_default_na=False,
+        )
+
+    if columns is None and not keep_quarter and INDEX_QUARTER_COLUMN in df.columns:
+        del df[INDEX_QUARTER_COLUMN]
+
+    return set_index_dtypes(df)
+
+
 class IndexMaker:
     """
     Class that downloads EDGAR to your very own computer.
@@ -38,14 +255,14 @@ class IndexMaker:
 
     edgar_index_args = {"sep": "|", "encoding": "latin-1", "skiprows": [0, 1, 2, 3, 4, 5, 6, 7, 8, 10]}
 
-    _use_requests = False
+    _use_requests = True
     _tq = None
     _get_index_cache_path = None
 
     # May as well share this across instances (instead of setting in __init__)
     _logger = logging.getLogger(__name__)
 
-    def __init__(self, use_tqdm=False, use_requests=False):
+    def __init__(self, use_tqdm=False, use_requests=True):
         """
         Initialize the index making object.
 
@@ -57,93 +274,394 @@ class IndexMaker:
 
         self._tqdm = tqdm if use_tqdm else no_tqdm
 
-    def download_indexes(self, start_date=1995, end_date=None, overwrite=False):
+    def _needs_revalidation(self, i_date, idx_cache_file):
+        """
+        Check whether the cached index file for the quarter of `i_date` may be out of date: it was last downloaded
+        or revalidated before the quarter ended (plus a day for EDGAR to finish the index). Later ones are final.
+        """
+        checked = edgarweb.last_checked(idx_cache_file)
+        if checked is None:
+            return False
+
+        quarter = utilities.get_quarter(i_date)
+        next_quarter = dt.datetime(i_date.year + (quarter == 4), quarter % 4 * 3 + 1, 1)
+        return dt.datetime.fromtimestamp(checked) < next_quarter + dt.timedelta(days=1)
+
+    def download_indexes(self, start_date=1995, end_date=None, overwrite=False, revalidate=False):
         """Download multiple edgar quarterly index compressed files.
 
+        With `revalidate`, cached index files of quarters that hadn't ended when they were downloaded are checked
+        with a conditional GET (see `edgarweb.download_from_edgar`), and only downloaded again if EDGAR's changed.
+
         Args:
             start_date (int, datetime, None): Starting datetime (from which we'll extract year/quarter) or year. Default to 1995.
             end_date (int, datetime, None): Ending datetime (from which we'll extract year/quarter) or year. Default to today's year.
             overwrite (bool): Flag for whether to overwrite any existing file (default False).
+            revalidate (bool): Flag for whether to refresh index files that may be out of date (default False).
 
         Returns:
-            tuple: output file path, return code
+            list: Dates of the quarters whose index files were downloaded or changed.
         """
-        _num = len([0 for _ in utilities.iterate_dates(start_date, end_date, period="quarterly")])
+        quarters = list(utilities.iterate_dates(start_date, end_date, period="quarterly"))
 
-        # The download recursively works as it sounds, but we want progress bar, so do it date by date
-        for i_date in self._tqdm(
-            utilities.iterate_dates(start_date, end_date, period="quarterly"), total=_num, desc="Downloading Indices"
-        ):
-            edgarweb.download_indexes_recursively(
-                i_date, end_date=i_date, overwrite=overwrite, use_requests=self._use_requests
+        jobs = [
+            (
+                edgarweb.get_index_url(i_date),
+                self._get_index_cache_path(i_date),
+                revalidate and self._needs_revalidation(i_date, self._get_index_cache_path(i_date)),
+            )
+            for i_date in quarters
+        ]
+
+        def _download(edgar_url, local_path, revalidate_quarter):
+            return edgarweb.download_from_edgar(
+                edgar_url,
+                local_path,
+                overwrite=overwrite,
+                use_requests=self._use_requests,
+                overwrite_size_threshold=8 * 1024,
+                revalidate=revalidate_quarter,
+                report_changed=True,
+            )
+
+        # All quarters in one pool, paced by the shared rate limiter
+        self._logger.info("Downloading %d quarterly indices", len(jobs))
+        results = edgarweb.download_concurrently(
+            jobs,
+            download=_download,
+            progress=lambda finished, total: self._tqdm(finished, total=total, desc="Downloading Indices"),
+        )
+
+        # Downloaded (200), not skipped or unchanged on EDGAR (304)
+        changed_paths = {path for path, changed in results if changed}
+        changed = [i_date for i_date in quarters if self._get_index_cache_path(i_date) in changed_paths]
+
+        return changed
+
+    def _get_manifest_path(self):
+        """Path of the manifest of quarter index files in each form index file."""
+        return os.path.join(config.INDEX_ROOT, INDEX_MANIFEST_NAME)
+
+    def _load_manifest(self):
+        """Load the manifest of which quarter index files are in each form index file (see `load_index_manifest`)."""
+        return load_index_manifest()
+
+    def _save_manifest(self, index_manifest):
+        """Write the manifest atomically, so an interrupted extraction leaves the previous one."""
+        path = self._get_manifest_path()
+        tmp_path = "{}.tmp-{}".format(path, os.getpid())
+        with open(tmp_path, "w") as fh:
+            json.dump(index_manifest, fh, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _quarter_key(i_date):
+        """Manifest key of the quarter starting on `i_date`."""
+        return "{:%Y-%m-%d}".format(i_date)
+
+    @staticmethod
+    def _quarter_version(idx_cache_file):
+        """Version of a quarter index file, its [size, modification time], or None if it doesn't exist."""
+        try:
+            stat = os.stat(idx_cache_file)
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime]
+
+    @staticmethod
+    def _default_save_forms(all_forms):
+        """Default form index files and their form types, out of the form types `all_forms`."""
+        return {
+            "all": all_forms,
+            "10-K": [x for x in all_forms if x[:4] in ("10-K", "10KS")],
+            "10-Q": [x for x in all_forms if x[:4] in ("10-Q", "10QS")],
+            "DEF14A": [x for x in all_forms if x.endswith("14A")],
+            "8-K": ("8-K", "8-K/A"),
+        }
+
+    def _read_quarter(self, i_date):
+        """
+        Read the quarter index file of `i_date` into a DataFrame, or None if it is missing or unreadable.
+        Rows are tagged with the quarter (`INDEX_QUARTER_COLUMN`), whatever their filing date.
+        """
+        idx_cache_file = self._get_index_cache_path(i_date)
+
+        try:
+            self._logger.info("\tLoading index for %rQ%r", i_date.year, utilities.get_quarter(i_date))
+            dfi = pd.read_csv(idx_cache_file, **self.edgar_index_args)
+        except FileNotFoundError:
+            self._logger.warning(
+                "No Index cache file at %r (for %rQ%r)", idx_cache_file, i_date.year, utilities.get_quarter(i_date)
             )
+            return None
+        except Exception:
+            self._logger.warning(
+                "Reading %r failed at %rQ%r", idx_cache_file, i_date.year, utilities.get_quarter(i_date)
+            )
+            # File reading didn't work, try overwriting with new download
+            return None
+
+        dfi["Accession"] = dfi.Filename.str.slice(start=-24, stop=-4)
+        del dfi["Filename"]
+        dfi[INDEX_QUARTER_COLUMN] = self._quarter_key(i_date)
+
+        return dfi
+
+    @staticmethod
+    def _remove_partitions():
+        """
+        Delete the index partition files (in any index file format), and the year directories and partitions
+        directory they leave empty. Nothing else is deleted.
+        """
+        root = get_partition_root()
+        if not os.path.isdir(root):
+            return
+
+        names = {
+            "{}.{}".format(family, ext)
+            for family in FORM_FAMILIES
+            for ext in set(COLUMNAR_EXTENSIONS) | {"tab", "tab.gz", "csv", "csv.gz", config.INDEX_EXTENSION}
+        }
+        for year in (y for y in os.listdir(root) if y.isdigit()):
+            year_dir = os.path.join(root, year)
+            for name in os.listdir(year_dir):
+                if name in names:
+                    os.remove(os.path.join(year_dir, name))
+
+        for path in [os.path.join(root, y) for y in os.listdir(root) if y.isdigit()] + [root]:
+            try:
+                os.rmdir(path)
+            except OSError:
+                # Not empty, so it holds files that aren't ours
+                pass
+
+    def _write_partitions(self, df, df_quarters, stale):
+        """
+        Write the index partitions (see `get_partition_path`) of the index rows `df`.
 
-    def extract_indexes(self, start_date=1995, end_date=None, save_forms=None, download_first=True, overwrite=False):
+        Args:
+            df (DataFrame): Index rows of the parsed quarters.
+            df_quarters (Series): Quarters (manifest keys) of the quarter index files the rows of `df` came from.
+            stale (set, None): Quarters to replace in the existing partitions, or None to rebuild them all.
+        """
+        root = get_partition_root()
+        families = df["Form Type"].map({f: form_family(f) for f in df["Form Type"].unique()})
+        years = df["Date Filed"].dt.year
+
+        if stale is None:
+            self._logger.info("Saving index partitions to %r", root)
+            self._remove_partitions()
+            to_write = set(years.unique())
+        else:
+            self._logger.info("Merging %d quarters into the index partitions at %r", len(stale), root)
+            is_stale = df_quarters.isin(stale)
+            df, families, years = df[is_stale], families[is_stale], years[is_stale]
+            # Also the years the rows of the stale quarters may be in: partitions are by filing date, which can
+            # fall just outside the quarter of its index file.
+            to_write = set(years.unique()) | {int(k[:4]) + d for k in stale for d in (-1, 0, 1)}
+
+        for year in sorted(to_write):
+            for family in FORM_FAMILIES:
+                path = get_partition_path(year, family)
+                out_df = df[(years == year) & (families == family)]
+
+                if stale is not None and os.path.exists(path):
+                    existing = read_index(path, keep_quarter=True)
+                    existing = existing[~existing[INDEX_QUARTER_COLUMN].isin(stale)]
+                    out_df = pd.concat([existing, out_df], ignore_index=True)
+
+                if out_df.empty:
+                    if os.path.exists(path):
+                        os.remove(path)
+                    continue
+
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                write_index(out_df.sort_values(["CIK", "Date Filed"]), path)
+
+    def extract_indexes(
+        self,
+        start_date=1995,
+        end_date=None,
+        save_forms=None,
+        download_first=True,
+        overwrite=False,
+        revalidate=False,
+        partitioned=None,
+    ):
+        """
+        Extract the quarterly index files into form index files (`form_{form}.{INDEX_EXTENSION}` in `INDEX_ROOT`).
+
+        Extraction is incremental: a manifest in `INDEX_ROOT` records which quarter index files, and which versions
+        of them, went into each form index file. Only new or changed quarters (e.g. the current one after
+        downloading it again) are parsed, and merged into the existing form index files, replacing their
+        rows of those quarters. Quarters outside `start_date` to `end_date` are dropped. So form index files
+        have a column after `INDEX_COLUMNS`, `INDEX_QUARTER_COLUMN`, with the quarter each row came from
+        (dropped by `read_index`, but seen by other readers of the files).
+
+        Form index files are delimited text, or with ``INDEX_EXTENSION=parquet`` (or ``feather``) columnar files
+        with typed columns, which load much faster (see `write_index`).
+
+        With `partitioned`, the index is also written split by year and form family
+        (`partitions/{year}/{family}.{INDEX_EXTENSION}` in `INDEX_ROOT`, see `form_family`),
+        so `EDGARIndex.query` only reads the partitions a query can match. Without it, existing index
+        partitions are deleted, so they can't go out of date.
+
+        With `download_first` and `revalidate`, out of date index files are refreshed with conditional GETs
+        (see `download_indexes`).
+
+        Args:
+            start_date (int, datetime, None): Starting datetime or year. Default to 1995.
+            end_date (int, datetime, None): Ending datetime or year. Default to today's year.
+            save_forms (dict, None): Form index files to write, as {name: list of form types}. Default: all, 10-K, 10-Q, DEF14A and 8-K.
+            download_first (bool): Flag for whether to download the index files first (default True).
+            overwrite (bool): Flag for whether to overwrite any existing index file, and rebuild the form
+                index files from every quarter (default False).
+            revalidate (bool): Flag for whether to refresh index files that may be out of date (default False).
+            partitioned (bool, None): Flag for whether to also write the index partitions.
+                Default: `config.INDEX_PARTITIONED`.
+        """
+        if partitioned is None:
+            partitioned = config.INDEX_PARTITIONED
+
+        # Quarters downloaded again are re-extracted, even if their file's size and mtime look the same.
+        changed = set()
         if download_first:
             self._logger.info("Downloading the quarterly indices...")
-            self.download_indexes(start_date=start_date, end_date=end_date, overwrite=overwrite)
-            self._logger.info("Done downloading quarterly indices.")
+            changed = self.download_indexes(
+                start_date=start_date, end_date=end_date, overwrite=overwrite, revalidate=revalidate
+            )
+            self._logger.info("Done downloading quarterly indices. Changed: %r", changed)
+            changed = {self._quarter_key(i_date) for i_date in changed}
+
+        quarters = list(utilities.iterate_dates(start_date, to_date=end_date, period="quarterly"))
+        versions = {}
+        for i_date in quarters:
+            version = self._quarter_version(self._get_index_cache_path(i_date))
+            if version is not None:
+                versions[self._quarter_key(i_date)] = version
+
+        index_manifest = self._load_manifest()
+        if not partitioned and (_PARTITIONS_ENTRY in index_manifest or os.path.isdir(get_partition_root())):
+            self._logger.info("Deleting the index partitions at %r (not partitioned)", get_partition_root())
+            self._remove_partitions()
+            index_manifest.pop(_PARTITIONS_ENTRY, None)
+            self._save_manifest(index_manifest)
+
+        outputs = list(save_forms) if save_forms is not None else list(self._default_save_forms([]))
+        if partitioned:
+            outputs.append(_PARTITIONS_ENTRY)
+
+        # Quarters to (re)build in each form index file that is out of date, or None to build it from scratch.
+        plan, signatures = {}, {}
+        for form in outputs:
+            if form == _PARTITIONS_ENTRY:
+                outpath = get_partition_root()
+                signature = signatures[form] = list(FORM_FAMILIES)
+            else:
+                outpath = os.path.join(config.INDEX_ROOT, "form_{}.{}".format(form, config.INDEX_EXTENSION))
+                # Default form types are picked by rules from each quarter's form types, so the rules are the signature.
+                signature = signatures[form] = "default" if save_forms is None else sorted(map(str, save_forms[form]))
+            entry = index_manifest.get(form)
+
+            if (
+                overwrite
+                or entry is None
+                or entry["path"] != outpath
+                or entry["forms"] != signature
+                or entry.get("quarter_column") != INDEX_QUARTER_COLUMN
+                or (form == _PARTITIONS_ENTRY and entry.get("extension") != config.INDEX_EXTENSION)
+                or not os.path.exists(outpath)
+            ):
+                plan[form] = None
+                continue
 
-        df = []
+            recorded = entry["quarters"]
+            stale = (
+                {k for k, v in recorded.items() if versions.get(k) != v}
+                | (set(versions) - set(recorded))
+                | (changed & set(versions))
+            )
+            if stale:
+                plan[form] = stale
+
+        if not plan:
+            self._logger.info("No index files changed, form index files are current.")
+            return
 
-        _num = len([0 for _ in utilities.iterate_dates(start_date, end_date, period="quarterly")])
+        if any(stale is None for stale in plan.values()):
+            to_parse = set(versions)
+        else:
+            to_parse = set().union(*plan.values()) & set(versions)
+
+        df = []
 
         for i_date in self._tqdm(
-            utilities.iterate_dates(start_date, to_date=end_date, period="quarterly"),
-            total=_num,
+            [q for q in quarters if self._quarter_key(q) in to_parse],
+            total=len(to_parse),
             desc="Extracting Indices",
         ):
-            idx_cache_file = self._get_index_cache_path(i_date)
-
-            try:
-                self._logger.info("\tLoading index for %rQ%r", i_date.year, utilities.get_quarter(i_date))
-                dfi = pd.read_csv(idx_cache_file, **self.edgar_index_args)
-            except FileNotFoundError:
-                self._logger.warning(
-                    "No Index cache file at %r (for %rQ%r)", idx_cache_file, i_date.year, utilities.get_quarter(i_date)
-                )
-                continue
-            except Exception:
-                self._logger.warning(
-                    "Reading %r failed at %rQ%r", idx_cache_file, i_date.year, utilities.get_quarter(i_date)
-                )
-                # File reading didn't work, try overwriting with new download
+            dfi = self._read_quarter(i_date)
+            if dfi is None:
+                # Not recorded, so it is tried again next time.
+                versions.pop(self._quarter_key(i_date), None)
                 continue
 
-            dfi["Accession"] = dfi.Filename.str.slice(start=-24, stop=-4)
-            del dfi["Filename"]
-
             df.append(dfi)
 
-            self._logger.info("Added %r(%r) to list(%r)", idx_cache_file, len(dfi), len(df))
+            self._logger.info("Added %r(%r) to list(%r)", self._get_index_cache_path(i_date), len(dfi), len(df))
 
         # Solve Issue #8
-        if not df:
+        if not df and not versions:
             self._logger.warning("No indices found!")
             return None
 
-        df = pd.concat(df)
+        if df:
+            df = pd.concat(df, ignore_index=True)
+        else:
+            # Only quarters to drop
+            df = pd.DataFrame(columns=list(INDEX_COLUMNS) + [INDEX_QUARTER_COLUMN])
         df["Date Filed"] = pd.to_datetime(df["Date Filed"])
+        df_quarters = df[INDEX_QUARTER_COLUMN]
 
-        all_forms = df["Form Type"].unique()
         if save_forms is None:
-            save_forms = {
-                "all": all_forms,
-                "10-K": [x for x in all_forms if x[:4] in ("10-K", "10KS")],
-                "10-Q": [x for x in all_forms if x[:4] in ("10-Q", "10QS")],
-                "DEF14A": [x for x in all_forms if x.endswith("14A")],
-                "8-K": ("8-K", "8-K/A"),
-            }
+            save_forms = self._default_save_forms(df["Form Type"].unique())
+
+        for form, stale in self._tqdm(plan.items(), total=len(plan), desc="Exporting Indices"):
+            if form == _PARTITIONS_ENTRY:
+                self._write_partitions(df, df_quarters, stale)
+                index_manifest[form] = {
+                    "path": get_partition_root(),
+                    "forms": signatures[form],
+                    "extension": config.INDEX_EXTENSION,
+                    "quarter_column": INDEX_QUARTER_COLUMN,
+                    "quarters": versions,
+                }
+                self._save_manifest(index_manifest)
+                continue
 
-        for form, formlist in self._tqdm(save_forms.items(), total=len(save_forms), desc="Exporting Indices"):
+            formlist = save_forms[form]
             outpath = os.path.join(config.INDEX_ROOT, "form_{}.{}".format(form, config.INDEX_EXTENSION))
 
-            self._logger.info("Saving %r to %r", form, outpath)
+            is_form = df["Form Type"].isin(formlist)
+            if stale is None:
+                self._logger.info("Saving %r to %r", form, outpath)
+                out_df = df[is_form]
+            else:
+                self._logger.info("Merging %d quarters into %r at %r", len(stale), form, outpath)
+                existing = read_index(outpath, keep_quarter=True)
+                existing = existing[~existing[INDEX_QUARTER_COLUMN].isin(stale)]
+                out_df = pd.concat([existing, df[is_form & df_quarters.isin(stale)]], ignore_index=True)
+
             self._logger.debug("Saving %s to %s with form-types: %r", form, outpath, formlist)
 
-            (
-                df[df["Form Type"].isin(formlist)]
-                .sort_values(["CIK", "Date Filed"])
-                .to_csv(outpath, sep=config.INDEX_DELIMITER, index=False)
-            )
+            write_index(out_df.sort_values(["CIK", "Date Filed"]), outpath)
+
+            index_manifest[form] = {
+                "path": outpath,
+                "forms": signatures[form],
+                "quarter_column": INDEX_QUARTER_COLUMN,
+                "quarters": versions,
+            }
+            self._save_manifest(index_manifest)
+
         self._logger.info("Done extracting indices!")
@@ -10,6 +10,7 @@ import re
 import logging
 
 from pyedgar import config
+from pyedgar.utilities import packstore
 #  import FEED_ROOT, FEED_CACHE_ROOT, INDEX_ROOT, INDEX_CACHE_ROOT
 
 __logger = logging.getLogger(__name__)
@@ -25,6 +26,9 @@ def get_filing_path(*args, **kwargs):
     :param args: Tries to guess cik/accession in the args passed in. cik/accession passed in by kwargs overrides these args.
     :param kwargs: dictionary to be passed to config.format_filing_path.
 
+    If ``config.FILING_STORE`` is ``pack``, filings found in the pack index return their pack path
+    (see `packstore.format_pack_path`), which `filestore.open_filing` can read.
+
     :return: Full path to local filing document. Equal to ``join(FILING_ROOT, format_filing_path(**kwargs))``
     :rtype: string
     """
@@ -64,6 +68,12 @@ def get_filing_path(*args, **kwargs):
     if accession is not None:
         kwargs['accession'] = accession
 
+    if config.FILING_STORE == 'pack' and clean_ac:
+        # Not found in a pack falls back to the one file per filing path below
+        pack_path = packstore.get_pack_store().get_path(clean_ac)
+        if pack_path is not None:
+            return pack_path
+
     formatted_filename = config.format_filing_path(**kwargs)
 
     return os.path.join(config.FILING_ROOT, formatted_filename)
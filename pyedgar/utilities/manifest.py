@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+Manifest of daily feed files that have already been extracted, and of dates without a feed file.
+
+Each feed file is recorded by date with its size and modification time, the form type regex it was
+extracted with, where it was extracted to, and how many filings it had. Re-running an extraction can
+then skip unchanged feed files with one `os.stat` and one lookup, instead of opening and decompressing
+the whole tarball only to find every filing already exists.
+
+Dates EDGAR has no feed file for are recorded too, per EDGAR root (see `MissingFeeds`), so they aren't asked for again.
+
+The manifest is a SQLite database, by default at `FEED_CACHE_ROOT/extraction_manifest.sqlite`
+(see `FEED_MANIFEST_PATH` in the config file).
+
+:copyright: © 2025 by Mac Gaulin
+:license: MIT, see LICENSE for more details.
+"""
+
+# Stdlib imports
+import os
+import logging
+import sqlite3
+import datetime as dt
+from contextlib import contextmanager
+
+# Module Imports
+from pyedgar import config
+from pyedgar.utilities import filestore
+
+# Local logger
+_logger = logging.getLogger(__name__)
+
+
+class ExtractionManifest(object):
+    """
+    SQLite backed record of extracted feed files, keyed by feed date.
+
+    Only the path is stored on the object, and a connection is opened per call,
+    so the manifest can be pickled along with an `EDGARCacher` into worker processes.
+    """
+
+    #: Path to the SQLite manifest file
+    path = None
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS feeds (
+            feed_date TEXT PRIMARY KEY,
+            feed_path TEXT,
+            size INTEGER,
+            mtime REAL,
+            keep_regex TEXT,
+            target TEXT,
+            num_extracted INTEGER,
+            num_total INTEGER,
+            extracted_at TEXT
+        )
+    """
+
+    def __init__(self, path=None):
+        """
+        Initialize the manifest, creating the database if needed.
+
+        Args:
+            path (str, None): Path of the SQLite manifest file. Default: `config.FEED_MANIFEST_PATH`.
+        """
+        self.path = path or config.FEED_MANIFEST_PATH
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(self._schema)
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection to the manifest, committing and closing it on exit. Waits on other writers."""
+        conn = sqlite3.connect(self.path, timeout=60)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(feed_date):
+        """Manifest key (YYYY-MM-DD) of `feed_date`."""
+        return "{:%Y-%m-%d}".format(feed_date)
+
+    @staticmethod
+    def _target():
+        """
+        Where and how filings are extracted to: the store type (`FILING_STORE`), the compression of stored
+        filings and the path format, e.g. ``files:gzip:/root/{accession}.nc.gz`` or ``pack:none:/root``.
+        A change of any of them forces re-extraction.
+        """
+        if config.FILING_STORE == "pack":
+            # Pack files are uncompressed, and FILING_PATH_FORMAT isn't used
+            return "pack:none:{}".format(config.FILING_ROOT)
+
+        return "{}:{}:{}".format(
+            config.FILING_STORE,
+            filestore.get_compression(config.FILING_PATH_FORMAT) or "none",
+            os.path.join(config.FILING_ROOT, config.FILING_PATH_FORMAT),
+        )
+
+    def get(self, feed_date):
+        """
+        Return the manifest entry for `feed_date` as a dictionary, or None if it hasn't been extracted.
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM feeds WHERE feed_date = ?", (self._key(feed_date),)).fetchone()
+
+        return dict(row) if row is not None else None
+
+    def is_current(self, feed_date, feed_path, keep_regex=""):
+        """
+        Check whether the feed file at `feed_path` was already extracted, unchanged, with the same settings.
+
+        Args:
+            feed_date (date): Date of the feed file.
+            feed_path (str): Local path to the feed file.
+            keep_regex (str): Pattern of the form type regex used for extraction ('' for all forms).
+
+        Returns:
+            bool: True if the feed's size, modification time, `keep_regex` and filing path format all match.
+        """
+        entry = self.get(feed_date)
+        if entry is None:
+            return False
+
+        try:
+            stat = os.stat(feed_path)
+        except OSError:
+            return False
+
+        return (
+            entry["size"] == stat.st_size
+            and entry["mtime"] == stat.st_mtime
+            and entry["keep_regex"] == (keep_regex or "")
+            and entry["target"] == self._target()
+        )
+
+    def record(self, feed_date, feed_path, keep_regex="", num_extracted=0, num_total=0):
+        """
+        Record that the feed file at `feed_path` was extracted, replacing any existing entry for `feed_date`.
+        """
+        stat = os.stat(feed_path)
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO feeds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._key(feed_date),
+                    feed_path,
+                    stat.st_size,
+                    stat.st_mtime,
+                    keep_regex or "",
+                    self._target(),
+                    num_extracted,
+                    num_total,
+                    dt.datetime.now().isoformat(timespec="seconds"),
+                ),
+            )
+
+    def forget(self, feed_date):
+        """Remove `feed_date` from the manifest, so it will be extracted again."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM feeds WHERE feed_date = ?", (self._key(feed_date),))
+
+
+class MissingFeeds(object):
+    """
+    SQLite backed record of dates EDGAR has no daily feed file for (it answered 404 Not Found),
+    kept with the extraction manifest so downloads and extractions stop asking for them.
+
+    Dates are recorded per EDGAR root (`EDGAR_ROOT`), so a 404 from a partial mirror doesn't hide the
+    feed files of sec.gov or of another mirror. To ask for a date again, remove it with `forget`
+    (or all dates with `clear`), or download with ``overwrite=True``::
+
+        manifest.MissingFeeds(root=edgarweb.EDGAR_ROOT).forget(datetime.date(2020, 3, 16))
+
+    Holidays are skipped by the business day calendar (see `utilities.is_business_day`) without being
+    recorded here; this catches the days it doesn't know about.
+
+    Nothing is created until a date is recorded, so checking for missing feeds doesn't make a database.
+    """
+
+    #: Path to the SQLite file (the extraction manifest's)
+    path = None
+
+    #: EDGAR root (e.g. https://www.sec.gov/Archives) the dates are recorded for
+    root = None
+
+    # Rows of the earlier missing_feeds table weren't keyed by EDGAR root, so they are dropped
+    # (and those dates asked for once more).
+    _schema = """
+        DROP TABLE IF EXISTS missing_feeds;
+        CREATE TABLE IF NOT EXISTS missing_feed_dates (
+            edgar_root TEXT,
+            feed_date TEXT,
+            feed_url TEXT,
+            checked_at TEXT,
+            PRIMARY KEY (edgar_root, feed_date)
+        );
+    """
+
+    def __init__(self, path=None, root=None):
+        """
+        Initialize the missing feeds record. The database is only created when a date is recorded.
+
+        Args:
+            path (str, None): Path of the SQLite file. Default: `config.FEED_MANIFEST_PATH`.
+            root (str, None): EDGAR root the dates are recorded for. Default: `config.EDGAR_ROOT`.
+        """
+        self.path = path or config.FEED_MANIFEST_PATH
+        self.root = (root or config.EDGAR_ROOT).rstrip("/")
+
+    def _create(self):
+        """Create the database if needed."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript(self._schema)
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection to the database, committing and closing it on exit. Waits on other writers."""
+        conn = sqlite3.connect(self.path, timeout=60)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _select(self, query, params=()):
+        """Rows of `query` (on this EDGAR root's dates), or none if nothing has been recorded yet."""
+        if not os.path.exists(self.path):
+            return []
+
+        try:
+            with self._connect() as conn:
+                return conn.execute(query, (self.root,) + tuple(params)).fetchall()
+        except sqlite3.OperationalError:
+            # No missing_feed_dates table yet (the manifest exists, but nothing was recorded)
+            return []
+
+    @staticmethod
+    def _key(feed_date):
+        """Key (YYYY-MM-DD) of `feed_date`."""
+        return "{:%Y-%m-%d}".format(feed_date)
+
+    def __contains__(self, feed_date):
+        return bool(
+            self._select(
+                "SELECT 1 FROM missing_feed_dates WHERE edgar_root = ? AND feed_date = ?", (self._key(feed_date),)
+            )
+        )
+
+    def dates(self):
+        """Return the set of dates without a feed file, for filtering many dates with one query."""
+        rows = self._select("SELECT feed_date FROM missing_feed_dates WHERE edgar_root = ?")
+
+        return {dt.date.fromisoformat(row[0]) for row in rows}
+
+    def record(self, feed_date, feed_url=None):
+        """Record that EDGAR has no feed file on `feed_date` (at `feed_url`)."""
+        self._create()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO missing_feed_dates VALUES (?, ?, ?, ?)",
+                (self.root, self._key(feed_date), feed_url, dt.datetime.now().isoformat(timespec="seconds")),
+            )
+
+    def forget(self, feed_date):
+        """Remove `feed_date` from the record, so its feed file is asked for again."""
+        if self._select("SELECT 1 FROM missing_feed_dates WHERE edgar_root = ? LIMIT 1"):
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM missing_feed_dates WHERE edgar_root = ? AND feed_date = ?",
+                    (self.root, self._key(feed_date)),
+                )
+
+    def clear(self):
+        """Remove every date recorded for this EDGAR root, so their feed files are asked for again."""
+        if self._select("SELECT 1 FROM missing_feed_dates WHERE edgar_root = ? LIMIT 1"):
+            with self._connect() as conn:
+                conn.execute("DELETE FROM missing_feed_dates WHERE edgar_root = ?", (self.root,))
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Pack file storage backend for the local filing store.
+
+Instead of one file per filing under `FILING_ROOT`, filings are appended to one pack file per quarter
+(`FILING_ROOT/{year}Q{quarter}.pack`, by filing date), with a sidecar SQLite index mapping
+each accession to its pack file, byte offset and length (`FILING_ROOT/pack_index.sqlite`).
+Reading a filing is then one index lookup, one seek and one read.
+
+Select it with ``FILING_STORE=pack`` in the config file. `localstore.get_filing_path` then returns
+a pack path of the form ``/FILING_ROOT/2019Q1.pack#OFFSET+LENGTH``, which `filestore.open_filing`
+(and so all `forms` readers and `Filing`) know how to read.
+
+:copyright: © 2025 by Mac Gaulin
+:license: MIT, see LICENSE for more details.
+"""
+
+# Stdlib imports
+import io
+import os
+import re
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Module Imports
+from pyedgar import config
+from pyedgar import utilities
+
+# Local logger
+_logger = logging.getLogger(__name__)
+
+#: Matches pack paths of the form /path/to/2019Q1.pack#OFFSET+LENGTH
+PACK_PATH_RE = re.compile(r"^(?P<pack>.+\.pack)#(?P<offset>\d+)\+(?P<length>\d+)$")
+
+
+def split_pack_path(path):
+    """
+    Split a pack path into the pack file path, byte offset and length.
+
+    Args:
+        path (str or Path): Path to a filing, which may or may not be a pack path.
+
+    Returns:
+        tuple, None: (pack file path, offset, length), or None if `path` isn't a pack path.
+    """
+    match = PACK_PATH_RE.match(str(path))
+    if not match:
+        return None
+    return match.group("pack"), int(match.group("offset")), int(match.group("length"))
+
+
+def format_pack_path(pack_path, offset, length):
+    """Format the pack path of the filing at `offset` with `length` bytes in `pack_path`."""
+    return "{}#{:d}+{:d}".format(pack_path, offset, length)
+
+
+class PackSlice(io.RawIOBase):
+    """
+    Read-only raw file object over `length` bytes starting at `offset` in the file at `pack_path`.
+    Wrap in `io.BufferedReader` (and `io.TextIOWrapper` for text), as `filestore.open_filing` does.
+    """
+
+    def __init__(self, pack_path, offset, length):
+        super().__init__()
+        self._fh = open(pack_path, "rb")
+        self._fh.seek(offset)
+        self._remaining = length
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self._remaining)
+        if size <= 0:
+            return 0
+        n_read = self._fh.readinto(memoryview(buffer)[:size])
+        self._remaining -= n_read
+        return n_read
+
+    def readall(self):
+        # The whole filing in one read.
+        data = self._fh.read(self._remaining)
+        self._remaining -= len(data)
+        return data
+
+    def close(self):
+        if not self.closed:
+            self._fh.close()
+        super().close()
+
+
+class PackStore(object):
+    """
+    Store of filings appended to quarterly pack files, with an SQLite offset index.
+
+    Only paths are stored on the object (lookups keep a connection per thread, which isn't pickled),
+    so the store can be pickled along with an `EDGARCacher` into worker processes. Appends hold an exclusive
+    lock on the pack file, so several processes can add to the same pack.
+    """
+
+    #: Directory containing the pack files and index
+    root = None
+    #: Path to the SQLite offset index
+    index_path = None
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS filings (
+            accession TEXT PRIMARY KEY,
+            pack TEXT,
+            offset INTEGER,
+            length INTEGER
+        )
+    """
+
+    def __init__(self, root=None, create=True):
+        """
+        Initialize the pack store, creating the index if needed.
+
+        Args:
+            root (str, None): Directory of the pack files and index. Default: `config.FILING_ROOT`.
+            create (bool): Flag for whether to create the directory and index now. Without it, the store
+                is read only until the first `add` (default True).
+        """
+        self.root = root or config.FILING_ROOT
+        self.index_path = os.path.join(self.root, "pack_index.sqlite")
+        self._local = threading.local()
+        self._created = False
+
+        if create:
+            self._create()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _create(self):
+        """Create the directory and index, if they don't exist yet."""
+        if self._created:
+            return
+        os.makedirs(self.root, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(self._schema)
+        self._created = True
+
+    def _reader(self):
+        """
+        This thread's connection to the index for lookups, kept open between them, or None if there is no index.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if not os.path.exists(self.index_path):
+                # Don't create anything on a read
+                return None
+            conn = self._local.conn = sqlite3.connect(self.index_path, timeout=60)
+        return conn
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection to the index, committing and closing it on exit. Waits on other writers."""
+        conn = sqlite3.connect(self.index_path, timeout=60)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_pack_name(self, filing_date=None):
+        """
+        Name of the pack file for filings filed on `filing_date` (YYYYMMDD string or date): YYYYQN.pack.
+        Filings without a parseable date go in undated.pack.
+        """
+        if not filing_date:
+            return "undated.pack"
+        try:
+            filing_date = utilities.parse_date_input(filing_date)
+        except ValueError:
+            return "undated.pack"
+        return "{}Q{}.pack".format(filing_date.year, utilities.get_quarter(filing_date))
+
+    def lookup(self, accession):
+        """
+        Return where `accession` is stored, as (pack file path, offset, length), or None if it isn't.
+        """
+        conn = self._reader()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT pack, offset, length FROM filings WHERE accession = ?", (accession,)).fetchone()
+        except sqlite3.OperationalError:
+            # Index file just created by another process, without its table yet
+            return None
+
+        if row is None:
+            return None
+        return os.path.join(self.root, row[0]), row[1], row[2]
+
+    def get_path(self, accession):
+        """
+        Return the pack path of `accession` (see `format_pack_path`), or None if it isn't stored.
+        """
+        location = self.lookup(accession)
+        if location is None:
+            return None
+        return format_pack_path(*location)
+
+    def add(self, accession, chunks, filing_date=None, overwrite=False):
+        """
+        Append the filing `accession` to its quarter's pack file and index it.
+        If `overwrite`, an already stored filing is re-appended and the index points to the new copy.
+
+        Args:
+            accession (str): Accession of the filing (20 character format with dashes).
+            chunks (bytes, iterable): Filing bytes, or an iterable of bytes chunks written in turn.
+            filing_date (str, date, None): Filing date, used to pick the quarter's pack file.
+            overwrite (bool): Flag for whether to replace an already stored filing. Default: False.
+
+        Returns:
+            str, None: Pack path of the added filing, or None if it already existed and not `overwrite`.
+        """
+        self._create()
+
+        if isinstance(chunks, (bytes, bytearray)):
+            chunks = [chunks]
+
+        pack_name = self.get_pack_name(filing_date)
+        pack_path = os.path.join(self.root, pack_name)
+
+        # The check, append and index insert all hold the pack file's lock, so concurrent workers adding
+        # the same accession (which goes to the same pack) can't both append it.
+        with open(pack_path, "ab") as fh, utilities.lock_file(fh):
+            if not overwrite and self.lookup(accession) is not None:
+                return None
+
+            fh.seek(0, os.SEEK_END)
+            offset = fh.tell()
+            try:
+                for chunk in chunks:
+                    fh.write(chunk)
+                fh.flush()
+            except BaseException:
+                # Don't leave a partial filing in the pack
+                fh.truncate(offset)
+                raise
+            length = fh.tell() - offset
+
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO filings VALUES (?, ?, ?, ?)", (accession, pack_name, offset, length)
+                )
+
+        return format_pack_path(pack_path, offset, length)
+
+    def read(self, accession):
+        """
+        Return the bytes of the stored filing `accession`.
+
+        Raises:
+            FileNotFoundError: If `accession` isn't stored.
+        """
+        location = self.lookup(accession)
+        if location is None:
+            raise FileNotFoundError("Accession {} not found in pack index {}".format(accession, self.index_path))
+
+        with PackSlice(*location) as fh:
+            return fh.readall()
+
+
+_pack_store = None
+_pack_store_lock = threading.Lock()
+
+
+def get_pack_store():
+    """
+    Return the pack store of `config.FILING_ROOT` shared by all lookups in this process.
+    It is created lazily, and reading from it creates no directories or index.
+    """
+    global _pack_store
+
+    with _pack_store_lock:
+        if _pack_store is None or _pack_store.root != config.FILING_ROOT:
+            _pack_store = PackStore(create=False)
+        return _pack_store
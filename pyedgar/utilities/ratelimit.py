@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Rate limiting of requests to EDGAR, shared across threads and processes.
+
+The SEC allows around 10 requests per second per user agent, and blocks clients that go over.
+`RateLimiter` is a token bucket refilled at `RATE_LIMIT` tokens per second (see the config file),
+where each request takes one token. Its state lives in a small file guarded by an exclusive lock,
+so every thread and process on the machine draws from the same bucket.
+
+When EDGAR answers with 429 (Too Many Requests) or 403 (which it sends when the rate is exceeded),
+`RateLimiter.backoff` pauses all requests, in every process, for the Retry-After time or an
+exponentially growing wait.
+
+:copyright: © 2025 by Mac Gaulin
+:license: MIT, see LICENSE for more details.
+"""
+
+# Stdlib imports
+import os
+import time
+import struct
+import logging
+import threading
+
+# Module Imports
+from pyedgar import config
+from pyedgar import utilities
+
+# Local logger
+_logger = logging.getLogger(__name__)
+
+#: Layout of the shared state file: tokens in the bucket, time of last refill, time requests are paused until
+_STATE = struct.Struct("<ddd")
+
+
+class RateLimiter(object):
+    """
+    Token bucket rate limiter, shared across threads and (through a locked state file) across processes.
+
+    Only the state file path and settings are stored on the object, so it can be pickled into worker
+    processes, which then share the bucket.
+    """
+
+    #: Requests allowed per second
+    rate = None
+    #: Maximum number of tokens in the bucket, i.e. requests allowed in a burst
+    burst = None
+    #: Path of the shared state file
+    path = None
+
+    def __init__(self, rate=None, burst=None, path=None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate (float, None): Requests per second. Default: `config.RATE_LIMIT`.
+            burst (float, None): Requests allowed in a burst. Default: 1, i.e. requests evenly spaced at `rate`,
+                so no one second window ever has more than `rate` requests.
+            path (str, None): Path of the state file shared by all processes. Default: `config.RATE_LIMIT_PATH`.
+        """
+        self.rate = float(rate or config.RATE_LIMIT)
+        self.burst = float(burst or 1)
+        self.path = path or config.RATE_LIMIT_PATH
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _update(self, func):
+        """
+        Read the shared state, call `func(tokens, last, paused_until, now)`, which returns the new state
+        and a result, write the new state and return the result. Holds the thread and file locks throughout.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        with self._lock, open(self.path, "a+b") as fh, utilities.lock_file(fh):
+            fh.seek(0)
+            data = fh.read(_STATE.size)
+            now = time.time()
+            if len(data) == _STATE.size:
+                tokens, last, paused_until = _STATE.unpack(data)
+            else:
+                tokens, last, paused_until = self.burst, now, 0.0
+
+            (tokens, last, paused_until), result = func(tokens, last, paused_until, now)
+
+            fh.seek(0)
+            fh.truncate()
+            fh.write(_STATE.pack(tokens, last, paused_until))
+            # Flush before the lock is released, or another process could read the old state.
+            fh.flush()
+
+        return result
+
+    def _take(self, tokens, last, paused_until, now):
+        """Refill the bucket for the time since `last`, then take a token if one is there."""
+        tokens = min(self.burst, tokens + max(0.0, now - last) * self.rate)
+
+        if paused_until > now:
+            return (tokens, now, paused_until), paused_until - now
+        if tokens >= 1:
+            return (tokens - 1, now, paused_until), 0.0
+        return (tokens, now, paused_until), (1 - tokens) / self.rate
+
+    def acquire(self):
+        """
+        Block until a request is allowed, then take its token.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            wait = self._update(self._take)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def backoff(self, seconds):
+        """
+        Pause all requests (in every process sharing the state file) for `seconds`, and empty the bucket.
+        """
+        _logger.warning("Rate limited by EDGAR, pausing requests for %.1f seconds", seconds)
+
+        def _pause(tokens, last, paused_until, now):
+            return (0.0, now, max(paused_until, now + seconds)), None
+
+        self._update(_pause)
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+    Return the rate limiter shared by all downloads in this process, configured from the config file.
+    """
+    global _limiter
+
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
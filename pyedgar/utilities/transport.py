@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Transports for fetching EDGAR resources from the SEC or a mirror of its Archives.
+
+Where downloads come from is set by `EDGAR_ROOT` in the config file, and its scheme picks the transport:
+
+* ``https://www.sec.gov/Archives`` (default): the SEC, through a pooled `requests` session, rate limited to
+  `RATE_LIMIT` requests per second (see `ratelimit`).
+* ``http://`` or ``https://`` other hosts: an HTTP mirror (e.g. ``http://edgar-mirror.internal/Archives``).
+  Only the SEC's hosts (`RATE_LIMITED_HOSTS`) are rate limited, so mirrors are read as fast as the network allows.
+* ``file://``: a mirror on a local or network (e.g. NFS) file system, such as
+  ``file:///mnt/edgar/Archives``, read by `FileAdapter`. Paths under it match the SEC's
+  (e.g. ``edgar/Feed/2019/QTR1/20190102.nc.tar.gz``).
+
+Every transport is mounted on the shared session (see `edgarweb.get_session`), so all downloads work the same
+whichever is used: streaming, resuming with Range requests, and conditional GETs.
+
+:copyright: © 2025 by Mac Gaulin
+:license: MIT, see LICENSE for more details.
+"""
+
+# Stdlib imports
+import io
+import os
+import re
+import email.utils
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+# 3rd party imports
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+#: Hosts (and their subdomains) whose requests count toward the rate limit
+RATE_LIMITED_HOSTS = ("sec.gov",)
+
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)\s*$")
+
+
+def is_rate_limited(url):
+    """Check whether requests to `url` count toward the rate limit, i.e. whether it is on one of the SEC's hosts."""
+    host = (urlsplit(url).hostname or "").lower()
+    return any(host == h or host.endswith("." + h) for h in RATE_LIMITED_HOSTS)
+
+
+class _FileRange(io.RawIOBase):
+    """Read-only raw file object over `length` bytes starting at `offset` in the plain file at `path`."""
+
+    def __init__(self, path, offset, length):
+        super().__init__()
+        self._fh = open(path, "rb")
+        self._fh.seek(offset)
+        self._remaining = length
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self._remaining)
+        if size <= 0:
+            return 0
+        n_read = self._fh.readinto(memoryview(buffer)[:size])
+        self._remaining -= n_read
+        return n_read
+
+    def close(self):
+        if not self.closed:
+            self._fh.close()
+        super().close()
+
+
+class FileAdapter(BaseAdapter):
+    """
+    `requests` transport adapter serving ``file://`` URLs from the file system, answering like an HTTP server
+    would: 200 with the file, 404 if it doesn't exist, 206/416 for Range requests, and 304 for conditional
+    requests (If-None-Match, If-Modified-Since) when the file is unchanged.
+    """
+
+    @staticmethod
+    def _etag(stat):
+        """ETag of a file, from its size and modification time."""
+        return '"{:x}-{:x}"'.format(stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def _response(request, status_code, headers=None, raw=None):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = status_code
+        response.reason = {
+            200: "OK",
+            206: "Partial Content",
+            304: "Not Modified",
+            404: "Not Found",
+            405: "Method Not Allowed",
+            416: "Range Not Satisfiable",
+        }.get(status_code)
+        response.headers = CaseInsensitiveDict(headers or {})
+        response.raw = raw if raw is not None else io.BytesIO(b"")
+        return response
+
+    def _is_unchanged(self, request, stat, etag):
+        """Check the conditional headers of `request` against the file's ETag and modification time."""
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+
+        if_modified_since = request.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                return int(stat.st_mtime) <= email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+
+        return False
+
+    def send(self, request, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return self._response(request, 405)
+
+        path = url2pathname(urlsplit(request.url).path)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return self._response(request, 404)
+        if not os.path.isfile(path):
+            return self._response(request, 404)
+
+        etag = self._etag(stat)
+        headers = {
+            "ETag": etag,
+            "Last-Modified": email.utils.formatdate(stat.st_mtime, usegmt=True),
+            "Accept-Ranges": "bytes",
+        }
+
+        if self._is_unchanged(request, stat, etag):
+            return self._response(request, 304, headers)
+
+        size = stat.st_size
+        start, end, status_code = 0, size - 1, 200
+
+        match = _RANGE_RE.match(request.headers.get("Range", ""))
+        if match and any(match.groups()):
+            first, last = match.groups()
+            if not first:
+                # Suffix range: the last N bytes
+                start = max(0, size - int(last))
+            else:
+                start = int(first)
+                end = min(end, int(last)) if last else end
+            if start >= size or start > end:
+                headers["Content-Range"] = "bytes */{:d}".format(size)
+                return self._response(request, 416, headers)
+            status_code = 206
+            headers["Content-Range"] = "bytes {:d}-{:d}/{:d}".format(start, end, size)
+
+        length = end - start + 1 if size else 0
+        headers["Content-Length"] = str(length)
+
+        raw = None
+        if request.method == "GET":
+            raw = io.BufferedReader(_FileRange(path, start, length))
+        return self._response(request, status_code, headers, raw)
+
+    def close(self):
+        pass
+
+
+def mount_transports(session):
+    """Mount the non-HTTP transports (``file://``) on the `requests` session `session`."""
+    session.mount("file://", FileAdapter())
+    return session
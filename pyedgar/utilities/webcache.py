@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+Write-through disk cache of filings downloaded from the EDGAR website.
+
+Filings that are not in the local filing store are downloaded from EDGAR (see `Filing`'s `web_fallback`).
+With the web cache on, each downloaded filing is also written to `WEB_CACHE_ROOT`, and read from there
+the next time, so repeat analyses of the same filings run at disk instead of network speed::
+
+    from pyedgar import Filing
+    f = Filing(1750, '0001104659-06-026838', web_cache=True)
+
+Turn it on for every `Filing` with ``CACHE_WEB=True`` in the config file. Filings are written atomically,
+and the cache is bounded by `WEB_CACHE_MAX_MB`: when it grows past that, the least recently used filings
+are removed (reading a filing from the cache marks it as recently used).
+
+:copyright: © 2025 by Mac Gaulin
+:license: MIT, see LICENSE for more details.
+"""
+
+# Stdlib imports
+import os
+import logging
+import threading
+
+# Module Imports
+from pyedgar import config
+from pyedgar.utilities import filestore
+
+# Local logger
+_logger = logging.getLogger(__name__)
+
+#: Fraction of the maximum size the cache is trimmed to when it is full, so it isn't trimmed on every write.
+EVICT_TO = 0.9
+
+
+class WebCache(object):
+    """
+    Size bounded, least recently used disk cache of filings downloaded from EDGAR, keyed by accession.
+
+    Recency is the modification time of the cached file, which is bumped when the filing is read,
+    so the cache can be shared by several processes.
+    """
+
+    #: Root directory of the cached filings
+    root = None
+    #: Maximum size of the cache in bytes, or 0 for unbounded
+    max_size = None
+
+    def __init__(self, root=None, max_size=None):
+        """
+        Initialize the cache.
+
+        Args:
+            root (str, None): Root directory of the cache. Default: `config.WEB_CACHE_ROOT`.
+            max_size (int, None): Maximum size of the cache in bytes, 0 for unbounded.
+                Default: `config.WEB_CACHE_MAX_MB` megabytes.
+        """
+        self.root = root or config.WEB_CACHE_ROOT
+        self.max_size = int(config.WEB_CACHE_MAX_MB * 1024 ** 2) if max_size is None else int(max_size)
+        # Running total of the cache size, counted the first time it is needed
+        self._size = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get_path(self, accession):
+        """
+        Path of `accession` in the cache, at ``root/YY/ACCESSION.txt`` (YY the year of the accession).
+        """
+        return os.path.join(self.root, accession[11:13], "{}.txt".format(accession))
+
+    def read(self, accession):
+        """
+        Read `accession` from the cache, marking it as recently used.
+
+        Returns:
+            bytes, None: Filing bytes, or None if the filing isn't cached.
+        """
+        path = self.get_path(accession)
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+            os.utime(path)
+        except FileNotFoundError:
+            # Also if another process evicted it between the read and the touch, which is a miss anyway.
+            return None
+
+        _logger.debug("Web cache hit: %s", accession)
+        return data
+
+    def read_header(self, accession, doc_tag=b"<DOCUMENT>", chunk_size=64 * 1024, max_size=4 * 1024 ** 2):
+        """
+        Read `accession` from the cache only up to the first `doc_tag` (the end of the SGML header),
+        marking it as recently used.
+
+        Returns:
+            bytes, None: Filing bytes before `doc_tag` (or the first `max_size` bytes, if it isn't found),
+                or None if the filing isn't cached.
+        """
+        path = self.get_path(accession)
+        data = b""
+        try:
+            with open(path, "rb") as fh:
+                while len(data) < max_size:
+                    chunk = fh.read(chunk_size)
+                    if not chunk:
+                        break
+                    start = max(0, len(data) - len(doc_tag))
+                    data += chunk
+                    # The tag may straddle two chunks
+                    if doc_tag in data[start:]:
+                        break
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        _logger.debug("Web cache hit (header): %s", accession)
+        end = data.find(doc_tag)
+        return data[:end] if end >= 0 else data
+
+    def write(self, accession, data):
+        """
+        Write the filing bytes `data` of `accession` to the cache, then evict old filings if it is over size.
+
+        Returns:
+            str: Path of the cached filing.
+        """
+        path = self.get_path(accession)
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        filestore.write_filing(path, data)
+
+        with self._lock:
+            if self._size is not None:
+                # Replacing a cached filing only changes the size by the difference
+                self._size += len(data) - old_size
+
+        if self.max_size and self.size() > self.max_size:
+            self.evict()
+
+        return path
+
+    def _scan(self):
+        """Return [(mtime, size, path)] of the cached filings, oldest first."""
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.startswith(".tmp-"):
+                    # Being written by write_filing
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        return sorted(entries)
+
+    def size(self):
+        """
+        Return the size of the cache in bytes. Counted from disk the first time, then kept up to date
+        with this process' writes (and re-counted whenever filings are evicted).
+        """
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._scan())
+            return self._size
+
+    def evict(self, max_size=None):
+        """
+        Remove the least recently used filings until the cache is under `EVICT_TO` of `max_size`.
+
+        Args:
+            max_size (int, None): Size in bytes to trim the cache to. Default: `self.max_size`.
+
+        Returns:
+            int: Number of filings removed.
+        """
+        max_size = self.max_size if max_size is None else max_size
+        target = int(max_size * EVICT_TO)
+
+        with self._lock:
+            entries = self._scan()
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    # Another process evicted it first
+                    pass
+                total -= size
+                removed += 1
+
+            self._size = total
+
+        _logger.info("Evicted %d filings from the web cache, now %.1f MB", removed, total / 1024 ** 2)
+        return removed
+
+    def clear(self):
+        """Remove every filing from the cache."""
+        return self.evict(max_size=0)
+
+
+_web_cache = None
+_web_cache_lock = threading.Lock()
+
+
+def get_web_cache():
+    """
+    Return the web cache shared by all filings in this process, configured from the config file.
+    """
+    global _web_cache
+
+    with _web_cache_lock:
+        if _web_cache is None:
+            _web_cache = WebCache()
+        return _web_cache
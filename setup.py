@@ -57,9 +57,12 @@ setup(
     ],
     packages=find_packages(),
     include_package_data=True,
-    install_requires=['pandas', 'requests'],
+    install_requires=['pandas>=2.0', 'requests'],
     extras_require={
         'dev': ['bs4', 'tqdm'],
+        'zstd': ['zstandard'],
+        'isal': ['isal'],
+        'columnar': ['pyarrow'],
         # 'test': ['coverage'],
     },
 )